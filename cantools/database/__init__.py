@@ -73,10 +73,14 @@ def _load_file_cache(filename,
                      encoding,
                      frame_id_mask,
                      strict,
-                     cache_dir):
+                     cache_dir,
+                     metadata):
     with open(filename, 'rb') as fin:
         key = fin.read()
 
+    if metadata != 'full':
+        key = (key, metadata)
+
     cache = diskcache.Cache(cache_dir)
 
     try:
@@ -86,7 +90,8 @@ def _load_file_cache(filename,
             database = load(fin,
                             database_format,
                             frame_id_mask,
-                            strict)
+                            strict,
+                            metadata)
         cache[key] = database
 
         return database
@@ -97,7 +102,8 @@ def load_file(filename,
               encoding=None,
               frame_id_mask=None,
               strict=True,
-              cache_dir=None):
+              cache_dir=None,
+              metadata='full'):
     """Open, read and parse given database file and return a
     :class:`can.Database<.can.Database>` or
     :class:`diagnostics.Database<.diagnostics.Database>` object with
@@ -177,14 +183,16 @@ def load_file(filename,
             return load(fin,
                         database_format,
                         frame_id_mask,
-                        strict)
+                        strict,
+                        metadata)
     else:
         return _load_file_cache(filename,
                                 database_format,
                                 encoding,
                                 frame_id_mask,
                                 strict,
-                                cache_dir)
+                                cache_dir,
+                                metadata)
 
 
 def dump_file(database,
@@ -200,6 +208,9 @@ def dump_file(database,
     endings (``\\r\\n``). For other database formats the line ending
     depends on the operating system.
 
+    The file is written as it is formatted, one message at a time,
+    instead of formatting the whole file in memory first.
+
     >>> db = cantools.database.load_file('foo.dbc')
     >>> cantools.database.dump_file(db, 'bar.dbc')
 
@@ -210,25 +221,22 @@ def dump_file(database,
         encoding,
         filename)
 
-    newline = None
-
     if database_format == 'dbc':
-        output = database.as_dbc_string()
-        newline = ''
+        with fopen(filename, 'w', encoding=encoding, newline='') as fout:
+            database.dump_dbc(fout)
     elif database_format == 'kcd':
-        output = database.as_kcd_string()
+        with fopen(filename, 'w', encoding=encoding) as fout:
+            database.dump_kcd(fout)
     else:
         raise Error(
             "Unsupported output database format '{}'.".format(database_format))
 
-    with fopen(filename, 'w', encoding=encoding, newline=newline) as fout:
-        fout.write(output)
-
 
 def load(fp,
          database_format=None,
          frame_id_mask=None,
-         strict=True):
+         strict=True,
+         metadata='full'):
     """Read and parse given database file-like object and return a
     :class:`can.Database<.can.Database>` or
     :class:`diagnostics.Database<.diagnostics.Database>` object with
@@ -252,13 +260,15 @@ def load(fp,
     return load_string(fp.read(),
                        database_format,
                        frame_id_mask,
-                       strict)
+                       strict,
+                       metadata)
 
 
 def load_string(string,
                 database_format=None,
                 frame_id_mask=None,
-                strict=True):
+                strict=True,
+                metadata='full'):
     """Parse given database string and return a
     :class:`can.Database<.can.Database>` or
     :class:`diagnostics.Database<.diagnostics.Database>` object with
@@ -271,6 +281,13 @@ def load_string(string,
     See :class:`can.Database<.can.Database>` for a description of
     `strict`.
 
+    `metadata` is one of ``'full'``, ``'lazy'`` and ``'none'``, and
+    controls when comments, attributes and environment variables are
+    parsed. See :meth:`can.Database.add_dbc_string()
+    <.can.Database.add_dbc_string>` for details. Only the ``'dbc'``
+    database format supports lazy metadata, other formats are always
+    fully loaded.
+
     Raises an
     :class:`~cantools.database.UnsupportedDatabaseFormatError`
     exception if given string does not contain a supported database
@@ -288,6 +305,11 @@ def load_string(string,
             "expected database format 'arxml', 'dbc', 'kcd', 'sym', 'cdd' or "
             "None, but got '{}'".format(database_format))
 
+    if metadata not in ['full', 'lazy', 'none']:
+        raise ValueError(
+            "expected metadata 'full', 'lazy' or 'none', but got "
+            "'{}'".format(metadata))
+
     e_arxml = None
     e_dbc = None
     e_kcd = None
@@ -301,7 +323,7 @@ def load_string(string,
         if fmt == 'arxml':
             db.add_arxml_string(string)
         elif fmt == 'dbc':
-            db.add_dbc_string(string)
+            db.add_dbc_string(string, metadata)
         elif fmt == 'kcd':
             db.add_kcd_string(string)
         elif fmt == 'sym':
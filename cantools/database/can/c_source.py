@@ -3,6 +3,7 @@ import time
 from decimal import Decimal
 
 from ...version import __version__
+from ..errors import Error
 
 
 HEADER_FMT = '''\
@@ -273,6 +274,133 @@ all:
 
 '''
 
+DISPATCH_BENCHMARK_FMT = '''\
+/**
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2018-2019 Erik Moqvist
+ *
+ * Permission is hereby granted, free of charge, to any person
+ * obtaining a copy of this software and associated documentation
+ * files (the "Software"), to deal in the Software without
+ * restriction, including without limitation the rights to use, copy,
+ * modify, merge, publish, distribute, sublicense, and/or sell copies
+ * of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+/**
+ * This file was generated by cantools version {version} {date}.
+ */
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <time.h>
+
+#include "{header}"
+
+/* A standard frame id not in the database. */
+#define UNKNOWN_FRAME_ID {unknown_frame_id}
+
+struct frame_t {{
+    uint32_t frame_id;
+    bool is_extended_frame;
+}};
+
+static const struct frame_t frames[] = {{
+{frames}
+}};
+
+#define NUMBER_OF_FRAMES (sizeof(frames) / sizeof(frames[0]))
+
+static void print_result(const char *name_p,
+                         long iterations,
+                         clock_t start,
+                         long errors)
+{{
+    double elapsed;
+
+    elapsed = ((double)(clock() - start) / CLOCKS_PER_SEC);
+
+    printf("%s: %ld frames in %.3f s (%.1f ns per frame, %ld not unpacked).\\n",
+           name_p,
+           iterations,
+           elapsed,
+           1e9 * elapsed / (double)iterations,
+           errors);
+}}
+
+int main(int argc, const char *argv[])
+{{
+    struct {database_name}_message_t message;
+    const struct frame_t *frame_p;
+    uint8_t data[64];
+    long iterations;
+    long errors;
+    long i;
+    clock_t start;
+
+    iterations = 10000000;
+
+    if (argc == 2) {{
+        iterations = atol(argv[1]);
+    }}
+
+    memset(&data[0], 0, sizeof(data));
+
+    /* Lookup and unpack of frames in the database. */
+    errors = 0;
+    start = clock();
+
+    for (i = 0; i < iterations; i++) {{
+        frame_p = &frames[(size_t)i % NUMBER_OF_FRAMES];
+
+        if ({database_name}_unpack(&message,
+                                   frame_p->frame_id,
+                                   frame_p->is_extended_frame,
+                                   &data[0],
+                                   sizeof(data)) != 0) {{
+            errors++;
+        }}
+    }}
+
+    print_result("Dispatch and unpack", iterations, start, errors);
+
+    /* Lookup only, as the frame id is not in the database. */
+    errors = 0;
+    start = clock();
+
+    for (i = 0; i < iterations; i++) {{
+        if ({database_name}_unpack(&message,
+                                   UNKNOWN_FRAME_ID,
+                                   false,
+                                   &data[0],
+                                   sizeof(data)) != 0) {{
+            errors++;
+        }}
+    }}
+
+    print_result("Dispatch of unknown frame id", iterations, start, errors);
+
+    return (0);
+}}
+'''
+
 TEST_FMT = '''
 static void test_{name}(
     const uint8_t *packed_p,
@@ -437,6 +565,90 @@ static inline {var_type} unpack_right_shift_u{length}(
 }}
 '''
 
+PACK_HELPER_LITTLE_ENDIAN_FMT = '''\
+static inline void pack_little_endian_u{length}(
+    uint8_t *dst_p,
+    {var_type} value,
+    size_t size)
+{{
+    uint8_t buf[8];
+
+    buf[0] = (uint8_t)value;
+    buf[1] = (uint8_t)(value >> 8u);
+    buf[2] = (uint8_t)(value >> 16u);
+    buf[3] = (uint8_t)(value >> 24u);
+    buf[4] = (uint8_t)(value >> 32u);
+    buf[5] = (uint8_t)(value >> 40u);
+    buf[6] = (uint8_t)(value >> 48u);
+    buf[7] = (uint8_t)(value >> 56u);
+
+    memcpy(dst_p, &buf[0], size);
+}}
+'''
+
+PACK_HELPER_BIG_ENDIAN_FMT = '''\
+static inline void pack_big_endian_u{length}(
+    uint8_t *dst_p,
+    {var_type} value,
+    size_t size)
+{{
+    uint8_t buf[8];
+
+    buf[0] = (uint8_t)(value >> 56u);
+    buf[1] = (uint8_t)(value >> 48u);
+    buf[2] = (uint8_t)(value >> 40u);
+    buf[3] = (uint8_t)(value >> 32u);
+    buf[4] = (uint8_t)(value >> 24u);
+    buf[5] = (uint8_t)(value >> 16u);
+    buf[6] = (uint8_t)(value >> 8u);
+    buf[7] = (uint8_t)value;
+
+    memcpy(dst_p, &buf[0], size);
+}}
+'''
+
+UNPACK_HELPER_LITTLE_ENDIAN_FMT = '''\
+static inline {var_type} unpack_little_endian_u{length}(
+    const uint8_t *src_p,
+    size_t size)
+{{
+    uint8_t buf[8];
+
+    memset(&buf[0], 0, sizeof(buf));
+    memcpy(&buf[0], src_p, size);
+
+    return (({var_type})buf[0]
+            | (({var_type})buf[1] << 8u)
+            | (({var_type})buf[2] << 16u)
+            | (({var_type})buf[3] << 24u)
+            | (({var_type})buf[4] << 32u)
+            | (({var_type})buf[5] << 40u)
+            | (({var_type})buf[6] << 48u)
+            | (({var_type})buf[7] << 56u));
+}}
+'''
+
+UNPACK_HELPER_BIG_ENDIAN_FMT = '''\
+static inline {var_type} unpack_big_endian_u{length}(
+    const uint8_t *src_p,
+    size_t size)
+{{
+    uint8_t buf[8];
+
+    memset(&buf[0], 0, sizeof(buf));
+    memcpy(&buf[0], src_p, size);
+
+    return ((({var_type})buf[0] << 56u)
+            | (({var_type})buf[1] << 48u)
+            | (({var_type})buf[2] << 40u)
+            | (({var_type})buf[3] << 32u)
+            | (({var_type})buf[4] << 24u)
+            | (({var_type})buf[5] << 16u)
+            | (({var_type})buf[6] << 8u)
+            | ({var_type})buf[7]);
+}}
+'''
+
 DEFINITION_FMT = '''\
 int {database_name}_{message_name}_pack(
     uint8_t *dst_p,
@@ -516,6 +728,135 @@ int {database_name}_{message_name}_unpack(
 }}
 '''
 
+DISPATCH_STRUCT_FMT = '''\
+#ifndef ENOENT
+#    define ENOENT 2
+#endif
+
+/**
+ * Any message in the database, as unpacked by {database_name}_unpack().
+ * The frame id and the IDE flag tell which signals member is valid.
+ */
+struct {database_name}_message_t {{
+    uint32_t frame_id;
+    bool is_extended_frame;
+{members}}};
+'''
+
+DISPATCH_MEMBERS_FMT = '''    union {{
+{members}
+    }} signals;
+'''
+
+DISPATCH_DECLARATION_FMT = '''/**
+ * Unpack message with given frame id and IDE flag.
+ *
+ * @param[out] dst_p Object to unpack the message into.
+ * @param[in] frame_id Frame id of the message to unpack.
+ * @param[in] is_extended_frame True for an extended (29 bits) frame
+ *                              id, false for a standard (11 bits).
+ * @param[in] src_p Message to unpack.
+ * @param[in] size Size of src_p.
+ *
+ * @return zero(0) or negative error code, -ENOENT if the frame id is
+ *         not in the database.
+ */
+int {database_name}_unpack(
+    struct {database_name}_message_t *dst_p,
+    uint32_t frame_id,
+    bool is_extended_frame,
+    const uint8_t *src_p,
+    size_t size);
+'''
+
+DISPATCH_DEFINITION_FMT = '''/* Bit set in the keys of extended frames. */
+#define {database_name_upper}_EXTENDED_FRAME_KEY_FLAG 0x80000000u
+
+/* Keys of all messages in ascending order. A key is the frame id,
+   with {database_name_upper}_EXTENDED_FRAME_KEY_FLAG set for extended
+   frames. */
+static const uint32_t {database_name}_frame_keys[{number_of_frame_ids}] = {{
+{frame_ids}
+}};
+
+int {database_name}_unpack(
+    struct {database_name}_message_t *dst_p,
+    uint32_t frame_id,
+    bool is_extended_frame,
+    const uint8_t *src_p,
+    size_t size)
+{{
+    int res;
+    uint32_t key;
+    size_t low;
+    size_t high;
+    size_t middle;
+
+    key = frame_id;
+
+    if (is_extended_frame) {{
+        key |= {database_name_upper}_EXTENDED_FRAME_KEY_FLAG;
+    }}
+
+    /* Binary search for the key. */
+    low = 0;
+    high = {number_of_frame_ids}u;
+
+    while (low < high) {{
+        middle = (low + (high - low) / 2u);
+
+        if ({database_name}_frame_keys[middle] < key) {{
+            low = (middle + 1u);
+        }} else {{
+            high = middle;
+        }}
+    }}
+
+    if ((low == {number_of_frame_ids}u)
+        || ({database_name}_frame_keys[low] != key)) {{
+        return (-ENOENT);
+    }}
+
+    dst_p->frame_id = frame_id;
+    dst_p->is_extended_frame = is_extended_frame;
+
+    switch (low) {{
+
+{cases}
+    default:
+        res = (-ENOENT);
+        break;
+    }}
+
+    return (res);
+}}
+'''
+
+DISPATCH_CASE_FMT = '''    case {index}:
+        res = {database_name}_{message_name}_unpack(
+            &dst_p->signals.{message_name},
+            src_p,
+            size);
+        break;
+'''
+
+EMPTY_DISPATCH_DEFINITION_FMT = '''int {database_name}_unpack(
+    struct {database_name}_message_t *dst_p,
+    uint32_t frame_id,
+    bool is_extended_frame,
+    const uint8_t *src_p,
+    size_t size)
+{{
+    (void)dst_p;
+    (void)frame_id;
+    (void)is_extended_frame;
+    (void)src_p;
+    (void)size;
+
+    return (-ENOENT);
+}}
+'''
+
 SIGN_EXTENSION_FMT = '''
     if (({name} & (1{suffix} << {shift})) != 0{suffix}) {{
         {name} |= 0x{mask:x}{suffix};
@@ -734,13 +1075,52 @@ class Signal(object):
             left -= length
             index += 1
 
+    def word_segments(self):
+        """Yields the parts of the signal in each 64 bits word it
+        occupies, as a tuple of word index, word shift, value shift
+        and mask. The part is ``(word >> word_shift) & mask``, and is
+        located at ``value_shift`` in the signal value.
+
+        """
+
+        if self.byte_order == 'big_endian':
+            start = (8 * (self.start // 8) + (7 - (self.start % 8)))
+        else:
+            start = self.start
+
+        end = (start + self.length)
+        index = (start // 64)
+
+        while 64 * index < end:
+            begin = max(start, 64 * index)
+            stop = min(end, 64 * (index + 1))
+            mask = ((1 << (stop - begin)) - 1)
+
+            if self.byte_order == 'big_endian':
+                word_shift = (64 * index + 63 - (stop - 1))
+                value_shift = (end - stop)
+            else:
+                word_shift = (begin - 64 * index)
+                value_shift = (begin - start)
+
+            yield index, word_shift, value_shift, mask
+
+            index += 1
+
 
 class Message(object):
 
-    def __init__(self, message):
+    def __init__(self, message, word_wise=False):
         self._message = message
         self.snake_name = camel_to_snake_case(self.name)
         self.signals = [Signal(signal)for signal in message.signals]
+        self.word_wise = False
+
+        if word_wise:
+            # Words are packed by assignment, so each word may only
+            # have signals of one byte order.
+            indexes = [index for _, index in self.words()]
+            self.word_wise = (len(indexes) == len(set(indexes)))
 
     def __getattr__(self, name):
         return getattr(self._message, name)
@@ -750,6 +1130,20 @@ class Message(object):
             if signal.name == name:
                 return signal
 
+    def words(self):
+        """Returns a sorted list of byte order and word index of all 64
+        bits words used by the signals.
+
+        """
+
+        words = set()
+
+        for signal in self.signals:
+            for index, _, _, _ in signal.word_segments():
+                words.add((signal.byte_order, index))
+
+        return sorted(words)
+
 
 def _canonical(value):
     """Replace anything but 'a-z', 'A-Z' and '0-9' with '_'.
@@ -922,6 +1316,11 @@ def _format_pack_code_signal(message,
         variable_lines.append(variable)
         body_lines.append(conversion)
 
+    if message.word_wise:
+        _format_pack_code_signal_word_wise(signal, body_lines)
+
+        return
+
     for index, shift, shift_direction, mask in signal.segments(invert_shift=False):
         if signal.is_float or signal.is_signed:
             fmt = '    dst_p[{}] |= pack_{}_shift_u{}({}, {}u, 0x{:02x}u);'
@@ -938,6 +1337,40 @@ def _format_pack_code_signal(message,
         helper_kinds.add((shift_direction, signal.type_length))
 
 
+def _word_name(byte_order, index):
+    return 'word_{}_{}'.format('be' if byte_order == 'big_endian' else 'le',
+                               index)
+
+
+def _format_mask(mask):
+    if mask > 0xffffffff:
+        return '0x{:x}ull'.format(mask)
+    else:
+        return '0x{:x}u'.format(mask)
+
+
+def _format_pack_code_signal_word_wise(signal, body_lines):
+    if signal.is_float or signal.is_signed:
+        value = signal.snake_name
+    else:
+        value = 'src_p->' + signal.snake_name
+
+    for index, word_shift, value_shift, mask in signal.word_segments():
+        part = '(uint64_t){}'.format(value)
+
+        if value_shift > 0:
+            part = '({} >> {}u)'.format(part, value_shift)
+
+        part = '({} & {})'.format(part, _format_mask(mask))
+
+        if word_shift > 0:
+            part = '({} << {}u)'.format(part, word_shift)
+
+        body_lines.append('    {} |= {};'.format(
+            _word_name(signal.byte_order, index),
+            part))
+
+
 def _format_pack_code_level(message,
                             signal_names,
                             variable_lines,
@@ -979,6 +1412,25 @@ def _format_pack_code(message, helper_kinds):
                                          variable_lines,
                                          helper_kinds)
 
+    if message.word_wise:
+        init_lines = []
+        store_lines = []
+
+        for byte_order, index in message.words():
+            name = _word_name(byte_order, index)
+            variable_lines.append('    uint64_t {};'.format(name))
+            init_lines.append('    {} = 0;'.format(name))
+            store_lines.append(
+                '    pack_{}_u64(&dst_p[{}], {}, {}u);'.format(
+                    byte_order,
+                    8 * index,
+                    name,
+                    max(min(8, message.length - 8 * index), 0)))
+            helper_kinds.add((byte_order, 64))
+
+        if init_lines:
+            body_lines = ([''] + init_lines + body_lines + store_lines + [''])
+
     if variable_lines:
         variable_lines = sorted(list(set(variable_lines))) + ['', '']
 
@@ -1034,7 +1486,13 @@ def _format_unpack_code_signal(message,
         variable = '    {} {};'.format(conversion_type_name, signal.snake_name)
         variable_lines.append(variable)
 
-    segments = signal.segments(invert_shift=True)
+    if message.word_wise:
+        _format_unpack_code_signal_word_wise(signal,
+                                             conversion_type_name,
+                                             body_lines)
+        segments = []
+    else:
+        segments = signal.segments(invert_shift=True)
 
     for i, (index, shift, shift_direction, mask) in enumerate(segments):
         if signal.is_float or signal.is_signed:
@@ -1072,6 +1530,39 @@ def _format_unpack_code_signal(message,
         body_lines.append(conversion)
 
 
+def _format_unpack_code_signal_word_wise(signal,
+                                         conversion_type_name,
+                                         body_lines):
+    if signal.is_float or signal.is_signed:
+        value = signal.snake_name
+    else:
+        value = 'dst_p->' + signal.snake_name
+
+    parts = []
+
+    for index, word_shift, value_shift, mask in signal.word_segments():
+        part = _word_name(signal.byte_order, index)
+
+        if word_shift > 0:
+            part = '({} >> {}u)'.format(part, word_shift)
+
+        part = '({} & {})'.format(part, _format_mask(mask))
+
+        if value_shift > 0:
+            part = '({} << {}u)'.format(part, value_shift)
+
+        parts.append(part)
+
+    if len(parts) == 1:
+        parts = parts[0]
+    else:
+        parts = '({})'.format(' | '.join(parts))
+
+    body_lines.append('    {} = ({}){};'.format(value,
+                                                conversion_type_name,
+                                                parts))
+
+
 def _format_unpack_code_level(message,
                               signal_names,
                               variable_lines,
@@ -1124,6 +1615,23 @@ def _format_unpack_code(message, helper_kinds):
                                            variable_lines,
                                            helper_kinds)
 
+    if message.word_wise:
+        load_lines = []
+
+        for byte_order, index in message.words():
+            name = _word_name(byte_order, index)
+            variable_lines.append('    uint64_t {};'.format(name))
+            load_lines.append(
+                '    {} = unpack_{}_u64(&src_p[{}], {}u);'.format(
+                    name,
+                    byte_order,
+                    8 * index,
+                    max(min(8, message.length - 8 * index), 0)))
+            helper_kinds.add((byte_order, 64))
+
+        if load_lines:
+            body_lines = [''] + load_lines + body_lines
+
     if variable_lines:
         variable_lines = sorted(list(set(variable_lines))) + ['', '']
 
@@ -1450,29 +1958,121 @@ def _generate_definitions(database_name, messages, floating_point_numbers):
     return '\n'.join(definitions), (pack_helper_kinds, unpack_helper_kinds)
 
 
-def _generate_helpers_kind(kinds, left_format, right_format):
-    formats = {
-        'left': left_format,
-        'right': right_format
-    }
+def _get_dispatch_key(message):
+    """Returns the dispatch key of given message, which is its frame id
+    with bit 31 set for extended frames.
+
+    """
+
+    if message.is_extended_frame:
+        return (message.frame_id | 0x80000000)
+    else:
+        return message.frame_id
+
+
+def _get_dispatch_messages(messages):
+    """Returns given messages sorted by dispatch key. Raises an error if
+    more than one message has the same frame id and IDE flag.
+
+    """
+
+    dispatch_messages = {}
+
+    for message in messages:
+        dispatch_messages.setdefault(_get_dispatch_key(message),
+                                     []).append(message)
+
+    collisions = [
+        messages_of_key
+        for messages_of_key in dispatch_messages.values()
+        if len(messages_of_key) > 1
+    ]
+
+    if collisions:
+        raise Error(
+            'Messages with the same frame id and IDE flag can not be '
+            'dispatched: {}.'.format(', '.join([
+                '{} (0x{:x}{})'.format(
+                    ' and '.join([message.name for message in messages_of_key]),
+                    messages_of_key[0].frame_id,
+                    ', extended' if messages_of_key[0].is_extended_frame else '')
+                for messages_of_key in collisions
+            ])))
+
+    return [
+        dispatch_messages[key][0]
+        for key in sorted(dispatch_messages)
+    ]
+
+
+def _generate_dispatch_struct(database_name, messages):
+    if messages:
+        members = DISPATCH_MEMBERS_FMT.format(
+            members='\n'.join([
+                '        struct {}_{}_t {};'.format(database_name,
+                                                    message.snake_name,
+                                                    message.snake_name)
+                for message in messages
+            ]))
+    else:
+        members = ''
+
+    return DISPATCH_STRUCT_FMT.format(database_name=database_name,
+                                      members=members)
+
+
+def _generate_dispatch_definition(database_name, messages):
+    if not messages:
+        return EMPTY_DISPATCH_DEFINITION_FMT.format(
+            database_name=database_name)
+
+    frame_ids = ',\n'.join([
+        '    0x{:02x}u'.format(_get_dispatch_key(message))
+        for message in messages
+    ])
+    cases = '\n'.join([
+        DISPATCH_CASE_FMT.format(index=index,
+                                 database_name=database_name,
+                                 message_name=message.snake_name)
+        for index, message in enumerate(messages)
+    ])
+
+    return DISPATCH_DEFINITION_FMT.format(database_name=database_name,
+                                          database_name_upper=database_name.upper(),
+                                          number_of_frame_ids=len(messages),
+                                          frame_ids=frame_ids,
+                                          cases=cases)
+
+
+def _generate_helpers_kind(kinds, formats):
     helpers = []
 
-    for shift_direction, length in sorted(kinds):
+    for kind, length in sorted(kinds):
         var_type = 'uint{}_t'.format(length)
-        helper = formats[shift_direction].format(length=length,
-                                                 var_type=var_type)
+        helper = formats[kind].format(length=length,
+                                      var_type=var_type)
         helpers.append(helper)
 
     return helpers
 
 
 def _generate_helpers(kinds):
-    pack_helpers = _generate_helpers_kind(kinds[0],
-                                          PACK_HELPER_LEFT_SHIFT_FMT,
-                                          PACK_HELPER_RIGHT_SHIFT_FMT)
-    unpack_helpers = _generate_helpers_kind(kinds[1],
-                                            UNPACK_HELPER_LEFT_SHIFT_FMT,
-                                            UNPACK_HELPER_RIGHT_SHIFT_FMT)
+    pack_helpers = _generate_helpers_kind(
+        kinds[0],
+        {
+            'left': PACK_HELPER_LEFT_SHIFT_FMT,
+            'right': PACK_HELPER_RIGHT_SHIFT_FMT,
+            'little_endian': PACK_HELPER_LITTLE_ENDIAN_FMT,
+            'big_endian': PACK_HELPER_BIG_ENDIAN_FMT
+        })
+    unpack_helpers = _generate_helpers_kind(
+        kinds[1],
+        {
+            'left': UNPACK_HELPER_LEFT_SHIFT_FMT,
+            'right': UNPACK_HELPER_RIGHT_SHIFT_FMT,
+            'little_endian': UNPACK_HELPER_LITTLE_ENDIAN_FMT,
+            'big_endian': UNPACK_HELPER_BIG_ENDIAN_FMT
+        })
     helpers = pack_helpers + unpack_helpers
 
     if helpers:
@@ -1520,7 +2120,9 @@ def generate(database,
              source_name,
              fuzzer_source_name,
              floating_point_numbers=True,
-             bit_fields=False):
+             bit_fields=False,
+             dispatch=False,
+             word_wise=False):
     """Generate C source code from given CAN database `database`.
 
     `database_name` is used as a prefix for all defines, data
@@ -1540,13 +2142,26 @@ def generate(database,
 
     Set `bit_fields` to ``True`` to generate bit fields in structs.
 
+    Set `dispatch` to ``True`` to generate a function unpacking a
+    message with any frame id and IDE flag in the database, using a
+    binary search over the sorted frame ids. A standard and an extended
+    message may have the same frame id, but an error is raised if two
+    messages have the same frame id and IDE flag.
+
+    Set `word_wise` to ``True`` to pack and unpack messages as 64 bits
+    words, with a single shift and mask per signal and word instead
+    of one per signal and byte. Messages with signals of both byte
+    orders in the same word are packed and unpacked byte by byte.
+
     This function returns a tuple of the C header and source files as
     strings.
 
     """
 
     date = time.ctime()
-    messages = [Message(message) for message in database.messages]
+    messages = [
+        Message(message, word_wise) for message in database.messages
+    ]
     include_guard = '{}_H'.format(database_name.upper())
     frame_id_defines = _generate_frame_id_defines(database_name, messages)
     frame_length_defines = _generate_frame_length_defines(database_name,
@@ -1567,6 +2182,15 @@ def generate(database,
                                                       floating_point_numbers)
     helpers = _generate_helpers(helper_kinds)
 
+    if dispatch:
+        dispatch_messages = _get_dispatch_messages(messages)
+        structs += '\n' + _generate_dispatch_struct(database_name,
+                                                    dispatch_messages)
+        declarations += '\n' + DISPATCH_DECLARATION_FMT.format(
+            database_name=database_name)
+        definitions += '\n' + _generate_dispatch_definition(database_name,
+                                                            dispatch_messages)
+
     header = HEADER_FMT.format(version=__version__,
                                date=date,
                                include_guard=include_guard,
@@ -1593,3 +2217,46 @@ def generate(database,
         fuzzer_source_name)
 
     return header, source, fuzzer_source, fuzzer_makefile
+
+
+def generate_dispatch_benchmark(database, database_name, header_name):
+    """Generate a C source file measuring the time to unpack messages
+    with the dispatch function generated by :func:`generate()` with
+    `dispatch` set to ``True``.
+
+    `database_name` and `header_name` are the same as given to
+    :func:`generate()`.
+
+    This function returns the C source file as a string.
+
+    """
+
+    messages = _get_dispatch_messages(
+        [Message(message) for message in database.messages])
+    frame_ids = set([
+        message.frame_id
+        for message in messages
+        if not message.is_extended_frame
+    ])
+    unknown_frame_id = 0
+
+    while unknown_frame_id in frame_ids:
+        unknown_frame_id += 1
+
+    if messages:
+        frames = ',\n'.join([
+            '    {{ {name}_FRAME_ID, {name}_IS_EXTENDED }}'.format(
+                name='{}_{}'.format(database_name.upper(),
+                                    message.snake_name.upper()))
+            for message in messages
+        ])
+    else:
+        frames = '    { UNKNOWN_FRAME_ID, false }'
+
+    return DISPATCH_BENCHMARK_FMT.format(
+        version=__version__,
+        date=time.ctime(),
+        header=header_name,
+        database_name=database_name,
+        unknown_frame_id='(0x{:02x}u)'.format(unknown_frame_id),
+        frames=frames)
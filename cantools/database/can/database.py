@@ -1,16 +1,93 @@
 import logging
+import os
 
 from .formats import arxml
 from .formats import dbc
 from .formats import kcd
 from .formats import sym
 from .internal_database import InternalDatabase
+from ..errors import Error
 from ...compat import fopen
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _dbc_definition(dbc):
+    if dbc is None:
+        return None
+
+    return [
+        (name, attribute.value)
+        for name, attribute in dbc.attributes.items()
+    ]
+
+
+def _signal_definition(signal):
+    decimal = signal.decimal
+
+    return (
+        signal.name,
+        signal.start,
+        signal.length,
+        signal.byte_order,
+        signal.is_signed,
+        signal.initial,
+        signal.scale,
+        signal.offset,
+        signal.minimum,
+        signal.maximum,
+        decimal.scale,
+        decimal.offset,
+        decimal.minimum,
+        decimal.maximum,
+        signal.unit,
+        # Not signal.choices, which copies shared choices.
+        signal._choices,
+        _dbc_definition(signal.dbc),
+        signal.comment,
+        signal.receivers,
+        signal.is_multiplexer,
+        signal.multiplexer_ids,
+        signal.multiplexer_signal,
+        signal.is_float,
+        signal.spn
+    )
+
+
+def _message_definition(message):
+    """Returns a value that compares equal for messages with equal
+    definitions, including their signals.
+
+    """
+
+    if message.signal_groups is None:
+        signal_groups = None
+    else:
+        signal_groups = [
+            (signal_group.name,
+             signal_group.repetitions,
+             signal_group.signal_names)
+            for signal_group in message.signal_groups
+        ]
+
+    return (
+        message.frame_id,
+        message.is_extended_frame,
+        message.name,
+        message.length,
+        [_signal_definition(signal) for signal in message.signals],
+        message.comment,
+        message.senders,
+        message.send_type,
+        message.cycle_time,
+        _dbc_definition(message.dbc),
+        message.bus_name,
+        signal_groups,
+        message.protocol
+    )
+
+
 class Database(object):
     """This class contains all messages, signals and definitions of a CAN
     network.
@@ -23,6 +100,17 @@ class Database(object):
     If `strict` is ``True`` an exception is raised if any signals are
     overlapping or if they don't fit in their message.
 
+    Messages may be encoded and decoded from several threads at the
+    same time without locks, also while the database is refreshed or
+    reloaded in another thread. :meth:`.refresh()`,
+    :meth:`.reload_file()` and :meth:`.reload_string()` create new
+    codecs and lookup tables and replace the old ones with a single
+    assignment each, so encoding and decoding use either the old or
+    the new ones. Modifying messages and signals in place while they
+    are used from other threads is not safe, as the codecs use
+    them. Reload the database to change it, or call :meth:`.freeze()`
+    to make it read-only.
+
     """
 
     def __init__(self,
@@ -36,8 +124,9 @@ class Database(object):
         self._messages = messages if messages else []
         self._nodes = nodes if nodes else []
         self._buses = buses if buses else []
-        self._name_to_message = {}
-        self._frame_id_to_message = {}
+        # The name to message and frame id to message lookup tables,
+        # replaced together in one assignment.
+        self._lookup = ({}, {})
         self._version = version
         self._dbc = dbc_specifics
 
@@ -46,6 +135,7 @@ class Database(object):
 
         self._frame_id_mask = frame_id_mask
         self._strict = strict
+        self._frozen = False
         self.refresh()
 
     @property
@@ -86,6 +176,7 @@ class Database(object):
 
     @version.setter
     def version(self, value):
+        self._check_not_frozen()
         self._version = value
 
     @property
@@ -98,8 +189,38 @@ class Database(object):
 
     @dbc.setter
     def dbc(self, value):
+        self._check_not_frozen()
         self._dbc = value
 
+    @property
+    def frozen(self):
+        """``True`` if the database is read-only, otherwise ``False``. See
+        :meth:`.freeze()`.
+
+        """
+
+        return self._frozen
+
+    def freeze(self):
+        """Make the database read-only. Messages, nodes and buses can no
+        longer be added, and :meth:`.refresh()`, the reload methods
+        and the setters raise an exception. The lists of messages,
+        nodes and buses are replaced by tuples.
+
+        Messages and signals are not frozen, and must not be modified
+        after the database is frozen.
+
+        """
+
+        self._messages = tuple(self._messages)
+        self._nodes = tuple(self._nodes)
+        self._buses = tuple(self._buses)
+        self._frozen = True
+
+    def _check_not_frozen(self):
+        if self._frozen:
+            raise Error('The database is frozen and can not be modified.')
+
     def add_arxml(self, fp):
         """Read and parse ARXML data from given file-like object and add the
         parsed data to the database.
@@ -125,6 +246,7 @@ class Database(object):
 
         """
 
+        self._check_not_frozen()
         database = arxml.load_string(string, self._strict)
 
         self._messages += database.messages
@@ -134,43 +256,57 @@ class Database(object):
         self._dbc = database.dbc
         self.refresh()
 
-    def add_dbc(self, fp):
+    def add_dbc(self, fp, metadata='full'):
         """Read and parse DBC data from given file-like object and add the
         parsed data to the database.
 
+        See :meth:`.add_dbc_string()` for a description of `metadata`.
+
         >>> db = cantools.database.Database()
         >>> with open ('foo.dbc', 'r') as fin:
         ...     db.add_dbc(fin)
 
         """
 
-        self.add_dbc_string(fp.read())
+        self.add_dbc_string(fp.read(), metadata)
 
-    def add_dbc_file(self, filename, encoding='cp1252'):
+    def add_dbc_file(self, filename, encoding='cp1252', metadata='full'):
         """Open, read and parse DBC data from given file and add the parsed
         data to the database.
 
         `encoding` specifies the file encoding.
 
+        See :meth:`.add_dbc_string()` for a description of `metadata`.
+
         >>> db = cantools.database.Database()
         >>> db.add_dbc_file('foo.dbc')
 
         """
 
         with fopen(filename, 'r', encoding=encoding) as fin:
-            self.add_dbc(fin)
+            self.add_dbc(fin, metadata)
 
-    def add_dbc_string(self, string):
+    def add_dbc_string(self, string, metadata='full'):
         """Parse given DBC data string and add the parsed data to the
         database.
 
+        `metadata` is one of ``'full'``, ``'lazy'`` and ``'none'``. If
+        ``'lazy'``, comments, attributes and environment variables are
+        parsed on first access of a node's, message's or signal's
+        ``comment`` or ``dbc`` property, or of the database's ``dbc``
+        attributes or environment variables. Syntax errors in them are
+        raised on first access as well. If ``'none'``, they are not
+        parsed at all. Attributes needed to load the database, like
+        long names and cycle times, are always parsed.
+
         >>> db = cantools.database.Database()
         >>> with open ('foo.dbc', 'r') as fin:
         ...     db.add_dbc_string(fin.read())
 
         """
 
-        database = dbc.load_string(string, self._strict)
+        self._check_not_frozen()
+        database = dbc.load_string(string, self._strict, metadata)
 
         self._messages += database.messages
         self._nodes = database.nodes
@@ -204,6 +340,7 @@ class Database(object):
 
         """
 
+        self._check_not_frozen()
         database = kcd.load_string(string, self._strict)
 
         self._messages += database.messages
@@ -238,6 +375,7 @@ class Database(object):
 
         """
 
+        self._check_not_frozen()
         database = sym.load_string(string, self._strict)
 
         self._messages += database.messages
@@ -247,29 +385,117 @@ class Database(object):
         self._dbc = database.dbc
         self.refresh()
 
-    def _add_message(self, message):
-        """Add given message to the database.
+    def reload_file(self, filename, database_format=None, encoding=None):
+        """Open, read and parse given database file and replace the contents
+        of the database with it, for example after the file has been
+        modified.
+
+        `database_format` is one of ``'arxml'``, ``'dbc'``, ``'kcd'``,
+        ``'sym'`` and ``None``. If ``None``, the database format is
+        selected based on the filename extension, and `encoding` is
+        selected based on the database format, as in
+        :func:`~cantools.database.load_file()`.
+
+        See :meth:`.reload_string()` for details.
+
+        >>> db = cantools.database.load_file('foo.dbc')
+        >>> db.reload_file('foo.dbc')
+
+        """
+
+        if database_format is None:
+            database_format = os.path.splitext(filename)[1][1:].lower()
+
+        if encoding is None:
+            if database_format in ['dbc', 'sym']:
+                encoding = 'cp1252'
+            else:
+                encoding = 'utf-8'
+
+        with fopen(filename, 'r', encoding=encoding) as fin:
+            self.reload_string(fin.read(), database_format)
+
+    def reload_string(self, string, database_format):
+        """Parse given database string and replace the contents of the
+        database with it. `database_format` is one of ``'arxml'``,
+        ``'dbc'``, ``'kcd'`` and ``'sym'``.
+
+        The string is parsed without creating any codecs. Messages
+        with the same definition as before, including their signals,
+        comments and attributes, are kept along with their codecs, so
+        they are still the same objects after the reload. Codecs are
+        only created for changed and new messages, which replace the
+        old ones. Removed messages are removed.
+
+        The message lookup tables are replaced together, in one
+        assignment, after all messages are ready, so :meth:`.encode_message()` and
+        :meth:`.decode_message()` called from other threads during the
+        reload use either the old or the new messages.
+
+        """
+
+        self._check_not_frozen()
+
+        try:
+            load_string = {
+                'arxml': arxml.load_string,
+                'dbc': dbc.load_string,
+                'kcd': kcd.load_string,
+                'sym': sym.load_string
+            }[database_format]
+        except KeyError:
+            raise ValueError(
+                "expected database format 'arxml', 'dbc', 'kcd' or 'sym', "
+                "but got '{}'".format(database_format))
+
+        database = load_string(string, self._strict, refresh=False)
+        messages = []
+        name_to_message = {}
+        frame_id_to_message = {}
+
+        for message in database.messages:
+            old_message = self._lookup[0].get(message.name)
+
+            if (old_message is not None
+                and (_message_definition(old_message)
+                     == _message_definition(message))):
+                message = old_message
+            else:
+                message.refresh(self._strict)
+
+            messages.append(message)
+            self._add_message(message, name_to_message, frame_id_to_message)
+
+        self._messages = messages
+        self._nodes = database.nodes
+        self._buses = database.buses
+        self._version = database.version
+        self._dbc = database.dbc
+        self._lookup = (name_to_message, frame_id_to_message)
+
+    def _add_message(self, message, name_to_message, frame_id_to_message):
+        """Add given message to given lookup tables.
 
         """
 
-        if message.name in self._name_to_message:
+        if message.name in name_to_message:
             LOGGER.warning("Overwriting message '%s' with '%s' in the "
                            "name to message dictionary.",
-                           self._name_to_message[message.name].name,
+                           name_to_message[message.name].name,
                            message.name)
 
         masked_frame_id = (message.frame_id & self._frame_id_mask)
 
-        if masked_frame_id in self._frame_id_to_message:
+        if masked_frame_id in frame_id_to_message:
             LOGGER.warning(
                 "Overwriting message '%s' with '%s' in the frame id to message "
                 "dictionary because they have identical masked frame ids 0x%x.",
-                self._frame_id_to_message[masked_frame_id].name,
+                frame_id_to_message[masked_frame_id].name,
                 message.name,
                 masked_frame_id)
 
-        self._name_to_message[message.name] = message
-        self._frame_id_to_message[masked_frame_id] = message
+        name_to_message[message.name] = message
+        frame_id_to_message[masked_frame_id] = message
 
     def as_dbc_string(self):
         """Return the database as a string formatted as a DBC file.
@@ -282,6 +508,33 @@ class Database(object):
                                                 self._version,
                                                 self._dbc))
 
+    def dump_dbc(self, fp):
+        """Write the database formatted as a DBC file to given file-like
+        object `fp`. Sections are written as they are formatted, so
+        the whole file is never held in memory.
+
+        """
+
+        dbc.dump(InternalDatabase(self._messages,
+                                  self._nodes,
+                                  self._buses,
+                                  self._version,
+                                  self._dbc),
+                 fp)
+
+    def dump_kcd(self, fp):
+        """Write the database formatted as a KCD file to given file-like
+        object `fp`. The XML is written one message at a time.
+
+        """
+
+        kcd.dump(InternalDatabase(self._messages,
+                                  self._nodes,
+                                  self._buses,
+                                  self._version,
+                                  self._dbc),
+                 fp)
+
     def as_kcd_string(self):
         """Return the database as a string formatted as a KCD file.
 
@@ -298,14 +551,14 @@ class Database(object):
 
         """
 
-        return self._name_to_message[name]
+        return self._lookup[0][name]
 
     def get_message_by_frame_id(self, frame_id):
         """Find the message object for given frame id `frame_id`.
 
         """
 
-        return self._frame_id_to_message[frame_id & self._frame_id_mask]
+        return self._lookup[1][frame_id & self._frame_id_mask]
 
     def get_node_by_name(self, name):
         """Find the node object for given name `name`.
@@ -353,10 +606,12 @@ class Database(object):
 
         """
 
+        name_to_message, frame_id_to_message = self._lookup
+
         try:
-            message = self._frame_id_to_message[frame_id_or_name]
+            message = frame_id_to_message[frame_id_or_name]
         except KeyError:
-            message = self._name_to_message[frame_id_or_name]
+            message = name_to_message[frame_id_or_name]
 
         return message.encode(data, scaling, padding, strict)
 
@@ -381,10 +636,12 @@ class Database(object):
 
         """
 
+        name_to_message, frame_id_to_message = self._lookup
+
         try:
-            message = self._frame_id_to_message[frame_id_or_name]
+            message = frame_id_to_message[frame_id_or_name]
         except KeyError:
-            message = self._name_to_message[frame_id_or_name]
+            message = name_to_message[frame_id_or_name]
 
         return message.decode(data, decode_choices, scaling)
 
@@ -395,14 +652,20 @@ class Database(object):
         database to refresh the internal lookup tables used when
         encoding and decoding messages.
 
+        The lookup tables are replaced together, in one assignment,
+        once they are complete.
+
         """
 
-        self._name_to_message = {}
-        self._frame_id_to_message = {}
+        self._check_not_frozen()
+        name_to_message = {}
+        frame_id_to_message = {}
 
         for message in self._messages:
             message.refresh(self._strict)
-            self._add_message(message)
+            self._add_message(message, name_to_message, frame_id_to_message)
+
+        self._lookup = (name_to_message, frame_id_to_message)
 
     def __repr__(self):
         lines = []
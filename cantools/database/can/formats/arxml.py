@@ -9,6 +9,8 @@ from ..signal import Signal
 from ..signal import Decimal as SignalDecimal
 from ..message import Message
 from ..internal_database import InternalDatabase
+from .utils import intern
+from .utils import share_choices
 
 
 LOGGER = logging.getLogger(__name__)
@@ -147,12 +149,14 @@ REFERENCE_VALUES_XPATH = make_xpath([
 
 class SystemLoader(object):
 
-    def __init__(self, root, strict):
+    def __init__(self, root, strict, refresh):
         self.root = root
         self.strict = strict
+        self.refresh = refresh
         self._system_signal_cache = {}
         self._compu_method_cache = {}
         self._sw_base_type_cache = {}
+        self._shared_choices = {}
 
     def load(self):
         buses = []
@@ -225,7 +229,8 @@ class SystemLoader(object):
                        signals=signals,
                        comment=comment,
                        bus_name=None,
-                       strict=self.strict)
+                       strict=self.strict,
+                       refresh=self.refresh)
 
     def load_message_name(self, can_frame_triggering):
         return can_frame_triggering.find(SHORT_NAME_XPATH, NAMESPACES).text
@@ -347,8 +352,8 @@ class SystemLoader(object):
         unit_ref = system_signal.find(UNIT_REF_XPATH, NAMESPACES)
 
         if unit_ref is not None:
-            return self.find_unit(unit_ref.text).find(DISPLAY_NAME_XPATH,
-                                                      NAMESPACES).text
+            return intern(self.find_unit(unit_ref.text).find(DISPLAY_NAME_XPATH,
+                                                             NAMESPACES).text)
 
     def load_signal_comment(self, system_signal):
         l_2 = system_signal.find(DESC_L_2_XPATH, NAMESPACES)
@@ -383,7 +388,7 @@ class SystemLoader(object):
             vt = compu_scale.find(VT_XPATH, NAMESPACES)
 
             if vt is not None:
-                choices[vt.text] = int(lower_limit.text)
+                choices[intern(vt.text)] = int(lower_limit.text)
             else:
                 minimum = self.load_minimum(lower_limit, decimal)
                 maximum = self.load_maximum(upper_limit, decimal)
@@ -449,7 +454,7 @@ class SystemLoader(object):
             vt = compu_scale.find(VT_XPATH, NAMESPACES)
 
             if vt is not None:
-                choices[vt.text] = int(lower_limit.text)
+                choices[intern(vt.text)] = int(lower_limit.text)
             else:
                 minimum = self.load_minimum(lower_limit, decimal)
                 maximum = self.load_maximum(upper_limit, decimal)
@@ -499,6 +504,8 @@ class SystemLoader(object):
             else:
                 LOGGER.debug('Category %s is not yet implemented.', category)
 
+        choices = share_choices(choices, self._shared_choices)
+
         return minimum, maximum, factor, offset, choices
 
 
@@ -608,9 +615,10 @@ class SystemLoader(object):
 
 class EcuExtractLoader(object):
 
-    def __init__(self, root, strict):
+    def __init__(self, root, strict, refresh):
         self.root = root
         self.strict = strict
+        self.refresh = refresh
 
     def load(self):
         buses = []
@@ -731,7 +739,8 @@ class EcuExtractLoader(object):
                        signals=signals,
                        comment=comment,
                        bus_name=None,
-                       strict=self.strict)
+                       strict=self.strict,
+                       refresh=self.refresh)
 
     def load_message_tx(self, com_pdu_id_ref):
         return self.load_message_rx_tx(com_pdu_id_ref,
@@ -933,8 +942,9 @@ def is_ecu_extract(root):
     return ecuc_value_collection is not None
 
 
-def load_string(string, strict=True):
-    """Parse given ARXML format string.
+def load_string(string, strict=True, refresh=True):
+    """Parse given ARXML format string. Message codecs are not created if
+    `refresh` is ``False``.
 
     """
 
@@ -948,6 +958,6 @@ def load_string(string, strict=True):
                 root.tag))
 
     if is_ecu_extract(root):
-        return EcuExtractLoader(root, strict).load()
+        return EcuExtractLoader(root, strict, refresh).load()
     else:
-        return SystemLoader(root, strict).load()
+        return SystemLoader(root, strict, refresh).load()
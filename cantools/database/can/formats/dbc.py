@@ -4,7 +4,6 @@ import re
 from collections import OrderedDict as odict
 from collections import defaultdict
 from decimal import Decimal
-from copy import deepcopy
 
 import textparser
 from textparser import Sequence
@@ -29,12 +28,15 @@ from ..message import Message
 from ..node import Node
 from ..bus import Bus
 from ..internal_database import InternalDatabase
+from ..metadata import LazyDbcMetadata
 from ..environment_variable import EnvironmentVariable
 
 from .utils import num
+from .utils import intern
+from .utils import share_choices
 
 
-DBC_FMT = (
+DBC_HEADER_FMT = (
     'VERSION "{version}"\r\n'
     '\r\n'
     '\r\n'
@@ -71,22 +73,6 @@ DBC_FMT = (
     'BS_:\r\n'
     '\r\n'
     'BU_: {bu}\r\n'
-    '{val_table}'
-    '\r\n'
-    '\r\n'
-    '{bo}\r\n'
-    '\r\n'
-    '{bo_tx_bu}\r\n'
-    '\r\n'
-    '\r\n'
-    '{cm}\r\n'
-    '{ba_def}\r\n'
-    '{ba_def_def}\r\n'
-    '{ba}\r\n'
-    '{val}\r\n'
-    '{signal_types}\r\n'
-    '{sig_group}\r\n'
-    '{sig_mux_values}\r\n'
 )
 
 
@@ -123,11 +109,69 @@ ATTRIBUTE_DEFINITION_LONG_SIGNAL_NAME = AttributeDefinition(
     type_name='STRING')
 
 
+# Attributes needed to load nodes, messages, signals and the bus. They
+# are parsed even if other metadata is loaded lazily or not at all.
+REQUIRED_ATTRIBUTES = set([
+    'Baudrate',
+    'DBName',
+    'GenMsgCycleTime',
+    'GenMsgSendType',
+    'GenSigStartValue',
+    'SPN',
+    'SystemEnvVarLongSymbol',
+    'SystemMessageLongSymbol',
+    'SystemNodeLongSymbol',
+    'SystemSignalLongSymbol',
+    'VFrameFormat'
+])
+
+# Keywords of comment, attribute and environment variable statements.
+METADATA_KEYWORDS = set(['CM_', 'BA_', 'EV_'])
+
+METADATA_STATEMENT_RE = re.compile(r'(?:"(?:\\"|[^"])*?"|[^";])*;')
+
+ATTRIBUTE_NAME_RE = re.compile(r'BA_\s*"([^"]*)"')
+
+
 def to_int(value):
     return int(Decimal(value))
 
 
 class Parser(textparser.Parser):
+    """DBC parser. Comment, attribute and environment variable statements
+    are not parsed if `metadata` is ``'lazy'`` or ``'none'``, except
+    for attributes in :data:`REQUIRED_ATTRIBUTES`. They are instead
+    saved in :attr:`.metadata_statements` if `metadata` is
+    ``'lazy'``.
+
+    """
+
+    def __init__(self, metadata='full'):
+        self._metadata = metadata
+        self.metadata_statements = []
+
+    def _read_metadata_statement(self, string, offset):
+        """Read the metadata statement at given offset. Returns the offset
+        after the statement, or ``None`` if not found, and ``True`` if
+        the statement sets a required attribute.
+
+        """
+
+        mo = METADATA_STATEMENT_RE.match(string, offset)
+
+        if mo is None:
+            return None, False
+
+        statement = mo.group()
+
+        if self._metadata == 'lazy':
+            self.metadata_statements.append(statement)
+
+        attribute_mo = ATTRIBUTE_NAME_RE.match(statement)
+        is_required = (attribute_mo is not None
+                       and attribute_mo.group(1) in REQUIRED_ATTRIBUTES)
+
+        return mo.end(), is_required
 
     def tokenize(self, string):
         keywords = set([
@@ -200,27 +244,69 @@ class Parser(textparser.Parser):
         ]
 
         tokens, token_regex = tokenize_init(token_specs)
+        token_re = re.compile(token_regex, re.DOTALL)
 
-        for mo in re.finditer(token_regex, string, re.DOTALL):
-            kind = mo.lastgroup
-
-            if kind == 'SKIP':
-                pass
-            elif kind == 'STRING':
-                value = mo.group(kind)[1:-1].replace('\\"', '"')
-                tokens.append(Token(kind, value, mo.start()))
-            elif kind != 'MISMATCH':
-                value = mo.group(kind)
-
-                if value in keywords:
-                    kind = value
-
-                if kind in names:
-                    kind = names[kind]
-
-                tokens.append(Token(kind, value, mo.start()))
-            else:
-                raise TokenizeError(string, mo.start())
+        if self._metadata == 'full':
+            metadata_keywords = set()
+        else:
+            metadata_keywords = METADATA_KEYWORDS
+
+        # Tokenize until a metadata statement is found, and then
+        # continue after it. Statements with required attributes are
+        # tokenized, including any environment variable keyword in
+        # them. The new symbols section lists the metadata keywords
+        # without statements, and ends with the next colon after its
+        # own.
+        offset = 0
+        required_end = 0
+        in_new_symbols = False
+
+        while offset is not None:
+            start = offset
+            offset = None
+
+            for mo in token_re.finditer(string, start):
+                kind = mo.lastgroup
+
+                if kind == 'SKIP':
+                    pass
+                elif kind == 'STRING':
+                    value = mo.group(kind)[1:-1].replace('\\"', '"')
+                    tokens.append(Token(kind, value, mo.start()))
+                elif kind != 'MISMATCH':
+                    value = mo.group(kind)
+
+                    if value in keywords:
+                        kind = value
+
+                        if value == 'NS_':
+                            in_new_symbols = True
+                        elif (value in metadata_keywords
+                            and not in_new_symbols
+                            and mo.start() >= required_end
+                            and tokens[-1].kind != 'BA_DEF_'):
+                            end, is_required = self._read_metadata_statement(
+                                string,
+                                mo.start())
+
+                            if end is not None:
+                                if is_required:
+                                    required_end = end
+                                else:
+                                    offset = end
+                                    break
+
+                    if kind in names:
+                        kind = names[kind]
+
+                    if (in_new_symbols
+                        and kind == ':'
+                        and tokens[-1].kind != 'NS_'):
+                        in_new_symbols = False
+
+                    tokens.append(Token(kind, value, mo.start()))
+                else:
+                    raise TokenizeError(string, mo.start())
 
         return tokens
 
@@ -346,23 +432,20 @@ class Parser(textparser.Parser):
 
 class DbcSpecifics(object):
 
+    __slots__ = (
+        '_attributes',
+        '_attribute_definitions',
+        '_environment_variables',
+        '_value_tables'
+    )
+
     def __init__(self,
                  attributes=None,
                  attribute_definitions=None,
                  environment_variables=None,
                  value_tables=None):
-        if attributes is None:
-            attributes = odict()
-
-        if attribute_definitions is None:
-            attribute_definitions = odict()
-
-        if environment_variables is None:
-            environment_variables = odict()
-
-        if value_tables is None:
-            value_tables = odict()
-
+        # Dictionaries not given are allocated on first access, as most
+        # signals have no attributes.
         self._attributes = attributes
         self._attribute_definitions = attribute_definitions
         self._environment_variables = environment_variables
@@ -375,7 +458,17 @@ class DbcSpecifics(object):
 
         """
 
-        return self._attributes
+        attributes = self._attributes
+
+        if isinstance(attributes, LazyDbcMetadata):
+            attributes = attributes.get('attributes')
+            self._attributes = attributes
+
+        if attributes is None:
+            attributes = odict()
+            self._attributes = attributes
+
+        return attributes
 
     @attributes.setter
     def attributes(self, value):
@@ -387,6 +480,9 @@ class DbcSpecifics(object):
 
         """
 
+        if self._attribute_definitions is None:
+            self._attribute_definitions = odict()
+
         return self._attribute_definitions
 
     @property
@@ -396,6 +492,9 @@ class DbcSpecifics(object):
 
         """
 
+        if self._value_tables is None:
+            self._value_tables = odict()
+
         return self._value_tables
 
     @property
@@ -405,7 +504,112 @@ class DbcSpecifics(object):
 
         """
 
-        return self._environment_variables
+        environment_variables = self._environment_variables
+
+        if isinstance(environment_variables, LazyDbcMetadata):
+            environment_variables = environment_variables.get(
+                'environment_variables')
+            self._environment_variables = environment_variables
+
+        if environment_variables is None:
+            environment_variables = odict()
+            self._environment_variables = environment_variables
+
+        return environment_variables
+
+
+class DbcMetadata(object):
+    """Comments, attributes and environment variables of a DBC file. They
+    are parsed from given statements on first access if `metadata` is
+    ``'lazy'``, and are not available if ``'none'``.
+
+    """
+
+    def __init__(self, metadata, statements, definitions):
+        self._metadata = metadata
+        self._statements = statements
+        self._definitions = definitions
+        self._comments = None
+        self._attributes = None
+        self._environment_variables = None
+
+    def create(self, kind, frame_id_dbc=None, name=None):
+        """Returns the lazy metadata of given item, or ``None`` if no
+        metadata is available.
+
+        """
+
+        if self._metadata == 'none':
+            return None
+
+        return LazyDbcMetadata(self, kind, frame_id_dbc, name)
+
+    def _load(self):
+        statements = self._statements
+
+        # Already loaded by another thread.
+        if statements is None:
+            return
+
+        if statements:
+            tokens = Parser().parse('\n'.join(statements))
+        else:
+            tokens = {}
+
+        comments = _load_comments(tokens)
+        attributes = _load_attributes(tokens, self._definitions)
+        self._environment_variables = _load_environment_variables(tokens,
+                                                                  comments,
+                                                                  attributes)
+        self._attributes = attributes
+
+        # Comments are set last, as they mark the metadata as loaded.
+        self._comments = comments
+        self._statements = None
+
+    def get(self, kind, frame_id_dbc, name, value_name):
+        if self._comments is None:
+            self._load()
+
+        comments = self._comments
+        attributes = self._attributes
+
+        if kind == 'signal':
+            if value_name == 'comment':
+                try:
+                    return comments[frame_id_dbc]['signal'][name]
+                except KeyError:
+                    return None
+
+            try:
+                signal_attributes = attributes[frame_id_dbc]['signal'][name]
+            except KeyError:
+                signal_attributes = None
+
+            return DbcSpecifics(signal_attributes, self._definitions)
+        elif kind == 'message':
+            if value_name == 'comment':
+                try:
+                    return comments[frame_id_dbc]['message']
+                except KeyError:
+                    return None
+
+            try:
+                message_attributes = attributes[frame_id_dbc]['message']
+            except KeyError:
+                message_attributes = None
+
+            return DbcSpecifics(message_attributes, self._definitions)
+        elif kind == 'node':
+            if value_name == 'comment':
+                return comments.get(name, None)
+
+            return DbcSpecifics(attributes['node'].get(name, None),
+                                self._definitions)
+        elif value_name == 'attributes':
+            return attributes.get('database', None)
+        else:
+            return self._environment_variables
 
 
 class LongNamesConverter(object):
@@ -448,7 +652,7 @@ def _get_node_name(attributes, name):
     try:
         return attributes['node'][name]['SystemNodeLongSymbol'].value
     except (KeyError, TypeError):
-        return name
+        return intern(name)
 
 
 def _get_environment_variable_name(attributes, name):
@@ -462,11 +666,11 @@ def _dump_version(database):
     return '' if database.version is None else database.version
 
 
-def _dump_nodes(database):
+def _dump_nodes(database, long_names):
     bu = []
 
     for node in database.nodes:
-        bu.append(node.name)
+        bu.append(long_names.node_name(node.name))
 
     return bu
 
@@ -487,8 +691,7 @@ def _dump_value_tables(database):
     return val_table + ['']
 
 
-def _dump_messages(database):
-    bo = []
+def _dump_messages(database, long_names):
 
     def format_mux(signal):
         if signal.is_multiplexer:
@@ -500,13 +703,14 @@ def _dump_messages(database):
 
     def format_receivers(signal):
         if signal.receivers:
-            return ' ' + ','.join(signal.receivers)
+            return ' ' + ','.join([long_names.node_name(receiver)
+                                   for receiver in signal.receivers])
         else:
             return 'Vector__XXX'
 
     def format_senders(message):
         if message.senders:
-            return message.senders[0]
+            return long_names.node_name(message.senders[0])
         else:
             return 'Vector__XXX'
 
@@ -515,7 +719,7 @@ def _dump_messages(database):
         msg.append(
             'BO_ {frame_id} {name}: {length} {senders}'.format(
                 frame_id=get_dbc_frame_id(message),
-                name=message.name,
+                name=long_names.message_name(message),
                 length=message.length,
                 senders=format_senders(message)))
 
@@ -524,7 +728,7 @@ def _dump_messages(database):
                    ' ({scale},{offset})'
                    ' [{minimum}|{maximum}] "{unit}" {receivers}')
             msg.append(fmt.format(
-                name=signal.name,
+                name=long_names.signal_name(signal),
                 mux=format_mux(signal),
                 start=signal.start,
                 length=signal.length,
@@ -537,12 +741,10 @@ def _dump_messages(database):
                 maximum=(0 if signal.maximum is None else signal.maximum),
                 unit='' if signal.unit is None else signal.unit))
 
-        bo.append('\r\n'.join(msg))
-
-    return bo
+        yield '\r\n'.join(msg)
 
 
-def _dump_senders(database):
+def _dump_senders(database, long_names):
     bo_tx_bu = []
 
     for message in database.messages:
@@ -550,19 +752,20 @@ def _dump_senders(database):
             bo_tx_bu.append(
                 'BO_TX_BU_ {frame_id} : {senders};'.format(
                     frame_id=get_dbc_frame_id(message),
-                    senders=','.join(message.senders)))
+                    senders=','.join([long_names.node_name(sender)
+                                      for sender in message.senders])))
 
     return bo_tx_bu
 
 
-def _dump_comments(database):
+def _dump_comments(database, long_names):
     cm = []
 
     for node in database.nodes:
         if node.comment is not None:
             cm.append(
                 'CM_ BU_ {name} "{comment}";'.format(
-                    name=node.name,
+                    name=long_names.node_name(node.name),
                     comment=node.comment.replace('"', '\\"')))
 
     for message in database.messages:
@@ -577,13 +780,13 @@ def _dump_comments(database):
                 cm.append(
                     'CM_ SG_ {frame_id} {name} "{comment}";'.format(
                         frame_id=get_dbc_frame_id(message),
-                        name=signal.name,
+                        name=long_names.signal_name(signal),
                         comment=signal.comment.replace('"', '\\"')))
 
     return cm
 
 
-def _dump_signal_types(database):
+def _dump_signal_types(database, long_names):
     valtype = []
 
     for message in database.messages:
@@ -594,20 +797,15 @@ def _dump_signal_types(database):
             valtype.append(
                 'SIG_VALTYPE_ {} {} : {};'.format(
                     get_dbc_frame_id(message),
-                    signal.name,
+                    long_names.signal_name(signal),
                     FLOAT_LENGTH_TO_SIGNAL_TYPE[signal.length]))
 
     return valtype
 
 
-def _dump_attribute_definitions(database):
+def _dump_attribute_definitions(definitions):
     ba_def = []
 
-    if database.dbc is None:
-        return ba_def
-
-    definitions = database.dbc.attribute_definitions
-
     def get_value(definition, value):
         if definition.minimum is None:
             value = ''
@@ -653,14 +851,9 @@ def _dump_attribute_definitions(database):
     return ba_def
 
 
-def _dump_attribute_definition_defaults(database):
+def _dump_attribute_definition_defaults(definitions):
     ba_def_def = []
 
-    if database.dbc is None:
-        return ba_def_def
-
-    definitions = database.dbc.attribute_definitions
-
     for definition in definitions.values():
         if definition.default_value is not None:
             if definition.type_name in ["STRING", "ENUM"]:
@@ -674,7 +867,7 @@ def _dump_attribute_definition_defaults(database):
     return ba_def_def
 
 
-def _dump_attributes(database):
+def _dump_attributes(database, long_names, definitions):
     ba = []
 
     def get_value(attribute):
@@ -693,43 +886,52 @@ def _dump_attributes(database):
                                                    value=get_value(attribute)))
 
     for node in database.nodes:
-        if node.dbc is not None:
-            if node.dbc.attributes is not None:
-                for attribute in node.dbc.attributes.values():
-                    ba.append(
-                        'BA_ "{name}" {kind} {node_name} {value};'.format(
-                            name=attribute.definition.name,
-                            kind=attribute.definition.kind,
-                            node_name=node.name,
-                            value=get_value(attribute)))
+        name = long_names.node_names.get(node.name)
+
+        for attribute in _get_attributes(node.dbc,
+                                         'SystemNodeLongSymbol',
+                                         None if name is None else node.name,
+                                         definitions):
+            ba.append(
+                'BA_ "{name}" {kind} {node_name} {value};'.format(
+                    name=attribute.definition.name,
+                    kind=attribute.definition.kind,
+                    node_name=long_names.node_name(node.name),
+                    value=get_value(attribute)))
 
     for message in database.messages:
-        if message.dbc is not None:
-            if message.dbc.attributes is not None:
-                for attribute in message.dbc.attributes.values():
-                    ba.append(
-                        'BA_ "{name}" {kind} {frame_id} {value};'.format(
-                            name=attribute.definition.name,
-                            kind=attribute.definition.kind,
-                            frame_id=get_dbc_frame_id(message),
-                            value=get_value(attribute)))
+        name = long_names.message_names.get(id(message))
+
+        for attribute in _get_attributes(message.dbc,
+                                         'SystemMessageLongSymbol',
+                                         None if name is None else message.name,
+                                         definitions):
+            ba.append(
+                'BA_ "{name}" {kind} {frame_id} {value};'.format(
+                    name=attribute.definition.name,
+                    kind=attribute.definition.kind,
+                    frame_id=get_dbc_frame_id(message),
+                    value=get_value(attribute)))
 
         for signal in message.signals[::-1]:
-            if signal.dbc is not None:
-                if signal.dbc.attributes is not None:
-                    for attribute in signal.dbc.attributes.values():
-                        ba.append(
-                            'BA_ "{name}" {kind} {frame_id} {signal_name} {value};'.format(
-                                name=attribute.definition.name,
-                                kind=attribute.definition.kind,
-                                frame_id=get_dbc_frame_id(message),
-                                signal_name=signal.name,
-                                value=get_value(attribute)))
+            name = long_names.signal_names.get(id(signal))
+
+            for attribute in _get_attributes(signal.dbc,
+                                             'SystemSignalLongSymbol',
+                                             None if name is None else signal.name,
+                                             definitions):
+                ba.append(
+                    'BA_ "{name}" {kind} {frame_id} {signal_name} {value};'.format(
+                        name=attribute.definition.name,
+                        kind=attribute.definition.kind,
+                        frame_id=get_dbc_frame_id(message),
+                        signal_name=long_names.signal_name(signal),
+                        value=get_value(attribute)))
 
     return ba
 
 
-def _dump_choices(database):
+def _dump_choices(database, long_names):
     val = []
 
     for message in database.messages:
@@ -740,7 +942,7 @@ def _dump_choices(database):
             val.append(
                 'VAL_ {frame_id} {name} {choices} ;'.format(
                     frame_id=get_dbc_frame_id(message),
-                    name=signal.name,
+                    name=long_names.signal_name(signal),
                     choices=' '.join(['{value} "{text}"'.format(value=value,
                                                                 text=text)
                                       for value, text in signal.choices.items()])))
@@ -748,22 +950,29 @@ def _dump_choices(database):
     return val
 
 
-def _dump_signal_groups(database):
+def _dump_signal_groups(database, long_names):
     sig_group = []
 
     for message in database.messages:
         if message.signal_groups is None:
             continue
 
+        signal_names = {
+            signal.name: long_names.signal_name(signal)
+            for signal in message.signals[::-1]
+        }
+
         for signal_group in message.signal_groups:
-            all_sig_names = list(map(lambda sig: sig.name, message.signals))
-            signal_group.signal_names = list(filter(lambda sig_name: sig_name in all_sig_names, signal_group.signal_names))
             sig_group.append(
                 'SIG_GROUP_ {frame_id} {signal_group_name} {repetitions} : {signal_names};'.format(
                     frame_id=get_dbc_frame_id(message),
                     signal_group_name=signal_group.name,
                     repetitions=signal_group.repetitions,
-                    signal_names=' '.join(signal_group.signal_names)
+                    signal_names=' '.join([
+                        signal_names[name]
+                        for name in signal_group.signal_names
+                        if name in signal_names
+                    ])
                 ))
 
     return sig_group
@@ -818,7 +1027,7 @@ def _create_mux_ranges(multiplexer_ids):
     return ranges
 
 
-def _dump_signal_mux_values(database):
+def _dump_signal_mux_values(database, long_names):
     """Create multiplex entries ("SG_MUL_VAL_") if extended multiplexing
     is used.
 
@@ -830,6 +1039,11 @@ def _dump_signal_mux_values(database):
     sig_mux_values = []
 
     for message in database.messages:
+        signal_names = {
+            signal.name: long_names.signal_name(signal)
+            for signal in message.signals[::-1]
+        }
+
         for signal in message.signals:
             if not signal.multiplexer_ids:
                 continue
@@ -842,8 +1056,9 @@ def _dump_signal_mux_values(database):
             sig_mux_values.append(
                 'SG_MUL_VAL_ {frame_id} {name} {multiplexer} {ranges};'.format(
                     frame_id=get_dbc_frame_id(message),
-                    name=signal.name,
-                    multiplexer=signal.multiplexer_signal,
+                    name=long_names.signal_name(signal),
+                    multiplexer=signal_names.get(signal.multiplexer_signal,
+                                                 signal.multiplexer_signal),
                     ranges=ranges))
 
     return sig_mux_values
@@ -910,7 +1125,7 @@ def _load_attributes(tokens, definitions):
                          definition=definition)
 
     for attribute in tokens.get('BA_', []):
-        name = attribute[1]
+        name = intern(attribute[1])
 
         if len(attribute[2]) > 0:
             item = attribute[2][0]
@@ -1001,18 +1216,19 @@ def _load_environment_variables(tokens, comments, attributes):
 
 def _load_choices(tokens):
     choices = defaultdict(dict)
+    shared_choices = {}
 
     for choice in tokens.get('VAL_', []):
         if len(choice[1]) == 0:
             continue
 
-        od = odict((int(''.join(v[0])), v[1]) for v in choice[3])
+        od = odict((int(''.join(v[0])), intern(v[1])) for v in choice[3])
 
         if len(od) == 0:
             continue
 
         frame_id = int(choice[1][0])
-        choices[frame_id][choice[2]] = od
+        choices[frame_id][choice[2]] = share_choices(od, shared_choices)
 
     return choices
 
@@ -1100,7 +1316,8 @@ def _load_signals(tokens,
                   signal_types,
                   signal_multiplexer_values,
                   frame_id_dbc,
-                  multiplexer_signal):
+                  multiplexer_signal,
+                  metadata):
     signal_to_multiplexer = {}
 
     try:
@@ -1244,9 +1461,21 @@ def _load_signals(tokens,
         except (KeyError, TypeError):
             return None
 
+    def get_comment_and_dbc_specifics(frame_id_dbc, signal):
+        if metadata is None:
+            return (get_comment(frame_id_dbc, signal),
+                    DbcSpecifics(get_attributes(frame_id_dbc, signal),
+                                 definitions))
+        else:
+            lazy_metadata = metadata.create('signal', frame_id_dbc, signal)
+
+            return lazy_metadata, lazy_metadata
+
     signals = []
 
     for signal in tokens:
+        comment, dbc_specifics = get_comment_and_dbc_specifics(frame_id_dbc,
+                                                               signal[1][0])
         signals.append(
             Signal(name=get_signal_name(frame_id_dbc, signal[1][0]),
                    start=int(signal[3]),
@@ -1267,14 +1496,12 @@ def _load_signals(tokens,
                                                              signal[17]),
                                          get_maximum_decimal(signal[15],
                                                              signal[17])),
-                   unit=(None if signal[19] == '' else signal[19]),
+                   unit=(None if signal[19] == '' else intern(signal[19])),
                    spn=get_signal_spn(frame_id_dbc, signal[1][0]),
                    choices=get_choices(frame_id_dbc,
                                        signal[1][0]),
-                   dbc_specifics=DbcSpecifics(get_attributes(frame_id_dbc, signal[1][0]),
-                                              definitions),
-                   comment=get_comment(frame_id_dbc,
-                                       signal[1][0]),
+                   dbc_specifics=dbc_specifics,
+                   comment=comment,
                    is_multiplexer=get_is_multiplexer(signal),
                    multiplexer_ids=get_multiplexer_ids(signal[1],
                                                        multiplexer_signal),
@@ -1295,7 +1522,9 @@ def _load_messages(tokens,
                    signal_multiplexer_values,
                    strict,
                    bus_name,
-                   signal_groups):
+                   signal_groups,
+                   metadata,
+                   refresh):
     """Load messages.
 
     """
@@ -1390,6 +1619,15 @@ def _load_messages(tokens,
         except:
             return None
 
+    def get_comment_and_dbc_specifics(frame_id_dbc):
+        if metadata is None:
+            return (get_comment(frame_id_dbc),
+                    DbcSpecifics(get_attributes(frame_id_dbc), definitions))
+        else:
+            lazy_metadata = metadata.create('message', frame_id_dbc)
+
+            return lazy_metadata, lazy_metadata
+
     messages = []
 
     for message in tokens.get('BO_', []):
@@ -1434,7 +1672,9 @@ def _load_messages(tokens,
                                 signal_types,
                                 signal_multiplexer_values,
                                 frame_id_dbc,
-                                multiplexer_signal)
+                                multiplexer_signal,
+                                metadata)
+        comment, dbc_specifics = get_comment_and_dbc_specifics(frame_id_dbc)
 
         messages.append(
             Message(frame_id=frame_id,
@@ -1444,12 +1684,12 @@ def _load_messages(tokens,
                     senders=senders,
                     send_type=get_send_type(frame_id_dbc),
                     cycle_time=get_cycle_time(frame_id_dbc),
-                    dbc_specifics=DbcSpecifics(get_attributes(frame_id_dbc),
-                                               definitions),
+                    dbc_specifics=dbc_specifics,
                     signals=signals,
-                    comment=get_comment(frame_id_dbc),
+                    comment=comment,
                     strict=strict,
                     protocol=get_protocol(frame_id_dbc),
+                    refresh=refresh,
                     bus_name=bus_name,
                     signal_groups=get_signal_groups(frame_id_dbc)))
 
@@ -1474,133 +1714,165 @@ def _load_bus(attributes):
     return Bus(bus_name, baudrate=bus_baudrate)
 
 
-def _load_nodes(tokens, comments, attributes, definitions):
+def _load_nodes(tokens, comments, attributes, definitions, metadata):
     nodes = None
 
     for token in tokens.get('BU_', []):
-        nodes = [Node(name=_get_node_name(attributes, node),
-                      comment=comments.get(node, None),
-                      dbc_specifics=DbcSpecifics(attributes['node'].get(node, None),
-                                                 definitions))
-                 for node in token[2]]
+        if metadata is None:
+            nodes = [Node(name=_get_node_name(attributes, node),
+                          comment=comments.get(node, None),
+                          dbc_specifics=DbcSpecifics(attributes['node'].get(node, None),
+                                                     definitions))
+                     for node in token[2]]
+        else:
+            nodes = []
+
+            for node in token[2]:
+                lazy_metadata = metadata.create('node', name=node)
+                nodes.append(Node(name=_get_node_name(attributes, node),
+                                  comment=lazy_metadata,
+                                  dbc_specifics=lazy_metadata))
 
     return nodes
 
 
-def get_attribute_definition(database, name, default):
-    if database.dbc is None:
-        database.dbc = DbcSpecifics()
+class LongNames(object):
+    """Short names of nodes, messages and signals with names longer than
+    32 characters, as used in the dumped DBC file. The long names are
+    dumped as attributes.
 
-    if name not in database.dbc.attribute_definitions:
-        database.dbc.attribute_definitions[name] = default
+    """
 
-    return database.dbc.attribute_definitions[name]
+    def __init__(self, database):
+        self.node_names = {}
+        self.message_names = {}
+        self.signal_names = {}
 
+        converter = LongNamesConverter(database)
 
-def get_long_node_name_attribute_definition(database):
-    return get_attribute_definition(database,
-                                    'SystemNodeLongSymbol',
-                                    ATTRIBUTE_DEFINITION_LONG_NODE_NAME)
+        for node in database.nodes:
+            name = converter.convert(node.name)
 
+            if name is not None:
+                self.node_names[node.name] = name
 
-def get_long_message_name_attribute_definition(database):
-    return get_attribute_definition(database,
-                                    'SystemMessageLongSymbol',
-                                    ATTRIBUTE_DEFINITION_LONG_MESSAGE_NAME)
+        converter = LongNamesConverter(database)
 
+        for message in database.messages:
+            name = converter.convert(message.name)
 
-def get_long_signal_name_attribute_definition(database):
-    return get_attribute_definition(database,
-                                    'SystemSignalLongSymbol',
-                                    ATTRIBUTE_DEFINITION_LONG_SIGNAL_NAME)
+            if name is not None:
+                self.message_names[id(message)] = name
 
+        converter = LongNamesConverter(database)
 
-def try_remove_attribute(dbc, name):
-    try:
-        dbc.attributes.pop(name)
-    except (KeyError, AttributeError):
-        pass
+        for message in database.messages:
+            for signal in message.signals:
+                name = converter.convert(signal.name)
 
+                if name is not None:
+                    self.signal_names[id(signal)] = name
 
-def make_node_names_unique(database):
-    converter = LongNamesConverter(database)
+    def node_name(self, name):
+        return self.node_names.get(name, name)
 
-    for node in database.nodes:
-        name = converter.convert(node.name)
-        try_remove_attribute(node.dbc, 'SystemNodeLongSymbol')
+    def message_name(self, message):
+        return self.message_names.get(id(message), message.name)
 
-        if name is None:
-            continue
+    def signal_name(self, signal):
+        return self.signal_names.get(id(signal), signal.name)
 
-        for message in database.messages:
-            for index, sender in enumerate(message.senders):
-                if sender == node.name:
-                    message.senders[index] = name
 
-            for signal in message.signals:
-                for index, receiver in enumerate(signal.receivers):
-                    if receiver == node.name:
-                        signal.receivers[index] = name
+def _get_attribute_definitions(database, long_names):
+    """Returns all attribute definitions to dump, including definitions
+    of long name attributes.
 
-        if node.dbc is None:
-            node.dbc = DbcSpecifics()
+    """
 
-        node.dbc.attributes['SystemNodeLongSymbol'] = Attribute(
-            node.name,
-            get_long_node_name_attribute_definition(database))
-        node.name = name
+    if database.dbc is None:
+        definitions = odict()
+    else:
+        definitions = odict(database.dbc.attribute_definitions)
 
+    for names, definition in [
+            (long_names.node_names, ATTRIBUTE_DEFINITION_LONG_NODE_NAME),
+            (long_names.message_names, ATTRIBUTE_DEFINITION_LONG_MESSAGE_NAME),
+            (long_names.signal_names, ATTRIBUTE_DEFINITION_LONG_SIGNAL_NAME)
+    ]:
+        if names and definition.name not in definitions:
+            definitions[definition.name] = definition
 
-def make_message_names_unique(database):
-    converter = LongNamesConverter(database)
+    return definitions
 
-    for message in database.messages:
-        name = converter.convert(message.name)
-        try_remove_attribute(message.dbc, 'SystemMessageLongSymbol')
 
-        if name is None:
-            continue
+def _get_attributes(dbc, long_name_attribute, long_name, definitions):
+    """Returns given DBC specifics' attributes to dump. Long name
+    attributes are replaced by a new attribute if the name is long.
+
+    """
 
-        if message.dbc is None:
-            message.dbc = DbcSpecifics()
+    attributes = []
 
-        message.dbc.attributes['SystemMessageLongSymbol'] = Attribute(
-            message.name,
-            get_long_message_name_attribute_definition(database))
-        message.name = name
+    if dbc is not None:
+        if dbc.attributes is not None:
+            attributes = [
+                attribute
+                for name, attribute in dbc.attributes.items()
+                if name != long_name_attribute
+            ]
 
+    if long_name is not None:
+        attributes.append(Attribute(long_name,
+                                    definitions[long_name_attribute]))
 
-def make_signal_names_unique(database):
-    converter = LongNamesConverter(database)
+    return attributes
 
-    for message in database.messages:
-        for signal in message.signals:
-            name = converter.convert(signal.name)
-            try_remove_attribute(signal.dbc, 'SystemSignalLongSymbol')
 
-            if name is None:
-                continue
+def _dump_sections(database):
+    """Yields the DBC file contents in sections.
 
-            if signal.dbc is None:
-                signal.dbc = DbcSpecifics()
+    """
 
-            signal.dbc.attributes['SystemSignalLongSymbol'] = Attribute(
-                signal.name,
-                get_long_signal_name_attribute_definition(database))
-            signal.name = name
+    long_names = LongNames(database)
+    definitions = _get_attribute_definitions(database, long_names)
+    bo = _dump_messages(database, long_names)
 
+    yield DBC_HEADER_FMT.format(version=_dump_version(database),
+                                bu=' '.join(_dump_nodes(database, long_names)))
+    yield '\r\n'.join(_dump_value_tables(database))
+    yield '\r\n\r\n'
 
-def make_names_unique(database):
-    """Make message, signal and node names unique and add attributes for
-    their long names.
+    for i, message in enumerate(bo):
+        if i > 0:
+            yield '\r\n\r\n'
 
-    """
+        yield message
+
+    yield '\r\n\r\n'
+
+    for section, separator in [
+            (_dump_senders(database, long_names), '\r\n\r\n\r\n'),
+            (_dump_comments(database, long_names), '\r\n'),
+            (_dump_attribute_definitions(definitions), '\r\n'),
+            (_dump_attribute_definition_defaults(definitions), '\r\n'),
+            (_dump_attributes(database, long_names, definitions), '\r\n'),
+            (_dump_choices(database, long_names), '\r\n'),
+            (_dump_signal_types(database, long_names), '\r\n'),
+            (_dump_signal_groups(database, long_names), '\r\n'),
+            (_dump_signal_mux_values(database, long_names), '\r\n')
+    ]:
+        yield '\r\n'.join(section)
+        yield separator
 
-    make_node_names_unique(database)
-    make_message_names_unique(database)
-    make_signal_names_unique(database)
 
-    return database
+def dump(database, fp):
+    """Write given database in DBC file format to given file-like object
+    `fp`. Sections are written as they are formatted.
+
+    """
+
+    for section in _dump_sections(database):
+        fp.write(section)
 
 
 def dump_string(database):
@@ -1608,37 +1880,7 @@ def dump_string(database):
 
     """
 
-    # Make a deep copy of the database as names and attributes will be
-    # modified for items with long names.
-    database = deepcopy(database)
-
-    database = make_names_unique(database)
-    bu = _dump_nodes(database)
-    val_table = _dump_value_tables(database)
-    bo = _dump_messages(database)
-    bo_tx_bu = _dump_senders(database)
-    cm = _dump_comments(database)
-    signal_types = _dump_signal_types(database)
-    ba_def = _dump_attribute_definitions(database)
-    ba_def_def = _dump_attribute_definition_defaults(database)
-    ba = _dump_attributes(database)
-    val = _dump_choices(database)
-    sig_group = _dump_signal_groups(database)
-    sig_mux_values = _dump_signal_mux_values(database)
-
-    return DBC_FMT.format(version=_dump_version(database),
-                          bu=' '.join(bu),
-                          val_table='\r\n'.join(val_table),
-                          bo='\r\n\r\n'.join(bo),
-                          bo_tx_bu='\r\n'.join(bo_tx_bu),
-                          cm='\r\n'.join(cm),
-                          signal_types='\r\n'.join(signal_types),
-                          ba_def='\r\n'.join(ba_def),
-                          ba_def_def='\r\n'.join(ba_def_def),
-                          ba='\r\n'.join(ba),
-                          val='\r\n'.join(val),
-                          sig_group='\r\n'.join(sig_group),
-                          sig_mux_values='\r\n'.join(sig_mux_values))
+    return ''.join(_dump_sections(database))
 
 
 def get_definitions_dict(definitions, defaults):
@@ -1681,18 +1923,32 @@ def get_definitions_dict(definitions, defaults):
     return result
 
 
-def load_string(string, strict=True):
+def load_string(string, strict=True, metadata='full', refresh=True):
     """Parse given string.
 
+    Comments, attributes and environment variables are parsed on first
+    access if `metadata` is ``'lazy'``, and not at all if ``'none'``.
+
+    Message codecs are not created if `refresh` is ``False``.
+
     """
 
-    tokens = Parser().parse(string)
+    parser = Parser(metadata)
+    tokens = parser.parse(string)
 
     comments = _load_comments(tokens)
     definitions = _load_attribute_definitions(tokens)
     defaults = _load_attribute_definition_defaults(tokens)
     attribute_definitions = get_definitions_dict(definitions, defaults)
     attributes = _load_attributes(tokens, attribute_definitions)
+
+    if metadata == 'full':
+        lazy_metadata = None
+    else:
+        lazy_metadata = DbcMetadata(metadata,
+                                    parser.metadata_statements,
+                                    attribute_definitions)
+
     bus = _load_bus(attributes)
     value_tables = _load_value_tables(tokens)
     choices = _load_choices(tokens)
@@ -1710,11 +1966,26 @@ def load_string(string, strict=True):
                               signal_multiplexer_values,
                               strict,
                               bus.name if bus else None,
-                              signal_groups)
-    nodes = _load_nodes(tokens, comments, attributes, attribute_definitions)
+                              signal_groups,
+                              lazy_metadata,
+                              refresh)
+    nodes = _load_nodes(tokens,
+                        comments,
+                        attributes,
+                        attribute_definitions,
+                        lazy_metadata)
     version = _load_version(tokens)
-    environment_variables = _load_environment_variables(tokens, comments, attributes)
-    dbc_specifics = DbcSpecifics(attributes.get('database', None),
+
+    if lazy_metadata is None:
+        database_attributes = attributes.get('database', None)
+        environment_variables = _load_environment_variables(tokens,
+                                                            comments,
+                                                            attributes)
+    else:
+        database_attributes = lazy_metadata.create('database')
+        environment_variables = database_attributes
+
+    dbc_specifics = DbcSpecifics(database_attributes,
                                  attribute_definitions,
                                  environment_variables,
                                  value_tables)
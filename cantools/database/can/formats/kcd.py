@@ -17,6 +17,8 @@ from ..bus import Bus
 from ..internal_database import InternalDatabase
 from ...utils import start_bit
 from .utils import num
+from .utils import intern
+from .utils import share_choices
 
 
 LOGGER = logging.getLogger(__name__)
@@ -27,6 +29,12 @@ NAMESPACES = {'ns': NAMESPACE}
 
 ROOT_TAG = '{{{}}}NetworkDefinition'.format(NAMESPACE)
 
+NETWORK_DEFINITION_START_TAG = (
+    '<NetworkDefinition'
+    ' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+    ' xmlns="http://kayak.2codeornot2code.org/1.0"'
+    ' xsi:noNamespaceSchemaLocation="Definition.xsd">')
+
 
 def _start_bit(offset, byte_order):
     if byte_order == 'big_endian':
@@ -41,7 +49,7 @@ def _get_node_name_by_id(nodes, node_id):
             return node['name']
 
 
-def _load_signal_element(signal, nodes):
+def _load_signal_element(signal, nodes, shared_choices):
     """Load given signal element and return a signal object.
 
     """
@@ -94,7 +102,7 @@ def _load_signal_element(signal, nodes):
                 intercept = num(value)
                 decimal.offset = Decimal(value)
             elif key == 'unit':
-                unit = value
+                unit = intern(value)
             elif key == 'type':
                 is_signed = (value == 'signed')
                 is_float = (value in ['single', 'double'])
@@ -116,7 +124,7 @@ def _load_signal_element(signal, nodes):
 
         for label in label_set.iterfind('ns:Label', NAMESPACES):
             label_value = int(label.attrib['value'])
-            label_name = label.attrib['name']
+            label_name = intern(label.attrib['name'])
             labels[label_value] = label_name
 
         # TODO: Label groups.
@@ -140,18 +148,18 @@ def _load_signal_element(signal, nodes):
                   minimum=minimum,
                   maximum=maximum,
                   unit=unit,
-                  choices=labels,
+                  choices=share_choices(labels, shared_choices),
                   comment=notes,
                   is_float=is_float,
                   decimal=decimal)
 
 
-def _load_multiplex_element(mux, nodes):
+def _load_multiplex_element(mux, nodes, shared_choices):
     """Load given multiplex elements and its signals and return list of signals.
 
     """
 
-    mux_signal = _load_signal_element(mux, nodes)
+    mux_signal = _load_signal_element(mux, nodes, shared_choices)
     mux_signal.is_multiplexer = True
     signals = [mux_signal]
 
@@ -159,7 +167,9 @@ def _load_multiplex_element(mux, nodes):
         multiplexer_id = mux_group.attrib['count']
 
         for signal_element in mux_group.iterfind('ns:Signal', NAMESPACES):
-            signal = _load_signal_element(signal_element, nodes)
+            signal = _load_signal_element(signal_element,
+                                          nodes,
+                                          shared_choices)
             signal.multiplexer_ids = [int(multiplexer_id)]
             signal.multiplexer_signal = mux_signal.name
             signals.append(signal)
@@ -167,7 +177,12 @@ def _load_multiplex_element(mux, nodes):
     return signals
 
 
-def _load_message_element(message, bus_name, nodes, strict):
+def _load_message_element(message,
+                          bus_name,
+                          nodes,
+                          strict,
+                          shared_choices,
+                          refresh):
     """Load given message element and return a message object.
 
     """
@@ -215,10 +230,10 @@ def _load_message_element(message, bus_name, nodes, strict):
     signals = []
 
     for mux in message.iterfind('ns:Multiplex', NAMESPACES):
-        signals += _load_multiplex_element(mux, nodes)
+        signals += _load_multiplex_element(mux, nodes, shared_choices)
 
     for signal in message.iterfind('ns:Signal', NAMESPACES):
-        signals.append(_load_signal_element(signal, nodes))
+        signals.append(_load_signal_element(signal, nodes, shared_choices))
 
     if length == 'auto':
         if signals:
@@ -239,7 +254,8 @@ def _load_message_element(message, bus_name, nodes, strict):
                    signals=signals,
                    comment=notes,
                    bus_name=bus_name,
-                   strict=strict)
+                   strict=strict,
+                   refresh=refresh)
 
 
 def _indent_xml(element, indent, level=0):
@@ -366,13 +382,12 @@ def _dump_mux_groups(multiplexer_name, signals, node_refs, parent):
                         parent)
 
 
-def _dump_message(message, bus, node_refs):
+def _dump_message(message, node_refs):
     frame_id = '0x{:03X}'.format(message.frame_id)
-    message_element = SubElement(bus,
-                                 'Message',
-                                 id=frame_id,
-                                 name=message.name,
-                                 length=str(message.length))
+    message_element = Element('Message',
+                              id=frame_id,
+                              name=message.name,
+                              length=str(message.length))
 
     if message.cycle_time is not None:
         message_element.set('interval', str(message.cycle_time))
@@ -409,52 +424,91 @@ def _dump_message(message, bus, node_refs):
                          node_refs,
                          SubElement(message_element, 'Signal'))
 
+    return message_element
+
+
+def _element_to_string(element, level):
+    """Returns given element indented for given level in the document,
+    without tail.
+
+    """
+
+    _indent_xml(element, '  ', level)
+    element.tail = None
 
-def _dump_version(version, parent):
-    SubElement(parent, 'Document', version=version)
+    if sys.version_info[0] > 2:
+        return ElementTree.tostring(element, encoding='unicode')
+    else:
+        return ElementTree.tostring(element)
 
 
-def _dump_nodes(nodes, node_refs, parent):
+def _dump_version(version):
+    return Element('Document', version=version)
+
+
+def _dump_nodes(nodes, node_refs):
     for node_id, node in enumerate(nodes, 1):
-        SubElement(parent, 'Node', id=str(node_id), name=node.name)
         node_refs[node.name] = node_id
 
+        yield Element('Node', id=str(node_id), name=node.name)
+
+
+def _dump_messages(messages, node_refs):
+    if not messages:
+        yield '\n  ' + _element_to_string(Element('Bus', name='Bus'), 1)
 
-def _dump_messages(messages, node_refs, parent):
-    bus = SubElement(parent, 'Bus', name='Bus')
+        return
+
+    yield '\n  <Bus name="Bus">'
 
     for message in messages:
-        _dump_message(message, bus, node_refs)
+        yield '\n    ' + _element_to_string(_dump_message(message, node_refs),
+                                            2)
 
+    yield '\n  </Bus>'
 
-def dump_string(database):
-    """Format given database in KCD file format.
+
+def _dump_xml(database):
+    """Yields the KCD file contents, one element at a time.
 
     """
 
     node_refs = {}
 
-    attrib = {
-        'xmlns:xsi': 'http://www.w3.org/2001/XMLSchema-instance',
-        'xmlns': 'http://kayak.2codeornot2code.org/1.0',
-        'xsi:noNamespaceSchemaLocation': 'Definition.xsd'
-    }
-    network_definition = Element('NetworkDefinition', attrib)
+    yield NETWORK_DEFINITION_START_TAG
+    yield '\n  ' + _element_to_string(_dump_version(database.version), 1)
 
-    _dump_version(database.version, network_definition)
-    _dump_nodes(database.nodes, node_refs, network_definition)
-    _dump_messages(database.messages, node_refs, network_definition)
+    for node in _dump_nodes(database.nodes, node_refs):
+        yield '\n  ' + _element_to_string(node, 1)
 
-    _indent_xml(network_definition, '  ')
+    for message in _dump_messages(database.messages, node_refs):
+        yield message
 
-    if sys.version_info[0] > 2:
-        return ElementTree.tostring(network_definition, encoding='unicode')
-    else:
-        return ElementTree.tostring(network_definition)
+    yield '\n</NetworkDefinition>\n'
+
+
+def dump(database, fp):
+    """Write given database in KCD file format to given file-like object
+    `fp`. The XML is written one message at a time, without building
+    the document tree.
+
+    """
+
+    for string in _dump_xml(database):
+        fp.write(string)
+
+
+def dump_string(database):
+    """Format given database in KCD file format.
+
+    """
+
+    return ''.join(_dump_xml(database))
 
 
-def load_string(string, strict=True):
-    """Parse given KCD format string.
+def load_string(string, strict=True, refresh=True):
+    """Parse given KCD format string. Message codecs are not created if
+    `refresh` is ``False``.
 
     """
 
@@ -469,6 +523,7 @@ def load_string(string, strict=True):
     nodes = [node.attrib for node in root.iterfind('./ns:Node', NAMESPACES)]
     buses = []
     messages = []
+    shared_choices = {}
 
     try:
         document = root.find('ns:Document', NAMESPACES)
@@ -485,7 +540,9 @@ def load_string(string, strict=True):
             messages.append(_load_message_element(message,
                                                   bus_name,
                                                   nodes,
-                                                  strict))
+                                                  strict,
+                                                  shared_choices,
+                                                  refresh))
 
     return InternalDatabase(messages,
                             [
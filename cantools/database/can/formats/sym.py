@@ -582,7 +582,8 @@ def _load_message(frame_id,
                   message_section_tokens,
                   signals,
                   enums,
-                  strict):
+                  strict,
+                  refresh):
     #print(message_tokens)
     # Default values.
     name = message_tokens[1]
@@ -616,7 +617,8 @@ def _load_message(frame_id,
                                                  enums),
                    comment=comment,
                    bus_name=None,
-                   strict=strict)
+                   strict=strict,
+                   refresh=refresh)
 
 
 def _parse_message_frame_ids(message):
@@ -639,7 +641,12 @@ def _parse_message_frame_ids(message):
     return frame_ids, is_extended_frame(message[2])
 
 
-def _load_message_section(section_name, tokens, signals, enums, strict):
+def _load_message_section(section_name,
+                          tokens,
+                          signals,
+                          enums,
+                          strict,
+                          refresh):
     def has_frame_id(message):
         return 'ID' in message[3]
 
@@ -659,16 +666,32 @@ def _load_message_section(section_name, tokens, signals, enums, strict):
                                     message_section_tokens,
                                     signals,
                                     enums,
-                                    strict)
+                                    strict,
+                                    refresh)
             messages.append(message)
 
     return messages
 
 
-def _load_messages(tokens, signals, enums, strict):
-    messages = _load_message_section('{SEND}', tokens, signals, enums, strict)
-    messages += _load_message_section('{RECEIVE}', tokens, signals, enums, strict)
-    messages += _load_message_section('{SENDRECEIVE}', tokens, signals, enums, strict)
+def _load_messages(tokens, signals, enums, strict, refresh):
+    messages = _load_message_section('{SEND}',
+                                     tokens,
+                                     signals,
+                                     enums,
+                                     strict,
+                                     refresh)
+    messages += _load_message_section('{RECEIVE}',
+                                      tokens,
+                                      signals,
+                                      enums,
+                                      strict,
+                                      refresh)
+    messages += _load_message_section('{SENDRECEIVE}',
+                                      tokens,
+                                      signals,
+                                      enums,
+                                      strict,
+                                      refresh)
 
     return messages
 
@@ -677,8 +700,9 @@ def _load_version(tokens):
     return tokens[1][2]
 
 
-def load_string(string, strict=True):
-    """Parse given string.
+def load_string(string, strict=True, refresh=True):
+    """Parse given string. Message codecs are not created if `refresh`
+    is ``False``.
 
     """
 
@@ -690,7 +714,7 @@ def load_string(string, strict=True):
     version = _load_version(tokens)
     enums = _load_enums(tokens)
     signals = _load_signals(tokens, enums)
-    messages = _load_messages(tokens, signals, enums, strict)
+    messages = _load_messages(tokens, signals, enums, strict, refresh)
 
     return InternalDatabase(messages,
                             [],
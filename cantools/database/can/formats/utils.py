@@ -1,3 +1,12 @@
+from collections import OrderedDict as odict
+
+try:
+    from sys import intern
+except ImportError:
+    # Python 2 has intern() as a builtin.
+    intern = intern
+
+
 def num(number_as_string):
     """Convert given string to an integer or a float.
 
@@ -9,3 +18,36 @@ def num(number_as_string):
         return float(number_as_string)
     else:
         raise ValueError('Expected integer or floating point number.')
+
+
+class Choices(odict):
+    """An ordered dictionary mapping signal values to enumerated
+    choices, shared by all signals with equal choices. It is never
+    modified, as :attr:`~cantools.database.can.Signal.choices` gives
+    each signal its own copy when accessed.
+
+    """
+
+    __slots__ = ()
+
+
+def share_choices(choices, shared_choices):
+    """Returns a :class:`Choices` equal to given `choices`, that is
+    shared with all other signals with equal choices. Equal
+    choices are looked up and stored in the dictionary
+    `shared_choices`.
+
+    """
+
+    if not choices:
+        return choices
+
+    key = tuple(choices.items())
+
+    try:
+        return shared_choices[key]
+    except KeyError:
+        choices = Choices(choices)
+        shared_choices[key] = choices
+
+        return choices
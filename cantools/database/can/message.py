@@ -1,16 +1,15 @@
 # A CAN message.
 
-import binascii
-from copy import deepcopy
-
 from ..utils import format_or
 from ..utils import start_bit
 from ..utils import encode_data
+from ..utils import encoded_to_bytes
 from ..utils import decode_data
 from ..utils import create_encode_decode_formats
 from ..errors import Error
 from ..errors import EncodeError
 from ..errors import DecodeError
+from .metadata import LazyDbcMetadata
 
 
 class Message(object):
@@ -20,8 +19,31 @@ class Message(object):
     If `strict` is ``True`` an exception is raised if any signals are
     overlapping or if they don't fit in the message.
 
+    If `refresh` is ``False`` the codecs are not created, and
+    :meth:`.refresh()` must be called before the message is encoded
+    or decoded.
+
     """
 
+    __slots__ = (
+        '_frame_id',
+        '_is_extended_frame',
+        '_name',
+        '_length',
+        '_signals',
+        '_comment',
+        '_senders',
+        '_send_type',
+        '_cycle_time',
+        '_dbc',
+        '_bus_name',
+        '_signal_groups',
+        '_codecs',
+        '_signal_tree',
+        '_strict',
+        '_protocol'
+    )
+
     def __init__(self,
                  frame_id,
                  name,
@@ -36,7 +58,8 @@ class Message(object):
                  bus_name=None,
                  signal_groups=None,
                  strict=True,
-                 protocol=None):
+                 protocol=None,
+                 refresh=True):
         frame_id_bit_length = frame_id.bit_length()
 
         if is_extended_frame:
@@ -66,7 +89,9 @@ class Message(object):
         self._signal_tree = None
         self._strict = strict
         self._protocol = protocol
-        self.refresh()
+
+        if refresh:
+            self.refresh()
 
     def _create_codec(self, parent_signal=None, multiplexer_id=None):
         """Create a codec of all signals with given parent signal. This is a
@@ -103,8 +128,9 @@ class Message(object):
                 # enumeration. Here we ensure that any named
                 # multiplexer is included, even if it has no child
                 # signals.
-                if signal.choices:
-                    children_ids.update(signal.choices.keys())
+                # Shared choices are not copied, see Signal.choices.
+                if signal._choices:
+                    children_ids.update(signal._choices.keys())
 
                 for child_id in children_ids:
                     codec = self._create_codec(signal.name, child_id)
@@ -222,7 +248,13 @@ class Message(object):
 
         """
 
-        return self._comment
+        comment = self._comment
+
+        if isinstance(comment, LazyDbcMetadata):
+            comment = comment.get('comment')
+            self._comment = comment
+
+        return comment
 
     @comment.setter
     def comment(self, value):
@@ -258,7 +290,13 @@ class Message(object):
 
         """
 
-        return self._dbc
+        dbc = self._dbc
+
+        if isinstance(dbc, LazyDbcMetadata):
+            dbc = dbc.get('dbc')
+            self._dbc = dbc
+
+        return dbc
 
     @dbc.setter
     def dbc(self, value):
@@ -739,10 +777,7 @@ class Message(object):
         if padding:
             encoded |= padding_mask
 
-        encoded |= (0x80 << (8 * self._length))
-        encoded = hex(encoded)[4:].rstrip('L')
-
-        return binascii.unhexlify(encoded)[:self._length]
+        return encoded_to_bytes(encoded, self._length)
 
     def _decode(self, node, data, decode_choices, scaling):
         decoded = decode_data(data,
@@ -810,68 +845,98 @@ class Message(object):
 
         return bool(self._codecs['multiplexers'])
 
-    def _check_signal(self, message_bits, signal):
-        signal_bits = signal.length * [signal.name]
+    def _get_signal_bits(self, signal):
+        """Returns the bits of given signal in the message as an
+        integer, with the first bit in the message as most significant
+        bit.
 
-        if signal.byte_order == 'big_endian':
-            padding = start_bit(signal) * [None]
-            signal_bits = padding + signal_bits
-        else:
-            signal_bits += signal.start * [None]
-
-            if len(signal_bits) < len(message_bits):
-                padding = (len(message_bits) - len(signal_bits)) * [None]
-                reversed_signal_bits = padding + signal_bits
-            else:
-                reversed_signal_bits = signal_bits
+        """
 
-            signal_bits = []
+        number_of_bits = (8 * self._length)
 
-            for i in range(0, len(reversed_signal_bits), 8):
-                signal_bits = reversed_signal_bits[i:i + 8] + signal_bits
+        if signal.byte_order == 'big_endian':
+            start = start_bit(signal)
+        else:
+            start = signal.start
 
         # Check that the signal fits in the message.
-        if len(signal_bits) > len(message_bits):
+        if start + signal.length > number_of_bits:
             raise Error(
                 'The signal {} does not fit in message {}.'.format(
                     signal.name,
                     self.name))
 
+        signal_bits = ((1 << signal.length) - 1)
+
+        if signal.byte_order == 'big_endian':
+            signal_bits <<= (number_of_bits - start - signal.length)
+        else:
+            signal_bits <<= start
+            signal_bits = int.from_bytes(
+                signal_bits.to_bytes(self._length, 'little'),
+                'big')
+
+        return signal_bits
+
+    def _check_signal(self, message_bits, owners, signal):
+        signal_bits = self._get_signal_bits(signal)
+        overlapping_bits = (message_bits & signal_bits)
+
         # Check that the signal does not overlap with other
-        # signals.
-        for offset, signal_bit in enumerate(signal_bits):
-            if signal_bit is not None:
-                if message_bits[offset] is not None:
-                    raise Error(
-                        'The signals {} and {} are overlapping in message {}.'.format(
-                            signal.name,
-                            message_bits[offset],
-                            self.name))
-
-                message_bits[offset] = signal.name
-
-    def _check_mux(self, message_bits, mux):
+        # signals. The first overlapping bit in the message is
+        # reported, and the owner is the signal added last.
+        if overlapping_bits:
+            overlapping_bit = (1 << (overlapping_bits.bit_length() - 1))
+
+            for name, bits in reversed(owners):
+                if bits & overlapping_bit:
+                    break
+
+            raise Error(
+                'The signals {} and {} are overlapping in message {}.'.format(
+                    signal.name,
+                    name,
+                    self.name))
+
+        owners.append((signal.name, signal_bits))
+
+        return (message_bits | signal_bits)
+
+    def _check_mux(self, message_bits, owners, signals, mux):
         signal_name, children = list(mux.items())[0]
-        self._check_signal(message_bits,
-                           self.get_signal_by_name(signal_name))
-        children_message_bits = deepcopy(message_bits)
+        message_bits = self._check_signal(message_bits,
+                                          owners,
+                                          signals[signal_name])
+        children_message_bits = message_bits
+        number_of_owners = len(owners)
+        children_owners = []
 
         for multiplexer_id in sorted(children):
             child_tree = children[multiplexer_id]
-            child_message_bits = deepcopy(children_message_bits)
-            self._check_signal_tree(child_message_bits, child_tree)
+            message_bits |= self._check_signal_tree(children_message_bits,
+                                                    owners,
+                                                    signals,
+                                                    child_tree)
+            children_owners += owners[number_of_owners:]
+            del owners[number_of_owners:]
 
-            for i, child_bit in enumerate(child_message_bits):
-                if child_bit is not None:
-                    message_bits[i] = child_bit
+        owners += children_owners
 
-    def _check_signal_tree(self, message_bits, signal_tree):
+        return message_bits
+
+    def _check_signal_tree(self, message_bits, owners, signals, signal_tree):
         for signal_name in signal_tree:
             if isinstance(signal_name, dict):
-                self._check_mux(message_bits, signal_name)
+                message_bits = self._check_mux(message_bits,
+                                               owners,
+                                               signals,
+                                               signal_name)
             else:
-                self._check_signal(message_bits,
-                                   self.get_signal_by_name(signal_name))
+                message_bits = self._check_signal(message_bits,
+                                                  owners,
+                                                  signals[signal_name])
+
+        return message_bits
 
     def _check_signal_lengths(self):
         for signal in self._signals:
@@ -891,18 +956,30 @@ class Message(object):
         argument overrides the value of the same argument passed to
         the constructor.
 
+        The new codecs are created and checked before they replace the
+        current ones, so :meth:`.encode()` and :meth:`.decode()` called
+        from other threads use either the old or the new codecs.
+
         """
 
         self._check_signal_lengths()
-        self._codecs = self._create_codec()
-        self._signal_tree = self._create_signal_tree(self._codecs)
+        codecs = self._create_codec()
+        signal_tree = self._create_signal_tree(codecs)
 
         if strict is None:
             strict = self._strict
 
         if strict:
-            message_bits = 8 * self.length * [None]
-            self._check_signal_tree(message_bits, self.signal_tree)
+            signals = {}
+
+            # The first signal with given name, as get_signal_by_name().
+            for signal in reversed(self._signals):
+                signals[signal.name] = signal
+
+            self._check_signal_tree(0, [], signals, signal_tree)
+
+        self._codecs = codecs
+        self._signal_tree = signal_tree
 
     def __repr__(self):
         return "message('{}', 0x{:x}, {}, {}, {})".format(
@@ -910,4 +987,4 @@ class Message(object):
             self._frame_id,
             self._is_extended_frame,
             self._length,
-            "'" + self._comment + "'" if self._comment is not None else None)
+            "'" + self.comment + "'" if self.comment is not None else None)
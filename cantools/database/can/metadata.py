@@ -0,0 +1,30 @@
+# Metadata loaded on first access.
+
+class LazyDbcMetadata(object):
+    """The metadata of a node, message, signal or database in a DBC file,
+    for example its comment and DBC specifics, parsed on first access.
+
+    The item holds this object instead of the metadata until the
+    metadata is accessed, and then replaces it with the value returned
+    by :meth:`.get()`.
+
+    """
+
+    __slots__ = ('_metadata', '_kind', '_frame_id_dbc', '_name')
+
+    def __init__(self, metadata, kind, frame_id_dbc, name):
+        self._metadata = metadata
+        self._kind = kind
+        self._frame_id_dbc = frame_id_dbc
+        self._name = name
+
+    def get(self, name):
+        """Returns the metadata value `name`, for example ``'comment'`` or
+        ``'dbc'``.
+
+        """
+
+        return self._metadata.get(self._kind,
+                                  self._frame_id_dbc,
+                                  self._name,
+                                  name)
@@ -1,10 +1,15 @@
 # A CAN bus node (or Board unit)
 
+from .metadata import LazyDbcMetadata
+
+
 class Node(object):
     """An NODE on the CAN bus.
 
     """
 
+    __slots__ = ('_name', '_comment', '_dbc')
+
     def __init__(self,
                  name,
                  comment,
@@ -31,7 +36,13 @@ class Node(object):
 
         """
 
-        return self._comment
+        comment = self._comment
+
+        if isinstance(comment, LazyDbcMetadata):
+            comment = comment.get('comment')
+            self._comment = comment
+
+        return comment
 
     @comment.setter
     def comment(self, value):
@@ -43,7 +54,13 @@ class Node(object):
 
         """
 
-        return self._dbc
+        dbc = self._dbc
+
+        if isinstance(dbc, LazyDbcMetadata):
+            dbc = dbc.get('dbc')
+            self._dbc = dbc
+
+        return dbc
 
     @dbc.setter
     def dbc(self, value):
@@ -52,4 +69,4 @@ class Node(object):
     def __repr__(self):
         return "node('{}', {})".format(
             self._name,
-            "'" + self._comment + "'" if self._comment is not None else None)
+            "'" + self.comment + "'" if self.comment is not None else None)
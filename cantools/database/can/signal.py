@@ -1,5 +1,11 @@
 # A CAN signal.
 
+from collections import OrderedDict
+
+from .metadata import LazyDbcMetadata
+from .formats.utils import Choices
+
+
 class Decimal(object):
     """Holds the same values as
     :attr:`~cantools.database.can.Signal.scale`,
@@ -11,6 +17,8 @@ class Decimal(object):
 
     """
 
+    __slots__ = ('_scale', '_offset', '_minimum', '_maximum')
+
     def __init__(self, scale=None, offset=None, minimum=None, maximum=None):
         self._scale = scale
         self._offset = offset
@@ -104,6 +112,30 @@ class Signal(object):
 
     """
 
+    __slots__ = (
+        '_name',
+        '_start',
+        '_length',
+        '_byte_order',
+        '_is_signed',
+        '_initial',
+        '_scale',
+        '_offset',
+        '_minimum',
+        '_maximum',
+        '_decimal',
+        '_unit',
+        '_choices',
+        '_dbc',
+        '_comment',
+        '_receivers',
+        '_is_multiplexer',
+        '_multiplexer_ids',
+        '_multiplexer_signal',
+        '_is_float',
+        '_spn'
+    )
+
     def __init__(self,
                  name,
                  start,
@@ -136,12 +168,12 @@ class Signal(object):
         self._offset = offset
         self._minimum = minimum
         self._maximum = maximum
-        self._decimal = Decimal() if decimal is None else decimal
+        self._decimal = decimal
         self._unit = unit
         self._choices = choices
         self._dbc = dbc_specifics
         self._comment = comment
-        self._receivers = [] if receivers is None else receivers
+        self._receivers = receivers if receivers else None
         self._is_multiplexer = is_multiplexer
         self._multiplexer_ids = multiplexer_ids
         self._multiplexer_signal = multiplexer_signal
@@ -295,6 +327,9 @@ class Signal(object):
 
         """
 
+        if self._decimal is None:
+            self._decimal = Decimal()
+
         return self._decimal
 
     @property
@@ -314,8 +349,16 @@ class Signal(object):
         """A dictionary mapping signal values to enumerated choices, or
         ``None`` if unavailable.
 
+        Signals loaded from a database file with equal choices share
+        the same dictionary until their choices are accessed, so
+        modifying the choices of one signal never modifies the choices
+        of other signals.
+
         """
 
+        if isinstance(self._choices, Choices):
+            self._choices = OrderedDict(self._choices)
+
         return self._choices
 
     @property
@@ -324,7 +367,13 @@ class Signal(object):
 
         """
 
-        return self._dbc
+        dbc = self._dbc
+
+        if isinstance(dbc, LazyDbcMetadata):
+            dbc = dbc.get('dbc')
+            self._dbc = dbc
+
+        return dbc
 
     @dbc.setter
     def dbc(self, value):
@@ -336,7 +385,13 @@ class Signal(object):
 
         """
 
-        return self._comment
+        comment = self._comment
+
+        if isinstance(comment, LazyDbcMetadata):
+            comment = comment.get('comment')
+            self._comment = comment
+
+        return comment
 
     @comment.setter
     def comment(self, value):
@@ -348,6 +403,9 @@ class Signal(object):
 
         """
 
+        if self._receivers is None:
+            self._receivers = []
+
         return self._receivers
 
     @property
@@ -403,7 +461,7 @@ class Signal(object):
         self._spn = value
 
     def choice_string_to_number(self, string):
-        for choice_number, choice_string in self.choices.items():
+        for choice_number, choice_string in self._choices.items():
             if choice_string == string:
                 return choice_number
 
@@ -431,4 +489,4 @@ class Signal(object):
             self._multiplexer_ids,
             choices,
             self._spn,
-            "'" + self._comment + "'" if self._comment is not None else None)
+            "'" + self.comment + "'" if self.comment is not None else None)
@@ -6,6 +6,21 @@ class Data(object):
 
     """
 
+    __slots__ = (
+        '_name',
+        '_start',
+        '_length',
+        '_byte_order',
+        '_scale',
+        '_offset',
+        '_minimum',
+        '_maximum',
+        '_unit',
+        '_choices',
+        'is_float',
+        'is_signed'
+    )
+
     def __init__(self,
                  name,
                  start,
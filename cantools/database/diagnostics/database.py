@@ -1,6 +1,7 @@
 import logging
 
 from .formats import cdd
+from ..errors import DecodeError
 from ...compat import fopen
 
 
@@ -96,6 +97,78 @@ class Database(object):
 
         return self._identifier_to_did[identifier]
 
+    def decode_dids(self, responses, decode_choices=True, scaling=True):
+        """Decode given iterable of ReadDataByIdentifier positive responses
+        `responses`. Each response starts with the service identifier
+        0x62, followed by one or more DID identifiers and DID
+        data. Returns a list with a dictionary of DID names and decoded
+        data for each response.
+
+        The data of each DID in all responses is decoded with one call
+        to :meth:`~cantools.database.diagnostics.Did.decode_many()`.
+
+        >>> db.decode_dids([b'\\x62\\x00\\x90\\x01\\x02', b'\\x62\\x00\\x90\\x03\\x04'])
+        [{'Foo': {'Bar': 1, 'Fum': 2}}, {'Foo': {'Bar': 3, 'Fum': 4}}]
+
+        """
+
+        # DIDs and data index of each response, and data of each DID.
+        response_dids = []
+        did_datas = {}
+
+        for response in responses:
+            if len(response) == 0 or response[0] != 0x62:
+                raise DecodeError(
+                    'expected ReadDataByIdentifier positive response 0x62, '
+                    'but got {}'.format(bytes(response[:1])))
+
+            dids = []
+            offset = 1
+
+            while offset < len(response):
+                if offset + 2 > len(response):
+                    raise DecodeError(
+                        'expected a 2 bytes DID identifier, but got {}'.format(
+                            bytes(response[offset:])))
+
+                identifier = ((response[offset] << 8) | response[offset + 1])
+
+                try:
+                    did = self._identifier_to_did[identifier]
+                except KeyError:
+                    raise DecodeError(
+                        'invalid DID identifier 0x{:04x}'.format(identifier))
+
+                offset += 2
+                data = response[offset:offset + did.length]
+
+                if len(data) < did.length:
+                    raise DecodeError(
+                        "expected {} bytes of DID '{}' data, but got {}".format(
+                            did.length,
+                            did.name,
+                            len(data)))
+
+                offset += did.length
+                datas = did_datas.setdefault(did, [])
+                dids.append((did, len(datas)))
+                datas.append(data)
+
+            response_dids.append(dids)
+
+        decoded_datas = {
+            did: did.decode_many(datas, decode_choices, scaling)
+            for did, datas in did_datas.items()
+        }
+
+        return [
+            {
+                did.name: decoded_datas[did][index]
+                for did, index in dids
+            }
+            for dids in response_dids
+        ]
+
     def refresh(self):
         """Refresh the internal database state.
 
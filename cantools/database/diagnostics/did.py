@@ -1,10 +1,9 @@
 # A DID.
 
-import binascii
-
-from ..utils import encode_data
-from ..utils import decode_data
-from ..utils import create_encode_decode_formats
+from ..utils import encode_segments
+from ..utils import decode_segments
+from ..utils import decode_segments_many
+from ..utils import create_segments
 
 
 class Did(object):
@@ -90,14 +89,10 @@ class Did(object):
 
         """
 
-        encoded = encode_data(data,
-                              self._codec['datas'],
-                              self._codec['formats'],
-                              scaling)
-        encoded |= (0x80 << (8 * self._length))
-        encoded = hex(encoded)[4:].rstrip('L')
-
-        return binascii.unhexlify(encoded)[:self._length]
+        return encode_segments(data,
+                               self._codec['segments'],
+                               self._length,
+                               scaling)
 
     def decode(self, data, decode_choices=True, scaling=True):
         """Decode given data as a DID of this type.
@@ -113,21 +108,43 @@ class Did(object):
 
         """
 
-        return decode_data(data[:self._length],
-                           self._codec['datas'],
-                           self._codec['formats'],
-                           decode_choices,
-                           scaling)
+        return decode_segments(data[:self._length],
+                               self._codec['datas'],
+                               self._codec['segments'],
+                               decode_choices,
+                               scaling)
+
+    def decode_many(self, datas, decode_choices=True, scaling=True):
+        """Decode each data in given iterable `datas` as a DID of this
+        type and return a list of decoded DIDs, in the same order as
+        `datas`. The same as calling :meth:`.decode()` for each data,
+        but the segments and datas of this DID are looked up once for
+        all datas.
+
+        >>> foo = db.get_did_by_name('Foo')
+        >>> foo.decode_many([b'\\x01\\x45\\x23\\x00\\x11', b'\\x02\\x45\\x23\\x00\\x11'])
+        [{'Bar': 1, 'Fum': 5.0}, {'Bar': 2, 'Fum': 5.0}]
+
+        """
+
+        return decode_segments_many(datas,
+                                    self._length,
+                                    self._codec['datas'],
+                                    self._codec['segments'],
+                                    decode_choices,
+                                    scaling)
 
     def refresh(self):
         """Refresh the internal DID state.
 
+        Only the bytes used by the datas are encoded and decoded, so
+        long DIDs with few datas are handled efficiently.
+
         """
 
         self._codec = {
             'datas': self._datas,
-            'formats': create_encode_decode_formats(self._datas,
-                                                    self._length)
+            'segments': create_segments(self._datas, self._length)
         }
 
     def __repr__(self):
@@ -18,6 +18,15 @@ Formats = namedtuple('Formats',
                      ])
 
 
+Segment = namedtuple('Segment',
+                     [
+                         'begin',
+                         'end',
+                         'datas',
+                         'formats'
+                     ])
+
+
 def format_or(items):
     items = [str(item) for item in items]
 
@@ -63,8 +72,9 @@ def _encode_field(field, data, scaling):
 
 def _decode_field(field, value, decode_choices, scaling):
     if decode_choices:
+        # Shared signal choices are not copied, see Signal.choices.
         try:
-            return field.choices[value]
+            return field._choices[value]
         except (KeyError, TypeError):
             pass
 
@@ -82,18 +92,36 @@ def encode_data(data, fields, formats, scaling):
         field.name: _encode_field(field, data, scaling)
         for field in fields
     }
-    big_packed = formats.big_endian.pack(unpacked)
-    little_packed = formats.little_endian.pack(unpacked)[::-1]
-    packed_union = int(binascii.hexlify(big_packed), 16)
-    packed_union |= int(binascii.hexlify(little_packed), 16)
+    packed_union = 0
+
+    if formats.big_endian is not None:
+        packed_union |= int.from_bytes(formats.big_endian.pack(unpacked),
+                                       'big')
+
+    if formats.little_endian is not None:
+        packed_union |= int.from_bytes(formats.little_endian.pack(unpacked),
+                                       'little')
 
     return packed_union
 
 
-def decode_data(data, fields, formats, decode_choices, scaling):
-    unpacked = formats.big_endian.unpack(bytes(data))
-    unpacked.update(formats.little_endian.unpack(bytes(data[::-1])))
+def encoded_to_bytes(encoded, length):
+    """Convert given encoded data integer `encoded` to `length` bytes.
+
+    """
 
+    return encoded.to_bytes(length, 'big')
+
+
+def _unpack_data(data, formats, unpacked):
+    if formats.big_endian is not None:
+        unpacked.update(formats.big_endian.unpack(data))
+
+    if formats.little_endian is not None:
+        unpacked.update(formats.little_endian.unpack(data[::-1]))
+
+
+def _decode_fields(fields, unpacked, decode_choices, scaling):
     return {
         field.name: _decode_field(field,
                                   unpacked[field.name],
@@ -103,8 +131,108 @@ def decode_data(data, fields, formats, decode_choices, scaling):
     }
 
 
-def create_encode_decode_formats(datas, number_of_bytes):
+def decode_data(data, fields, formats, decode_choices, scaling):
+    unpacked = {}
+    _unpack_data(bytes(data), formats, unpacked)
+
+    return _decode_fields(fields, unpacked, decode_choices, scaling)
+
+
+def encode_segments(data, segments, length, scaling):
+    """Encode given data dictionary `data` as `length` bytes. Only the
+    byte ranges of given segments `segments` are encoded, all other
+    bytes are zero.
+
+    """
+
+    encoded = bytearray(length)
+
+    for segment in segments:
+        value = encode_data(data, segment.datas, segment.formats, scaling)
+        encoded[segment.begin:segment.end] = value.to_bytes(
+            segment.end - segment.begin,
+            'big')
+
+    return bytes(encoded)
+
+
+def decode_segments(data, fields, segments, decode_choices, scaling):
+    """Decode the byte ranges of given segments `segments` in `data`.
+
+    """
+
+    data = bytes(data)
+    unpacked = {}
+
+    for segment in segments:
+        _unpack_data(data[segment.begin:segment.end],
+                     segment.formats,
+                     unpacked)
+
+    return _decode_fields(fields, unpacked, decode_choices, scaling)
+
+
+def decode_segments_many(datas,
+                         length,
+                         fields,
+                         segments,
+                         decode_choices,
+                         scaling):
+    """Decode the byte ranges of given segments `segments` in the first
+    `length` bytes of each data in `datas`. The segments are unpacked
+    segment by segment for all datas, and the choices, scale and
+    offset of each field are looked up once for all datas.
+
+    """
+
+    datas = [bytes(data[:length]) for data in datas]
+    unpacked_datas = [{} for _ in datas]
+
+    for begin, end, _, formats in segments:
+        for data, unpacked in zip(datas, unpacked_datas):
+            _unpack_data(data[begin:end], formats, unpacked)
+
+    decoders = []
+
+    for field in fields:
+        if decode_choices and field.choices:
+            choices = field.choices
+        else:
+            choices = None
+
+        if scaling:
+            decoders.append((field.name, choices, field.scale, field.offset))
+        else:
+            decoders.append((field.name, choices, None, None))
+
+    decoded_datas = []
+
+    for unpacked in unpacked_datas:
+        decoded = {}
+
+        for name, choices, scale, offset in decoders:
+            value = unpacked[name]
+
+            if choices is not None and value in choices:
+                decoded[name] = choices[value]
+            elif scale is None:
+                decoded[name] = value
+            else:
+                decoded[name] = (scale * value + offset)
+
+        decoded_datas.append(decoded)
+
+    return decoded_datas
+
+
+def create_encode_decode_formats(datas, number_of_bytes, offset=0):
+    """Create formats for given datas `datas` in `number_of_bytes` bytes
+    starting at byte `offset`.
+
+    """
+
     format_length = (8 * number_of_bytes)
+    bit_offset = (8 * offset)
 
     def get_format_string_type(data):
         if data.is_float:
@@ -139,6 +267,15 @@ def create_encode_decode_formats(datas, number_of_bytes):
         except ValueError:
             return 0
 
+    def compile_format(fmt, names):
+        if not names:
+            return None
+
+        try:
+            return bitstruct.c.compile(fmt, names)
+        except Exception:
+            return bitstruct.compile(fmt, names)
+
     def create_big():
         items = []
         start = 0
@@ -147,13 +284,14 @@ def create_encode_decode_formats(datas, number_of_bytes):
             if data.byte_order == 'little_endian':
                 continue
 
-            padding_length = (start_bit(data) - start)
+            data_start = (start_bit(data) - bit_offset)
+            padding_length = (data_start - start)
 
             if padding_length > 0:
                 items.append(padding_item(padding_length))
 
             items.append(data_item(data))
-            start = (start_bit(data) + data.length)
+            start = (data_start + data.length)
 
         if start < format_length:
             length = format_length - start
@@ -169,13 +307,14 @@ def create_encode_decode_formats(datas, number_of_bytes):
             if data.byte_order == 'big_endian':
                 continue
 
-            padding_length = end - (data.start + data.length)
+            data_start = (data.start - bit_offset)
+            padding_length = end - (data_start + data.length)
 
             if padding_length > 0:
                 items.append(padding_item(padding_length))
 
             items.append(data_item(data))
-            end = data.start
+            end = data_start
 
         if end > 0:
             items.append(padding_item(end))
@@ -192,16 +331,58 @@ def create_encode_decode_formats(datas, number_of_bytes):
     big_fmt, big_padding_mask, big_names = create_big()
     little_fmt, little_padding_mask, little_names = create_little()
 
-    try:
-        big_compiled = bitstruct.c.compile(big_fmt, big_names)
-    except Exception as e:
-        big_compiled = bitstruct.compile(big_fmt, big_names)
 
-    try:
-        little_compiled = bitstruct.c.compile(little_fmt, little_names)
-    except Exception as e:
-        little_compiled = bitstruct.compile(little_fmt, little_names)
-
-    return Formats(big_compiled,
-                   little_compiled,
+    # Formats without any fields are None, as there is nothing to
+    # encode or decode.
+    return Formats(compile_format(big_fmt, big_names),
+                   compile_format(little_fmt, little_names),
                    big_padding_mask & little_padding_mask)
+
+
+def create_segments(datas, number_of_bytes):
+    """Create segments of given datas `datas` in `number_of_bytes`
+    bytes. Each segment covers the bytes of one or more datas, and
+    datas in overlapping or adjacent bytes are put in the same
+    segment. Bytes not used by any data are not part of any segment,
+    which makes encoding and decoding of long data with few datas
+    fast.
+
+    """
+
+    ranges = []
+
+    for index, data in enumerate(datas):
+        if data.byte_order == 'big_endian':
+            start = start_bit(data)
+        else:
+            start = data.start
+
+        begin = max(start // 8, 0)
+        end = min((start + data.length - 1) // 8 + 1, number_of_bytes)
+        ranges.append((begin, end, index, data))
+
+    ranges.sort(key=lambda item: item[0])
+    groups = []
+
+    for begin, end, index, data in ranges:
+        if groups and begin <= groups[-1][1]:
+            groups[-1][1] = max(groups[-1][1], end)
+            groups[-1][2].append((index, data))
+        else:
+            groups.append([begin, end, [(index, data)]])
+
+    segments = []
+
+    for begin, end, segment_datas in groups:
+        # Keep the original data order within the segment.
+        segment_datas = [data for _, data in sorted(segment_datas,
+                                                    key=lambda item: item[0])]
+        segments.append(
+            Segment(begin,
+                    end,
+                    segment_datas,
+                    create_encode_decode_formats(segment_datas,
+                                                 end - begin,
+                                                 begin)))
+
+    return segments
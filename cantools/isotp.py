@@ -0,0 +1,223 @@
+import time
+from collections import namedtuple
+from collections import OrderedDict
+
+
+# Protocol control information types.
+SINGLE_FRAME = 0
+FIRST_FRAME = 1
+CONSECUTIVE_FRAME = 2
+FLOW_CONTROL = 3
+
+# UDS ReadDataByIdentifier positive response service identifier.
+READ_DATA_BY_IDENTIFIER_RESPONSE = 0x62
+
+
+TransportMessage = namedtuple('TransportMessage',
+                              [
+                                  'frame_id',
+                                  'data',
+                                  'did',
+                                  'decoded'
+                              ])
+
+
+class TransportSession(object):
+    """An ISO-TP session reassembling a segmented message.
+
+    """
+
+    def __init__(self, size, timestamp):
+        self.size = size
+        self.data = bytearray()
+        self.sequence_number = 1
+        self.timestamp = timestamp
+
+
+class TransportProtocol(object):
+    """Reassemble messages sent using the ISO-TP (ISO 15765-2) transport
+    protocol with normal addressing, with one state machine per CAN
+    frame id.
+
+    Give the frames on the bus to :meth:`.feed()`, which returns a
+    :class:`~cantools.isotp.TransportMessage` once a message has been
+    reassembled. Only frames with ids in `frame_ids` are handled, or
+    all frames if ``None``.
+
+    If a diagnostics `database` is given, ReadDataByIdentifier
+    positive responses (service 0x62) are decoded as the DID with the
+    identifier in the response.
+
+    A session is discarded if no frame has been received in it within
+    `timeout` seconds. At most `maximum_number_of_sessions` sessions
+    are kept, the oldest session is discarded when a new session is
+    started if all are in use. Messages longer than `maximum_size`
+    bytes are ignored.
+
+    >>> transport_protocol = cantools.isotp.TransportProtocol(
+    ...     database, frame_ids=[0x7e8])
+    >>> for message in can_bus:
+    ...     reassembled = transport_protocol.feed(message.arbitration_id,
+    ...                                           message.data,
+    ...                                           message.timestamp)
+    ...     if reassembled is not None and reassembled.did is not None:
+    ...         print(reassembled.did.name, reassembled.decoded)
+
+    """
+
+    def __init__(self,
+                 database=None,
+                 frame_ids=None,
+                 timeout=1.0,
+                 maximum_number_of_sessions=256,
+                 maximum_size=4095):
+        self._database = database
+
+        if frame_ids is not None:
+            frame_ids = set(frame_ids)
+
+        self._frame_ids = frame_ids
+        self._timeout = timeout
+        self._maximum_number_of_sessions = maximum_number_of_sessions
+        self._maximum_size = maximum_size
+        self._sessions = OrderedDict()
+
+    @property
+    def sessions(self):
+        """A dictionary of ongoing sessions, with frame ids as keys.
+
+        """
+
+        return self._sessions
+
+    def feed(self, frame_id, data, timestamp=None):
+        """Feed given frame with frame id `frame_id` and data `data`,
+        received at `timestamp` in seconds. The current time is used
+        if `timestamp` is ``None``.
+
+        Returns a :class:`~cantools.isotp.TransportMessage` once a
+        complete message has been received, otherwise ``None``.
+
+        """
+
+        if self._frame_ids is not None and frame_id not in self._frame_ids:
+            return None
+
+        if len(data) == 0:
+            return None
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        self._discard_timed_out_sessions(timestamp)
+        pci_type = (data[0] >> 4)
+
+        if pci_type == SINGLE_FRAME:
+            return self._on_single_frame(frame_id, data)
+        elif pci_type == FIRST_FRAME:
+            self._on_first_frame(frame_id, data, timestamp)
+        elif pci_type == CONSECUTIVE_FRAME:
+            return self._on_consecutive_frame(frame_id, data, timestamp)
+
+        return None
+
+    def _discard_timed_out_sessions(self, timestamp):
+        sessions = self._sessions
+
+        while sessions:
+            frame_id, session = next(iter(sessions.items()))
+
+            if timestamp - session.timestamp <= self._timeout:
+                break
+
+            del sessions[frame_id]
+
+    def _on_single_frame(self, frame_id, data):
+        # A single frame aborts any ongoing session.
+        self._sessions.pop(frame_id, None)
+        size = (data[0] & 0xf)
+
+        if size == 0 and len(data) > 8:
+            # CAN FD single frame escape sequence.
+            size = data[1]
+            payload = data[2:2 + size]
+        else:
+            payload = data[1:1 + size]
+
+        if size == 0 or len(payload) < size:
+            return None
+
+        return self._create_message(frame_id, bytes(payload))
+
+    def _on_first_frame(self, frame_id, data, timestamp):
+        self._sessions.pop(frame_id, None)
+
+        if len(data) < 2:
+            return
+
+        size = (((data[0] & 0xf) << 8) | data[1])
+
+        if size == 0:
+            # Escape sequence for messages longer than 4095 bytes.
+            if len(data) < 6:
+                return
+
+            size = ((data[2] << 24) | (data[3] << 16) | (data[4] << 8) | data[5])
+            payload = data[6:]
+        else:
+            payload = data[2:]
+
+        if size > self._maximum_size:
+            return
+
+        if len(self._sessions) >= self._maximum_number_of_sessions:
+            self._sessions.popitem(last=False)
+
+        session = TransportSession(size, timestamp)
+        session.data += payload
+        self._sessions[frame_id] = session
+
+    def _on_consecutive_frame(self, frame_id, data, timestamp):
+        session = self._sessions.get(frame_id)
+
+        if session is None:
+            return None
+
+        if (data[0] & 0xf) != session.sequence_number:
+            # Lost frame.
+            del self._sessions[frame_id]
+
+            return None
+
+        session.data += data[1:]
+
+        if len(session.data) < session.size:
+            session.sequence_number = ((session.sequence_number + 1) & 0xf)
+            session.timestamp = timestamp
+            self._sessions.move_to_end(frame_id)
+
+            return None
+
+        del self._sessions[frame_id]
+
+        return self._create_message(frame_id,
+                                    bytes(session.data[:session.size]))
+
+    def _create_message(self, frame_id, data):
+        did = None
+        decoded = None
+
+        if (self._database is not None
+            and len(data) >= 3
+            and data[0] == READ_DATA_BY_IDENTIFIER_RESPONSE):
+            identifier = ((data[1] << 8) | data[2])
+
+            try:
+                did = self._database.get_did_by_identifier(identifier)
+            except KeyError:
+                pass
+            else:
+                if len(data) - 3 >= did.length:
+                    decoded = did.decode(data[3:])
+
+        return TransportMessage(frame_id, data, did, decoded)
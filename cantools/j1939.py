@@ -1,9 +1,28 @@
+import time
 from collections import namedtuple
-import bitstruct
+from collections import OrderedDict
 
 from .errors import Error
 
 
+# Transport protocol PDU formats.
+TP_CM = 0xec
+TP_DT = 0xeb
+ETP_CM = 0xc8
+ETP_DT = 0xc7
+
+# Transport protocol connection management control bytes.
+TP_CM_RTS = 16
+TP_CM_CTS = 17
+TP_CM_EOMA = 19
+TP_CM_BAM = 32
+ETP_CM_RTS = 20
+ETP_CM_CTS = 21
+ETP_CM_DPO = 22
+ETP_CM_EOMA = 23
+CM_ABORT = 255
+
+
 FrameId = namedtuple('FrameId',
                      [
                          'priority',
@@ -38,34 +57,35 @@ def frame_id_pack(priority,
 
     """
 
-    try:
-        packed = bitstruct.pack('u3u1u1u8u8u8',
-                                priority,
-                                reserved,
-                                data_page,
-                                pdu_format,
-                                pdu_specific,
-                                source_address)
-    except bitstruct.Error:
-        if priority > 7:
-            raise Error('Expected priority 0..7, but got {}.'.format(priority))
-        elif reserved > 1:
-            raise Error('Expected reserved 0..1, but got {}.'.format(reserved))
-        elif data_page > 1:
-            raise Error('Expected data page 0..1, but got {}.'.format(data_page))
-        elif pdu_format > 255:
-            raise Error('Expected PDU format 0..255, but got {}.'.format(
-                pdu_format))
-        elif pdu_specific > 255:
-            raise Error('Expected PDU specific 0..255, but got {}.'.format(
-                pdu_specific))
-        elif source_address > 255:
-            raise Error('Expected source address 0..255, but got {}.'.format(
-                source_address))
-        else:
-            raise Error('Internal error.')
-
-    return bitstruct.unpack('u29', packed)[0]
+    if priority > 7:
+        raise Error('Expected priority 0..7, but got {}.'.format(priority))
+    elif reserved > 1:
+        raise Error('Expected reserved 0..1, but got {}.'.format(reserved))
+    elif data_page > 1:
+        raise Error('Expected data page 0..1, but got {}.'.format(data_page))
+    elif pdu_format > 255:
+        raise Error('Expected PDU format 0..255, but got {}.'.format(
+            pdu_format))
+    elif pdu_specific > 255:
+        raise Error('Expected PDU specific 0..255, but got {}.'.format(
+            pdu_specific))
+    elif source_address > 255:
+        raise Error('Expected source address 0..255, but got {}.'.format(
+            source_address))
+    elif min(priority,
+             reserved,
+             data_page,
+             pdu_format,
+             pdu_specific,
+             source_address) < 0:
+        raise Error('Internal error.')
+
+    return ((priority << 26)
+            | (reserved << 25)
+            | (data_page << 24)
+            | (pdu_format << 16)
+            | (pdu_specific << 8)
+            | source_address)
 
 
 def frame_id_unpack(frame_id):
@@ -74,14 +94,17 @@ def frame_id_unpack(frame_id):
 
     """
 
-    try:
-        packed = bitstruct.pack('u29', frame_id)
-    except bitstruct.Error:
+    if not 0 <= frame_id <= 0x1fffffff:
         raise Error(
             'Expected a frame id 0..0x1fffffff, but got {}.'.format(
                 hex(frame_id)))
 
-    return FrameId(*bitstruct.unpack('u3u1u1u8u8u8', packed))
+    return FrameId((frame_id >> 26) & 0x7,
+                   (frame_id >> 25) & 0x1,
+                   (frame_id >> 24) & 0x1,
+                   (frame_id >> 16) & 0xff,
+                   (frame_id >> 8) & 0xff,
+                   frame_id & 0xff)
 
 
 def pgn_pack(reserved, data_page, pdu_format, pdu_specific=0):
@@ -95,28 +118,21 @@ def pgn_pack(reserved, data_page, pdu_format, pdu_specific=0):
             'Expected PDU specific 0 when PDU format is 0..239, but got {}.'.format(
                 pdu_specific))
 
-    try:
-        packed = bitstruct.pack('u1u1u8u8',
-                                reserved,
-                                data_page,
-                                pdu_format,
-                                pdu_specific)
-    except bitstruct.Error:
-        if reserved > 1:
-            raise Error('Expected reserved 0..1, but got {}.'.format(reserved))
-        elif data_page > 1:
-            raise Error('Expected data page 0..1, but got {}.'.format(
-                data_page))
-        elif pdu_format > 255:
-            raise Error('Expected PDU format 0..255, but got {}.'.format(
-                pdu_format))
-        elif pdu_specific > 255:
-            raise Error('Expected PDU specific 0..255, but got {}.'.format(
-                pdu_specific))
-        else:
-            raise Error('Internal error.')
+    if reserved > 1:
+        raise Error('Expected reserved 0..1, but got {}.'.format(reserved))
+    elif data_page > 1:
+        raise Error('Expected data page 0..1, but got {}.'.format(
+            data_page))
+    elif pdu_format > 255:
+        raise Error('Expected PDU format 0..255, but got {}.'.format(
+            pdu_format))
+    elif pdu_specific > 255:
+        raise Error('Expected PDU specific 0..255, but got {}.'.format(
+            pdu_specific))
+    elif min(reserved, data_page, pdu_format, pdu_specific) < 0:
+        raise Error('Internal error.')
 
-    return bitstruct.unpack('u18', packed)[0]
+    return (reserved << 17) | (data_page << 16) | (pdu_format << 8) | pdu_specific
 
 
 def pgn_unpack(pgn):
@@ -125,14 +141,15 @@ def pgn_unpack(pgn):
 
     """
 
-    try:
-        packed = bitstruct.pack('u18', pgn)
-    except bitstruct.Error:
+    if not 0 <= pgn <= 0x3ffff:
         raise Error(
             'Expected a parameter group number 0..0x3ffff, but got {}.'.format(
                 hex(pgn)))
 
-    return PGN(*bitstruct.unpack('u1u1u8u8', packed))
+    return PGN((pgn >> 17) & 0x1,
+               (pgn >> 16) & 0x1,
+               (pgn >> 8) & 0xff,
+               pgn & 0xff)
 
 
 def pgn_from_frame_id(frame_id):
@@ -140,14 +157,339 @@ def pgn_from_frame_id(frame_id):
 
     """
 
-    unpacked = frame_id_unpack(frame_id)
+    if not 0 <= frame_id <= 0x1fffffff:
+        raise Error(
+            'Expected a frame id 0..0x1fffffff, but got {}.'.format(
+                hex(frame_id)))
+
+    pgn = (frame_id >> 8) & 0x3ffff
+
+    # PDU specific is the destination address for PDU format 1.
+    if ((pgn >> 8) & 0xff) < 240:
+        pgn &= 0x3ff00
+
+    return pgn
+
+
+def _frame_ids_array(frame_ids):
+    import numpy as np
+
+    frame_ids = np.asarray(frame_ids)
+
+    if frame_ids.size > 0:
+        invalid = (frame_ids < 0) | (frame_ids > 0x1fffffff)
+
+        if invalid.any():
+            raise Error(
+                'Expected a frame id 0..0x1fffffff, but got {}.'.format(
+                    hex(int(frame_ids[invalid][0]))))
+
+    return frame_ids.astype(np.uint32)
+
+
+def frame_id_unpack_array(frame_ids):
+    """Unpack given NumPy array of frame ids, or any sequence of frame
+    ids, and return a tuple of arrays of priority, reserved, data page,
+    PDU format, PDU specific and source address. Requires NumPy.
+
+    """
+
+    import numpy as np
+
+    frame_ids = _frame_ids_array(frame_ids)
+
+    return FrameId(((frame_ids >> 26) & 0x7).astype(np.uint8),
+                   ((frame_ids >> 25) & 0x1).astype(np.uint8),
+                   ((frame_ids >> 24) & 0x1).astype(np.uint8),
+                   ((frame_ids >> 16) & 0xff).astype(np.uint8),
+                   ((frame_ids >> 8) & 0xff).astype(np.uint8),
+                   (frame_ids & 0xff).astype(np.uint8))
+
+
+def pgn_from_frame_id_array(frame_ids):
+    """Get an array of parameter group numbers (PGN) from given NumPy
+    array of frame ids, or any sequence of frame ids. Requires NumPy.
+
+    """
+
+    import numpy as np
+
+    frame_ids = _frame_ids_array(frame_ids)
+    pgns = (frame_ids >> 8) & 0x3ffff
+
+    return np.where(((pgns >> 8) & 0xff) < 240, pgns & 0x3ff00, pgns)
+
+
+TransportMessage = namedtuple('TransportMessage',
+                              [
+                                  'pgn',
+                                  'priority',
+                                  'source_address',
+                                  'destination_address',
+                                  'data',
+                                  'signals'
+                              ])
+
+
+class TransportSession(object):
+    """A transport protocol session reassembling a multi-packet message.
+
+    """
+
+    def __init__(self, pgn, priority, destination_address, size, timestamp):
+        self.pgn = pgn
+        self.priority = priority
+        self.destination_address = destination_address
+        self.size = size
+        self.number_of_packets = (size + 6) // 7
+        self.data = bytearray(7 * self.number_of_packets)
+        self.received = bytearray(self.number_of_packets)
+        self.number_of_received_packets = 0
+        self.offset = 0
+        self.timestamp = timestamp
+
+    def add_packet(self, index, data):
+        """Add given packet. Returns ``True`` once all packets are received.
+
+        """
+
+        if not 0 <= index < self.number_of_packets:
+            return False
+
+        start = 7 * index
+        self.data[start:start + 7] = data[1:8]
+
+        if not self.received[index]:
+            self.received[index] = 1
+            self.number_of_received_packets += 1
+
+        return self.number_of_received_packets == self.number_of_packets
+
+
+class TransportProtocol(object):
+    """Reassemble multi-packet messages sent using the J1939 transport
+    protocol, both broadcast (BAM) and connection mode (RTS/CTS), and
+    the extended transport protocol (ETP).
+
+    Give the frames on the bus to :meth:`.feed()`, which returns a
+    :class:`~cantools.j1939.TransportMessage` once a message has been
+    reassembled. If a `database` is given, the reassembled data is
+    decoded as the message in the database with the same PGN.
+
+    A session is discarded if no frame has been received in it within
+    `timeout` seconds. At most `maximum_number_of_sessions` sessions
+    are kept, the oldest session is discarded when a new session is
+    started if all are in use. Sessions announcing more than
+    `maximum_size` bytes are ignored.
+
+    A session is identified by its source address, destination address
+    and PGN, all given in the connection management frames. Data
+    transfer frames do not carry the PGN, so, as in J1939-21, there is
+    at most one session between two nodes in each direction. A new
+    session replaces any ongoing session between the same nodes.
+
+    >>> transport_protocol = cantools.j1939.TransportProtocol(database)
+    >>> for message in can_bus:
+    ...     reassembled = transport_protocol.feed(message.arbitration_id,
+    ...                                           message.data,
+    ...                                           message.timestamp)
+    ...     if reassembled is not None:
+    ...         print(reassembled.signals)
 
-    if unpacked.pdu_format < 240:
-        pdu_specific = 0
-    else:
-        pdu_specific = unpacked.pdu_specific
+    """
+
+    def __init__(self,
+                 database=None,
+                 timeout=1.25,
+                 maximum_number_of_sessions=256,
+                 maximum_size=65535):
+        self._database = database
+        self._timeout = timeout
+        self._maximum_number_of_sessions = maximum_number_of_sessions
+        self._maximum_size = maximum_size
+        self._sessions = OrderedDict()
+        self._session_pgns = {}
+        self._pgn_to_message = {}
+
+        if database is not None:
+            for message in database.messages:
+                if message.is_extended_frame:
+                    pgn = pgn_from_frame_id(message.frame_id)
+                    self._pgn_to_message[pgn] = message
+
+    @property
+    def sessions(self):
+        """A dictionary of ongoing sessions, with tuples of source address,
+        destination address and PGN as keys.
+
+        """
+
+        return self._sessions
+
+    def feed(self, frame_id, data, timestamp=None):
+        """Feed given frame with frame id `frame_id` and data `data`,
+        received at `timestamp` in seconds. The current time is used
+        if `timestamp` is ``None``. Frames not part of the transport
+        protocol are ignored.
+
+        Returns a :class:`~cantools.j1939.TransportMessage` once all
+        packets of a message have been received, otherwise ``None``.
+
+        """
+
+        pdu_format = (frame_id >> 16) & 0xff
+
+        if pdu_format not in (TP_CM, TP_DT, ETP_CM, ETP_DT):
+            return None
+
+        if len(data) < 8:
+            return None
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        self._discard_timed_out_sessions(timestamp)
+        source_address = frame_id & 0xff
+        destination_address = (frame_id >> 8) & 0xff
+
+        if pdu_format in (TP_DT, ETP_DT):
+            return self._on_data_transfer(pdu_format,
+                                          source_address,
+                                          destination_address,
+                                          data,
+                                          timestamp)
+        else:
+            self._on_connection_management(pdu_format,
+                                           (frame_id >> 26) & 0x7,
+                                           source_address,
+                                           destination_address,
+                                           data,
+                                           timestamp)
+
+    def _discard_timed_out_sessions(self, timestamp):
+        sessions = self._sessions
+
+        while sessions:
+            key, session = next(iter(sessions.items()))
+
+            if timestamp - session.timestamp <= self._timeout:
+                break
+
+            self._pop_session(key)
+
+    def _on_connection_management(self,
+                                  pdu_format,
+                                  priority,
+                                  source_address,
+                                  destination_address,
+                                  data,
+                                  timestamp):
+        control = data[0]
+        pgn = data[5] | (data[6] << 8) | (data[7] << 16)
+
+        key = (source_address, destination_address, pgn)
+
+        if pdu_format == TP_CM and control in (TP_CM_BAM, TP_CM_RTS):
+            size = data[1] | (data[2] << 8)
+            self._start_session(key, priority, size, timestamp)
+        elif pdu_format == ETP_CM and control == ETP_CM_RTS:
+            size = data[1] | (data[2] << 8) | (data[3] << 16) | (data[4] << 24)
+            self._start_session(key, priority, size, timestamp)
+        elif pdu_format == ETP_CM and control == ETP_CM_DPO:
+            session = self._sessions.get(key)
+
+            if session is not None:
+                session.offset = data[2] | (data[3] << 8) | (data[4] << 16)
+                self._touch_session(key, session, timestamp)
+        elif control in (TP_CM_CTS, ETP_CM_CTS):
+            # Sent by the receiver of the data.
+            key = (destination_address, source_address, pgn)
+            session = self._sessions.get(key)
+
+            if session is not None:
+                self._touch_session(key, session, timestamp)
+        elif control in (TP_CM_EOMA, ETP_CM_EOMA):
+            self._pop_session((destination_address, source_address, pgn))
+        elif control == CM_ABORT:
+            self._pop_session(key)
+            self._pop_session((destination_address, source_address, pgn))
+
+    def _start_session(self, key, priority, size, timestamp):
+        _, destination_address, pgn = key
+
+        # A new session replaces any ongoing session between the same
+        # nodes, as data transfer frames do not carry the PGN.
+        ongoing_pgn = self._session_pgns.get(key[:2])
+
+        if ongoing_pgn is not None:
+            self._pop_session(key[:2] + (ongoing_pgn, ))
+
+        if not 9 <= size <= self._maximum_size:
+            return
+
+        if len(self._sessions) >= self._maximum_number_of_sessions:
+            self._pop_session(next(iter(self._sessions)))
+
+        self._sessions[key] = TransportSession(pgn,
+                                               priority,
+                                               destination_address,
+                                               size,
+                                               timestamp)
+        self._session_pgns[key[:2]] = pgn
+
+    def _pop_session(self, key):
+        session = self._sessions.pop(key, None)
+
+        if session is not None:
+            del self._session_pgns[key[:2]]
+
+        return session
+
+    def _touch_session(self, key, session, timestamp):
+        session.timestamp = timestamp
+        self._sessions.move_to_end(key)
+
+    def _on_data_transfer(self,
+                          pdu_format,
+                          source_address,
+                          destination_address,
+                          data,
+                          timestamp):
+        pgn = self._session_pgns.get((source_address, destination_address))
+
+        if pgn is None:
+            return None
+
+        key = (source_address, destination_address, pgn)
+        session = self._sessions[key]
+
+        index = data[0] - 1
+
+        if pdu_format == ETP_DT:
+            index += session.offset
+
+        if not session.add_packet(index, data):
+            self._touch_session(key, session, timestamp)
+
+            return None
+
+        self._pop_session(key)
+        data = bytes(session.data[:session.size])
+
+        return TransportMessage(session.pgn,
+                                session.priority,
+                                source_address,
+                                destination_address,
+                                data,
+                                self._decode(session.pgn, data))
+
+    def _decode(self, pgn, data):
+        if is_pdu_format_1((pgn >> 8) & 0xff):
+            pgn &= 0x3ff00
 
-    return pgn_pack(unpacked.reserved,
-                    unpacked.data_page,
-                    unpacked.pdu_format,
-                    pdu_specific)
+        try:
+            message = self._pgn_to_message[pgn]
+        except KeyError:
+            return None
+
+        return self._database.decode_message(message.name, data)
@@ -5,6 +5,7 @@ import struct
 from argparse_addons import Integer
 
 from .. import database
+from ..errors import Error
 from .utils import format_message_by_frame_id
 
 
@@ -13,6 +14,17 @@ RE_CANDUMP = re.compile(r'^\s*\S+\s+([0-9A-F]+)\s*\[\d+\]\s*([0-9A-F ]*)$')
 # Matches 'candump -l' (or -L) output, i.e. "(1594172461.968006) vcan0 1F0#0000000000001BC1"
 RE_CANDUMP_LOG = re.compile(r'^\(\d+\.\d+\)\s+\S+\s+([\dA-F]+)#([\dA-F]*)$')
 
+# Log file formats read by python-can readers. The value is the
+# reader class name and if the input is binary.
+LOG_READERS = {
+    'asc': ('ASCReader', False),
+    'blf': ('BLFReader', True),
+    'log': ('CanutilsLogReader', False),
+    'trc': ('TRCReader', False)
+}
+
+INPUT_FORMATS = ['candump'] + sorted(LOG_READERS)
+
 
 def _mo_unpack(mo):
     frame_id = mo.group(1)
@@ -26,16 +38,17 @@ def _mo_unpack(mo):
     return frame_id, data
 
 
-def _do_decode(args):
-    dbase = database.load_file(args.database,
-                               encoding=args.encoding,
-                               frame_id_mask=args.frame_id_mask,
-                               strict=not args.no_strict)
-    decode_choices = not args.no_decode_choices
+def _read_candump_frames(fin):
+    """Yields a line, frame id and data tuple for each line in given
+    "candump" output. Frame id and data are ``None`` for lines that
+    are not CAN frames.
+
+    """
+
     re_format = None
 
     while True:
-        line = sys.stdin.readline()
+        line = fin.readline()
 
         # Break at EOF.
         if not line:
@@ -59,6 +72,90 @@ def _do_decode(args):
 
         if mo:
             frame_id, data = _mo_unpack(mo)
+        else:
+            frame_id = None
+            data = None
+
+        yield line, frame_id, data
+
+
+def _format_log_message(message):
+    """Format given python-can message as a "candump -L" line.
+
+    """
+
+    if message.is_error_frame:
+        frame = 'ERROR'
+    else:
+        if message.is_extended_id:
+            frame = '{:08X}#'.format(message.arbitration_id)
+        else:
+            frame = '{:03X}#'.format(message.arbitration_id)
+
+        if message.is_remote_frame:
+            frame += 'R'
+        else:
+            frame += binascii.hexlify(message.data).decode('ascii').upper()
+
+    channel = message.channel
+
+    if channel is None:
+        channel = '-'
+
+    return '({:.6f}) {} {}'.format(message.timestamp, channel, frame)
+
+
+def _read_log_frames(fin, input_format):
+    """Yields a line, frame id and data tuple for each message read from
+    given log file by a python-can reader. Frames are decoded directly
+    from the reader, without a text conversion step.
+
+    """
+
+    # Import when used, as python-can is not needed by other input
+    # formats.
+    import can
+
+    reader_name, _ = LOG_READERS[input_format]
+
+    try:
+        reader_class = getattr(can, reader_name)
+    except AttributeError:
+        raise Error(
+            "Input format '{}' is not supported by the installed python-can "
+            "version {}.".format(input_format, can.__version__))
+
+    for message in reader_class(fin):
+        line = _format_log_message(message)
+
+        if message.is_error_frame or message.is_remote_frame:
+            yield line, None, None
+        else:
+            yield line, message.arbitration_id, bytes(message.data)
+
+
+def _open_input(input_format):
+    if input_format in LOG_READERS and LOG_READERS[input_format][1]:
+        return getattr(sys.stdin, 'buffer', sys.stdin)
+    else:
+        return sys.stdin
+
+
+def _do_decode(args):
+    dbase = database.load_file(args.database,
+                               encoding=args.encoding,
+                               frame_id_mask=args.frame_id_mask,
+                               strict=not args.no_strict)
+    decode_choices = not args.no_decode_choices
+    fin = _open_input(args.input_format)
+
+    if args.input_format == 'candump':
+        frames = _read_candump_frames(fin)
+    else:
+        frames = _read_log_frames(fin, args.input_format)
+
+    for line, frame_id, data in frames:
+        if frame_id is not None:
             line += ' ::'
             line += format_message_by_frame_id(dbase,
                                                frame_id,
@@ -72,8 +169,9 @@ def _do_decode(args):
 def add_subparser(subparsers):
     decode_parser = subparsers.add_parser(
         'decode',
-        description=('Decode "candump" CAN frames read from standard input '
-                     'and print them in a human readable format.'))
+        description=('Decode "candump" CAN frames, or frames in a log file '
+                     'format given by --input-format, read from standard '
+                     'input and print them in a human readable format.'))
     decode_parser.add_argument(
         '-c', '--no-decode-choices',
         action='store_true',
@@ -95,6 +193,13 @@ def add_subparser(subparsers):
         help=('Only compare selected frame id bits to find the message in the '
               'database. By default the candump and database frame ids must '
               'be equal for a match.'))
+    decode_parser.add_argument(
+        '-i', '--input-format',
+        choices=INPUT_FORMATS,
+        default='candump',
+        help=('Input format. candump is "candump" output (auto-detected), '
+              'while the other formats are read using python-can log '
+              'readers (default: %(default)s).'))
     decode_parser.add_argument(
         'database',
         help='Database file.')
@@ -2,6 +2,7 @@ import os
 
 from .. import database
 from ..database.can.c_source import generate
+from ..database.can.c_source import generate_dispatch_benchmark
 from ..database.can.c_source import camel_to_snake_case
 
 
@@ -21,6 +22,8 @@ def _do_generate_c_source(args):
     filename_c = database_name + '.c'
     fuzzer_filename_c = database_name + '_fuzzer.c'
     fuzzer_filename_mk = database_name + '_fuzzer.mk'
+    dispatch_benchmark_filename_c = database_name + '_dispatch_benchmark.c'
+    dispatch = (args.dispatch or args.generate_dispatch_benchmark)
 
     header, source, fuzzer_source, fuzzer_makefile = generate(
         dbase,
@@ -29,7 +32,9 @@ def _do_generate_c_source(args):
         filename_c,
         fuzzer_filename_c,
         not args.no_floating_point_numbers,
-        args.bit_fields)
+        args.bit_fields,
+        dispatch,
+        args.word_wise)
 
     with open(filename_h, 'w') as fout:
         fout.write(header)
@@ -54,6 +59,18 @@ def _do_generate_c_source(args):
                 fuzzer_filename_mk))
         print('recent version of clang.')
 
+    if args.generate_dispatch_benchmark:
+        with open(dispatch_benchmark_filename_c, 'w') as fout:
+            fout.write(generate_dispatch_benchmark(dbase,
+                                                   database_name,
+                                                   filename_h))
+
+        print('Successfully generated {}.'.format(
+            dispatch_benchmark_filename_c))
+        print()
+        print('Build it together with {} and run it to measure the dispatch '
+              'time.'.format(filename_c))
+
 
 def add_subparser(subparsers):
     generate_c_source_parser = subparsers.add_parser(
@@ -70,6 +87,11 @@ def add_subparser(subparsers):
         '--bit-fields',
         action='store_true',
         help='Use bit fields to minimize struct sizes.')
+    generate_c_source_parser.add_argument(
+        '--word-wise',
+        action='store_true',
+        help=('Pack and unpack signals using 64 bits words instead of '
+              'bytes.'))
     generate_c_source_parser.add_argument(
         '-e', '--encoding',
         help='File encoding.')
@@ -81,6 +103,16 @@ def add_subparser(subparsers):
         '-f', '--generate-fuzzer',
         action='store_true',
         help='Also generate fuzzer source code.')
+    generate_c_source_parser.add_argument(
+        '--dispatch',
+        action='store_true',
+        help=('Also generate a function unpacking a message with any frame '
+              'id in the database.'))
+    generate_c_source_parser.add_argument(
+        '--generate-dispatch-benchmark',
+        action='store_true',
+        help=('Also generate benchmark source code measuring the dispatch '
+              'time. Implies --dispatch.'))
     generate_c_source_parser.add_argument(
         'infile',
         help='Input database file.')
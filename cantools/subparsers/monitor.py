@@ -1,8 +1,10 @@
 import re
+import math
 import time
 import curses
 import bisect
 import queue
+import threading
 
 import can
 from argparse_addons import Integer
@@ -15,6 +17,330 @@ class QuitError(Exception):
     pass
 
 
+def frame_bits(message):
+    """Returns the approximate number of bits on the bus of given frame,
+    including interframe space but excluding stuff bits.
+
+    """
+
+    if message.is_extended_id:
+        overhead = 67
+    else:
+        overhead = 47
+
+    return overhead + 8 * len(message.data)
+
+
+class Statistics(object):
+    """Frame count, period, jitter and bus load statistics, computed
+    incrementally in constant memory. Periods are in seconds.
+
+    """
+
+    def __init__(self, cycle_time=None):
+        self.cycle_time = cycle_time
+        self.count = 0
+        self.bits = 0
+        self.first_timestamp = None
+        self.last_timestamp = None
+        self.minimum_period = None
+        self.maximum_period = None
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, timestamp, bits):
+        if self.last_timestamp is None:
+            self.first_timestamp = timestamp
+        else:
+            period = timestamp - self.last_timestamp
+
+            # Welford's online algorithm for mean and variance.
+            delta = period - self._mean
+            self._mean += delta / self.count
+            self._m2 += delta * (period - self._mean)
+
+            if self.minimum_period is None or period < self.minimum_period:
+                self.minimum_period = period
+
+            if self.maximum_period is None or period > self.maximum_period:
+                self.maximum_period = period
+
+        self.last_timestamp = timestamp
+        self.count += 1
+        self.bits += bits
+
+    @property
+    def period(self):
+        """The mean period, or ``None`` if less than two frames are received.
+
+        """
+
+        if self.count < 2:
+            return None
+
+        return self._mean
+
+    @property
+    def jitter(self):
+        """The standard deviation of the period, or ``None`` if less than two
+        frames are received.
+
+        """
+
+        if self.count < 2:
+            return None
+
+        return math.sqrt(self._m2 / (self.count - 1))
+
+    def load(self, bit_rate):
+        """Returns the estimated bus load in percent at given bit rate, or
+        ``None`` if unknown.
+
+        """
+
+        if bit_rate is None or self.count < 2:
+            return None
+
+        elapsed = self.last_timestamp - self.first_timestamp
+
+        if elapsed <= 0:
+            return None
+
+        # The first frame starts the measurement.
+        bits = self.bits * (self.count - 1) / self.count
+
+        return 100 * bits / elapsed / bit_rate
+
+
+DROP_POLICIES = ['oldest', 'newest', 'latest']
+
+
+class RingBuffer(object):
+    """A bounded queue of received frames, preallocated as a ring of
+    `size` slots. Putting a frame does no allocation other than the
+    frame itself.
+
+    `policy` selects which frames to drop; ``'oldest'`` drops the
+    oldest queued frame when full, ``'newest'`` drops the frame being
+    put when full, and ``'latest'`` replaces any queued frame with
+    the same frame id, and otherwise drops the frame being put when
+    full.
+
+    """
+
+    def __init__(self, size, policy='oldest'):
+        if size < 1:
+            raise ValueError(
+                'expected queue size greater than 0, but got {}'.format(size))
+
+        if policy not in DROP_POLICIES:
+            raise ValueError(
+                "expected drop policy 'oldest', 'newest' or 'latest', but "
+                "got '{}'".format(policy))
+
+        self._size = size
+        self._policy = policy
+        self._condition = threading.Condition()
+        self.clear()
+
+    def put(self, message):
+        with self._condition:
+            if self._policy == 'latest':
+                index = self._queued_frame_ids.get(message.arbitration_id)
+
+                if index is not None:
+                    self._items[index] = message
+                    self.dropped += 1
+
+                    return
+
+            if self._count == self._size:
+                self.dropped += 1
+
+                if self._policy == 'oldest':
+                    self._pop()
+                else:
+                    return
+
+            index = (self._head + self._count) % self._size
+            self._items[index] = message
+            self._count += 1
+
+            if self._policy == 'latest':
+                self._queued_frame_ids[message.arbitration_id] = index
+
+            self._condition.notify()
+
+    def _pop(self):
+        message = self._items[self._head]
+        self._items[self._head] = None
+        self._head = (self._head + 1) % self._size
+        self._count -= 1
+
+        if self._policy == 'latest':
+            del self._queued_frame_ids[message.arbitration_id]
+
+        return message
+
+    def get(self):
+        """Remove and return the oldest frame, waiting for one if the queue
+        is empty.
+
+        """
+
+        with self._condition:
+            while self._count == 0:
+                self._condition.wait()
+
+            return self._pop()
+
+    def get_nowait(self):
+        """Remove and return the oldest frame. Raises ``queue.Empty`` if the
+        queue is empty.
+
+        """
+
+        with self._condition:
+            if self._count == 0:
+                raise queue.Empty()
+
+            return self._pop()
+
+    def qsize(self):
+        return self._count
+
+    def clear(self):
+        """Remove all frames and reset the drop counter.
+
+        """
+
+        with self._condition:
+            self._items = self._size * [None]
+            self._head = 0
+            self._count = 0
+            self._queued_frame_ids = {}
+            self.dropped = 0
+
+
+class Worker(threading.Thread):
+    """Looks up and decodes received frames in a background thread. Only
+    the latest raw frame per message, or multiplexed message, name is
+    kept until the user interface takes it.
+
+    """
+
+    def __init__(self, dbase, ingest_queue):
+        super(Worker, self).__init__()
+        self.daemon = True
+        self._dbase = dbase
+        self._queue = ingest_queue
+        self._lock = threading.Lock()
+        self._latest = {}
+        self._basetime = None
+        self.received = 0
+        self.discarded = 0
+        self.dropped = 0
+        self.statistics = {}
+        self.bus_statistics = Statistics()
+
+    def run(self):
+        while True:
+            self.process(self._queue.get())
+
+    def process(self, message):
+        """Process given received frame.
+
+        """
+
+        frame_id = message.arbitration_id
+        data = message.data
+        timestamp = message.timestamp
+
+        bits = frame_bits(message)
+
+        with self._lock:
+            if self._basetime is None:
+                self._basetime = timestamp
+
+            self.bus_statistics.update(timestamp, bits)
+            timestamp -= self._basetime
+            self.received += 1
+
+        try:
+            message = self._dbase.get_message_by_frame_id(frame_id)
+        except KeyError:
+            self._discard()
+            return
+
+        if len(data) != message.length:
+            self._discard()
+            return
+
+        with self._lock:
+            try:
+                statistics = self.statistics[message.name]
+            except KeyError:
+                statistics = Statistics(message.cycle_time)
+                self.statistics[message.name] = statistics
+
+            statistics.update(timestamp, bits)
+
+        name = message.name
+
+        if message.is_multiplexed():
+            # Handle the case where a multiplexer index is used that isn't
+            # specified in the DBC file (ie. outside of the range). In this
+            # case, we just discard the message, like we do when the CAN
+            # message ID or length doesn't match what's specified in the DBC.
+            try:
+                name = format_multiplexed_name(message, data, True)
+            except database.DecodeError:
+                self._discard()
+                return
+
+        with self._lock:
+            if name in self._latest:
+                self.dropped += 1
+
+            self._latest[name] = (message, timestamp, data)
+
+    def _discard(self):
+        with self._lock:
+            self.discarded += 1
+
+    def take(self):
+        """Returns a dictionary of the latest raw frame per name received
+        since the previous call.
+
+        """
+
+        with self._lock:
+            latest = self._latest
+            self._latest = {}
+
+        return latest
+
+    def reset(self):
+        self._queue.clear()
+
+        with self._lock:
+            self._latest = {}
+            self._basetime = None
+            self.received = 0
+            self.discarded = 0
+            self.dropped = 0
+            self.statistics = {}
+            self.bus_statistics = Statistics()
+
+    def statistics_items(self):
+        """Returns a list of message name and statistics pairs.
+
+        """
+
+        with self._lock:
+            return list(self.statistics.items())
+
+
 class Monitor(can.Listener):
 
     def __init__(self, stdscr, args):
@@ -28,15 +354,32 @@ class Monitor(can.Listener):
         self._filter = ''
         self._compiled_filter = None
         self._formatted_messages = {}
+        self._raw_messages = {}
+        self._dirty_messages = set()
         self._playing = True
         self._modified = True
         self._show_filter = False
-        self._queue = queue.Queue()
+        self._queue = RingBuffer(args.queue_size, args.drop_policy)
         self._nrows, self._ncols = stdscr.getmaxyx()
-        self._received = 0
-        self._discarded = 0
-        self._basetime = None
         self._page = 0
+        self._worker = Worker(self._dbase, self._queue)
+        self._drawn_lines = {}
+        self._lines = {}
+        self._resized = False
+        self._show_statistics = False
+
+        if args.bit_rate is None:
+            self._bit_rate = None
+        else:
+            self._bit_rate = int(args.bit_rate)
+
+        # Zero means no limit.
+        if args.max_fps == 0:
+            self._redraw_period = 0
+        else:
+            self._redraw_period = 1 / args.max_fps
+
+        self._redraw_time = None
 
         stdscr.keypad(True)
         stdscr.nodelay(True)
@@ -45,6 +388,7 @@ class Monitor(can.Listener):
         curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_GREEN)
         curses.init_pair(2, curses.COLOR_BLACK, curses.COLOR_CYAN)
 
+        self._worker.start()
         bus = self.create_bus(args)
         self._notifier = can.Notifier(bus, [self])
 
@@ -71,30 +415,48 @@ class Monitor(can.Listener):
             except QuitError:
                 break
 
-            time.sleep(0.05)
+            time.sleep(0.01)
 
     def tick(self):
+        """Take the latest frames and process user input. The screen is
+        redrawn if modified, but at most max fps times per second.
+
+        """
+
         modified = self.update()
 
-        if modified:
+        if modified and self.is_redraw_due():
             self.redraw()
 
         self.process_user_input()
 
+    def is_redraw_due(self):
+        now = time.monotonic()
+
+        if self._redraw_time is not None:
+            if now - self._redraw_time < self._redraw_period:
+                return False
+
+        self._redraw_time = now
+
+        return True
+
     def redraw(self):
-        # Clear the screen.
-        self._stdscr.clear()
+        self._modified = False
+
+        # Repaint everything after a resize, otherwise only changed
+        # lines.
+        if self._resized:
+            self._resized = False
+            self._stdscr.clear()
+            self._drawn_lines = {}
+
+        self._lines = {}
 
         # Draw everything.
         self.draw_stats(0)
         self.draw_title(1)
 
-        lines = []
-
-        for name in self._filtered_sorted_message_names:
-            for line in self._formatted_messages[name]:
-                lines.append(line)
-
         # Only render the visible screen. We only have (self._nrows - 3)
         # available rows to draw on, due to the persistent TUI features that
         # are drawn:
@@ -106,39 +468,170 @@ class Monitor(can.Listener):
         page_row = self._page * num_actual_usable_rows
         row = 2
 
-        for line in lines[page_row:page_row + num_actual_usable_rows]:
-            self.addstr(row, 0, line)
+        if self._show_statistics:
+            lines = self.statistics_lines()
+            lines = lines[page_row:page_row + num_actual_usable_rows]
+        else:
+            lines = self.visible_lines(page_row, num_actual_usable_rows)
+
+        for line in lines:
+            self.draw_line(row, line)
             row += 1
 
         self.draw_menu(self._nrows - 1)
 
+        # Clear lines no longer drawn.
+        for row in self._drawn_lines:
+            if row not in self._lines:
+                self.clear_line(row)
+
+        self._drawn_lines = self._lines
+
+        if self._show_filter:
+            self._stdscr.move(self._nrows - 1, len('Filter: ' + self._filter))
+
         # Refresh the screen.
         self._stdscr.refresh()
 
+    def visible_lines(self, first_row, number_of_rows):
+        """Returns the lines in given row range. Only messages with at least
+        one visible line are formatted, as the number of lines per
+        name never changes.
+
+        """
+
+        lines = []
+        row = 0
+        end_row = first_row + number_of_rows
+
+        for name in self._filtered_sorted_message_names:
+            if row >= end_row:
+                break
+
+            number_of_lines = len(self._formatted_messages[name])
+
+            if row + number_of_lines > first_row:
+                if name in self._dirty_messages:
+                    self.format_message(name)
+
+                formatted = self._formatted_messages[name]
+                lines += formatted[max(first_row - row, 0):end_row - row]
+
+            row += number_of_lines
+
+        return lines
+
+    def draw_line(self, row, text, color=None):
+        """Draw given line unless it is already on the screen.
+
+        """
+
+        # Long lines would wrap into the next row.
+        text = text[:self._ncols]
+        line = (text, color)
+        self._lines[row] = line
+
+        if self._drawn_lines.get(row) == line:
+            return
+
+        if color is None:
+            self.addstr(row, 0, text)
+        else:
+            self.addstr_color(row, 0, text, color)
+
+        # The cursor wraps to the next line if the text fills the
+        # whole line.
+        if len(text) < self._ncols:
+            self.clrtoeol()
+
+    def clear_line(self, row):
+        try:
+            self._stdscr.move(row, 0)
+            self._stdscr.clrtoeol()
+        except curses.error:
+            pass
+
+    def statistics_lines(self):
+        """Returns one line per received message with its frame count, period,
+        jitter, minimum and maximum periods, cycle time and bus load.
+        Times are in milliseconds.
+
+        """
+
+        def format_ms(value):
+            if value is None:
+                return '-'
+            else:
+                return '{:.1f}'.format(1000 * value)
+
+        def format_load(value):
+            if value is None:
+                return '-'
+            else:
+                return '{:.1f}'.format(value)
+
+        lines = []
+
+        for name, statistics in sorted(self._worker.statistics_items()):
+            if self._compiled_filter is not None:
+                if not self._compiled_filter.search(name):
+                    continue
+
+            if statistics.cycle_time is None:
+                cycle_time = '-'
+            else:
+                cycle_time = str(statistics.cycle_time)
+
+            lines.append('{:8d} {:>8} {:>8} {:>8} {:>8} {:>8} {:>6}  {}'.format(
+                statistics.count,
+                format_ms(statistics.period),
+                format_ms(statistics.jitter),
+                format_ms(statistics.minimum_period),
+                format_ms(statistics.maximum_period),
+                cycle_time,
+                format_load(statistics.load(self._bit_rate)),
+                name))
+
+        return lines
+
     def draw_stats(self, row):
-        self.addstr(row, 0, 'Received: {}, Discarded: {}, Errors: 0'.format(
-            self._received,
-            self._discarded))
+        text = 'Received: {}, Discarded: {}, Dropped: {}, Queue: {}, Errors: 0'
+        # Frames dropped by the ingest queue never reach the worker.
+        text = text.format(self._worker.received + self._queue.dropped,
+                           self._worker.discarded + self._queue.dropped,
+                           self._worker.dropped,
+                           self._queue.qsize())
+
+        if self._show_statistics:
+            load = self._worker.bus_statistics.load(self._bit_rate)
+
+            if load is None:
+                text += ', Bus load: -'
+            else:
+                text += ', Bus load: {:.1f} %'.format(load)
+
+        self.draw_line(row, text)
 
     def draw_title(self, row):
-        self.addstr_color(row,
-                          0,
-                          self.stretch('   TIMESTAMP  MESSAGE'),
-                          curses.color_pair(1))
+        if self._show_statistics:
+            text = ('   COUNT   PERIOD   JITTER      MIN      MAX    CYCLE'
+                    '   LOAD  MESSAGE')
+        else:
+            text = '   TIMESTAMP  MESSAGE'
+
+        self.draw_line(row,
+                       self.stretch(text),
+                       curses.color_pair(1))
 
     def draw_menu(self, row):
         if self._show_filter:
             text = 'Filter: ' + self._filter
         else:
-            text = 'q: Quit, f: Filter, p: Play/Pause, r: Reset'
-
-        self.addstr_color(row,
-                          0,
-                          self.stretch(text),
-                          curses.color_pair(2))
+            text = 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics'
 
-        if self._show_filter:
-            self._stdscr.move(row, len(text))
+        self.draw_line(row,
+                       self.stretch(text),
+                       curses.color_pair(2))
 
     def addstr(self, row, col, text):
         try:
@@ -152,6 +645,12 @@ class Monitor(can.Listener):
         except curses.error:
             pass
 
+    def clrtoeol(self):
+        try:
+            self._stdscr.clrtoeol()
+        except curses.error:
+            pass
+
     def stretch(self, text):
         return text + ' ' * (self._ncols - len(text))
 
@@ -175,16 +674,17 @@ class Monitor(can.Listener):
             self._playing = True
             self._filtered_sorted_message_names = []
             self._formatted_messages = {}
-            self._received = 0
-            self._discarded = 0
-            self._basetime = None
+            self._raw_messages = {}
+            self._dirty_messages = set()
             self._filter = ''
             self._compiled_filter = None
             self._modified = True
             self._page = 0
-
-            while not self._queue.empty():
-                self._queue.get()
+            self._worker.reset()
+        elif key == 's':
+            self._show_statistics = not self._show_statistics
+            self._page = 0
+            self._modified = True
         elif key in ['f', '/']:
             self._show_filter = True
             self._modified = True
@@ -222,40 +722,8 @@ class Monitor(can.Listener):
 
         self._modified = True
 
-    def try_update_message(self):
-        message = self._queue.get_nowait()
-        frame_id = message.arbitration_id
-        data = message.data
-        timestamp = message.timestamp
-
-        if self._basetime is None:
-            self._basetime = timestamp
-
-        timestamp -= self._basetime
-        self._received += 1
-
-        try:
-            message = self._dbase.get_message_by_frame_id(frame_id)
-        except KeyError:
-            self._discarded += 1
-            return
-
-        if len(data) != message.length:
-            self._discarded += 1
-            return
-
-        name = message.name
-
-        if message.is_multiplexed():
-            # Handle the case where a multiplexer index is used that isn't
-            # specified in the DBC file (ie. outside of the range). In this
-            # case, we just discard the message, like we do when the CAN
-            # message ID or length doesn't match what's specified in the DBC.
-            try:
-                name = format_multiplexed_name(message, data, True)
-            except database.DecodeError:
-                self._discarded += 1
-                return
+    def format_message(self, name):
+        message, timestamp, data = self._raw_messages[name]
 
         if self._single_line:
             formatted = format_message(message, data, True, True)
@@ -269,36 +737,40 @@ class Monitor(can.Listener):
             formatted += [14 * ' ' + line for line in lines[2:]]
             self._formatted_messages[name] = formatted
 
-        if name not in self._filtered_sorted_message_names:
-            self.insort_filtered(name)
+        self._dirty_messages.discard(name)
 
     def update_messages(self):
-        modified = False
+        latest = self._worker.take()
 
-        try:
-            while True:
-                self.try_update_message()
-                modified = True
-        except queue.Empty:
-            pass
+        for name, raw_message in latest.items():
+            self._raw_messages[name] = raw_message
 
-        return modified
+            if name in self._formatted_messages:
+                self._dirty_messages.add(name)
+            else:
+                # Format new messages at once to know their number of
+                # lines.
+                self.format_message(name)
+                self.insort_filtered(name)
+
+        return len(latest) > 0
 
     def update(self):
-        if self._playing:
-            modified = self.update_messages()
-        else:
-            modified = False
+        """Returns ``True`` if the screen should be redrawn. The screen stays
+        modified until redrawn.
 
-        if self._modified:
-            self._modified = False
-            modified = True
+        """
+
+        if self._playing:
+            if self.update_messages():
+                self._modified = True
 
         if curses.is_term_resized(self._nrows, self._ncols):
             self._nrows, self._ncols = self._stdscr.getmaxyx()
-            modified = True
+            self._resized = True
+            self._modified = True
 
-        return modified
+        return self._modified
 
     def insort_filtered(self, name):
         if self._compiled_filter is None or self._compiled_filter.search(name):
@@ -350,7 +822,28 @@ def add_subparser(subparsers):
         help='Python CAN bus channel (default: vcan0).')
     monitor_parser.add_argument(
         '-B', '--bit-rate',
-        help='Python CAN bus bit rate.')
+        help=('Python CAN bus bit rate. Also used to estimate the bus load in '
+              'the statistics view.'))
+    monitor_parser.add_argument(
+        '-q', '--queue-size',
+        type=Integer(1),
+        default=10000,
+        help=('Maximum number of received frames waiting to be decoded '
+              '(default: %(default)s).'))
+    monitor_parser.add_argument(
+        '--drop-policy',
+        choices=DROP_POLICIES,
+        default='oldest',
+        help=('Frames to drop when the queue is full; the oldest queued '
+              'frame, the newest received frame, or keep only the latest '
+              'queued frame per frame id (default: %(default)s).'))
+    monitor_parser.add_argument(
+        '--max-fps',
+        type=Integer(0),
+        default=20,
+        help=('Maximum number of screen redraws per second, independent of '
+              'the received frame rate, or 0 for no limit (default: '
+              '%(default)s).'))
     monitor_parser.add_argument(
         'database',
         help='Database file.')
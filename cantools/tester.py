@@ -1,20 +1,46 @@
 # The tester module.
 
+import csv
+import math
 import time
+import asyncio
+import binascii
+import threading
+from collections import deque
+from collections import namedtuple
 
 try:
     from collections import UserDict
 except ImportError:
     from UserDict import UserDict
 
-try:
-    import queue
-except ImportError:
-    import Queue as queue
-
 import can
 
+from .compat import fopen
 from .errors import Error
+from .database.errors import EncodeError
+from .database.utils import encode_data
+from .database.utils import create_encode_decode_formats
+
+
+def _get_running_loop():
+    """Returns the running event loop, or raises RuntimeError if no event
+    loop is running. asyncio.get_running_loop() was added in Python
+    3.7.
+
+    """
+
+    try:
+        get_running_loop = asyncio.get_running_loop
+    except AttributeError:
+        loop = asyncio._get_running_loop()
+
+        if loop is None:
+            raise RuntimeError('no running event loop')
+
+        return loop
+
+    return get_running_loop()
 
 
 class DecodedMessage(object):
@@ -27,18 +53,43 @@ class DecodedMessage(object):
         self.signals = signals
 
 
+def _to_list(values):
+    """Convert given sequence, for example a NumPy array, to a list of
+    Python values.
+
+    """
+
+    if hasattr(values, 'tolist'):
+        return values.tolist()
+    else:
+        return list(values)
+
+
 class Messages(dict):
 
     def __missing__(self, key):
         raise Error("invalid message name '{}'".format(key))
 
 
+class InputState(object):
+    """Received messages bookkeeping shared by all messages of a
+    tester. Each received message is given a sequence number, and all
+    messages with a sequence number less than or equal to `discarded`
+    are discarded.
+
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sequence = 0
+        self.discarded = 0
+
+
 class Listener(can.Listener):
 
-    def __init__(self, database, messages, input_queue, on_message):
+    def __init__(self, database, messages, on_message):
         self._database = database
         self._messages = messages
-        self._input_queue = input_queue
         self._on_message = on_message
 
     def on_message_received(self, msg):
@@ -59,15 +110,13 @@ class Listener(can.Listener):
         if not message.enabled:
             return
 
-        decoded = DecodedMessage(database_message.name,
-                                 database_message.decode(msg.data,
-                                                         message.decode_choices,
-                                                         message.scaling))
-
+        # Frames are only decoded when needed, that is, when read by
+        # the on_message callback or by expect().
         if self._on_message:
-            self._on_message(decoded)
+            self._on_message(DecodedMessage(database_message.name,
+                                            message.decode(msg.data)))
 
-        self._input_queue.put(decoded)
+        message.put_input(msg.data)
 
 
 class Message(UserDict, object):
@@ -75,22 +124,23 @@ class Message(UserDict, object):
     def __init__(self,
                  database,
                  can_bus,
-                 input_list,
-                 input_queue,
+                 input_state,
                  decode_choices,
                  scaling,
                  padding):
         super(Message, self).__init__()
         self.database = database
         self._can_bus = can_bus
-        self._input_queue = input_queue
+        self._input_state = input_state
+        self._input_condition = threading.Condition(input_state.lock)
+        self._inputs = deque()
         self.decode_choices = decode_choices
         self.scaling = scaling
         self.padding = padding
-        self._input_list = input_list
         self.enabled = True
         self._can_message = None
         self._periodic_task = None
+        self._signal_codecs = {}
         self.update({signal.name: 0 for signal in database.signals})
 
     @property
@@ -101,12 +151,15 @@ class Message(UserDict, object):
         return self.data[signal_name]
 
     def __setitem__(self, signal_name, value):
-        self.data[signal_name] = value
-        self._update_can_message()
+        self.update({signal_name: value})
 
     def update(self, signals):
         self.data.update(signals)
-        self._update_can_message()
+
+        if self._can_message is None or self.database.is_multiplexed():
+            self._update_can_message()
+        else:
+            self._update_can_message_signals(signals)
 
     def send(self, signals=None):
         if signals is not None:
@@ -114,71 +167,247 @@ class Message(UserDict, object):
 
         self._can_bus.send(self._can_message)
 
+    def decode(self, data):
+        return self.database.decode(data, self.decode_choices, self.scaling)
+
+    def put_input(self, data):
+        """Append given received raw message data `data` to the input
+        queue of this message. Called by the listener.
+
+        """
+
+        with self._input_condition:
+            self._input_state.sequence += 1
+            self._discard_old_inputs()
+            self._inputs.append((self._input_state.sequence, data))
+            self._input_condition.notify_all()
+
+    def flush_input(self):
+        """Discard all messages in the input queue. The input state lock
+        must be held by the caller.
+
+        """
+
+        self._inputs.clear()
+
     def expect(self, signals=None, timeout=None, discard_other_messages=True):
         if signals is None:
             signals = {}
 
-        decoded = self._expect_input_list(signals, discard_other_messages)
+        if timeout is not None:
+            end_time = time.time() + timeout
+
+        compiled_filter = self._compile_filter(signals)
 
-        if decoded is None:
-            decoded = self._expect_input_queue(signals,
-                                               timeout,
-                                               discard_other_messages)
+        index = 0
 
-        return decoded
+        with self._input_condition:
+            while True:
+                decoded, index = self._expect_input(compiled_filter,
+                                                    discard_other_messages,
+                                                    index)
 
-    def _expect_input_list(self, signals, discard_other_messages):
-        other_messages = []
+                if decoded is not None:
+                    return decoded
 
-        while len(self._input_list) > 0:
-            message = self._input_list.pop(0)
-            decoded = self._filter_expected_message(message, signals)
+                if timeout is not None:
+                    remaining_time = end_time - time.time()
 
-            if decoded is not None:
-                break
+                    if remaining_time <= 0:
+                        break
+                else:
+                    remaining_time = None
 
-            other_messages.append(message)
-        else:
-            decoded = None
+                self._input_condition.wait(remaining_time)
 
-        if not discard_other_messages:
-            other_messages += self._input_list
-            del self._input_list[:]
-            self._input_list.extend(other_messages)
+            # All messages received until now were read, and none of
+            # them matched.
+            if discard_other_messages:
+                self._input_state.discarded = self._input_state.sequence
 
-        return decoded
+    def _discard_old_inputs(self):
+        """Discard old messages from the front of the input queue. Returns
+        the number of discarded messages.
 
-    def _expect_input_queue(self, signals, timeout, discard_other_messages):
-        if timeout is not None:
-            end_time = time.time() + timeout
-            remaining_time = timeout
+        """
+
+        discarded = self._input_state.discarded
+        count = 0
+
+        while self._inputs and self._inputs[0][0] <= discarded:
+            self._inputs.popleft()
+            count += 1
+
+        return count
+
+    def _expect_input(self, compiled_filter, discard_other_messages, index):
+        """Returns a tuple of the first matching message in the input queue,
+        or ``None``, and the index to continue searching at. The input
+        state lock must be held by the caller.
+
+        """
+
+        index = max(index - self._discard_old_inputs(), 0)
+
+        if discard_other_messages:
+            return self._expect_input_discard(compiled_filter), 0
         else:
-            remaining_time = None
+            return self._expect_input_keep(compiled_filter, index)
 
-        while True:
-            try:
-                message = self._input_queue.get(timeout=remaining_time)
-            except queue.Empty:
-                return
+    def _expect_input_discard(self, compiled_filter):
+        """Pop messages from the front of the input queue until one
+        matches. Messages received before the expected one, including
+        messages with other names, are discarded.
+
+        """
 
-            decoded = self._filter_expected_message(message, signals)
+        while self._inputs:
+            sequence, data = self._inputs.popleft()
+            decoded = self._filter_expected_message(data, compiled_filter)
 
             if decoded is not None:
+                self._input_state.discarded = sequence
+
                 return decoded
 
-            if not discard_other_messages:
-                self._input_list.append(message)
+        return None
 
-            if timeout is not None:
-                remaining_time = end_time - time.time()
+    def _expect_input_keep(self, compiled_filter, index):
+        """Search for a matching message in the input queue, starting at
+        given index. Non-matching messages are kept in the queue.
 
-                if remaining_time <= 0:
-                    return
+        """
+
+        while index < len(self._inputs):
+            decoded = self._filter_expected_message(self._inputs[index][1],
+                                                    compiled_filter)
+
+            if decoded is not None:
+                del self._inputs[index]
+
+                return decoded, index
+
+            index += 1
 
-    def _filter_expected_message(self, message, signals):
-        if message.name == self.database.name:
-            if all([message.signals[name] == signals[name] for name in signals]):
-                return message.signals
+        return None, index
+
+    def _raw_value(self, signal, value):
+        """Returns the raw integer value given signal `signal` must have to
+        be decoded as given value `value`, or ``None`` if unknown.
+
+        """
+
+        if signal.is_float or isinstance(value, bool):
+            return None
+
+        if isinstance(value, str):
+            if not self.decode_choices:
+                return None
+
+            try:
+                raw = signal.choice_string_to_number(value)
+            except (KeyError, TypeError):
+                return None
+        elif self.scaling:
+            try:
+                raw = int(round((value - signal.offset) / signal.scale))
+            except (ArithmeticError, TypeError, ValueError):
+                return None
+
+            # Must be decoded exactly as the expected value.
+            if signal.scale * raw + signal.offset != value:
+                return None
+        elif isinstance(value, int):
+            raw = value
+        else:
+            return None
+
+        if signal.is_signed:
+            minimum = -(1 << (signal.length - 1))
+            maximum = (1 << (signal.length - 1)) - 1
+        else:
+            minimum = 0
+            maximum = (1 << signal.length) - 1
+
+        if not minimum <= raw <= maximum:
+            return None
+
+        # Numbers with choices are decoded as choice strings.
+        if (not isinstance(value, str)
+            and self.decode_choices
+            and signal.choices
+            and raw in signal.choices):
+            return None
+
+        return raw
+
+    def _compile_filter(self, signals):
+        """Compile given expected signal values `signals` into a mask and
+        value to compare the raw message data with, and signal values
+        that must be compared after decoding the data. All expected
+        signal values are also returned, used if the data is too
+        short to be compared as raw data.
+
+        """
+
+        if not signals or self.database.is_multiplexed():
+            return 0, 0, signals, signals
+
+        raw_values = {}
+        decoded_signals = {}
+
+        for name, value in signals.items():
+            try:
+                signal = self.database.get_signal_by_name(name)
+            except KeyError:
+                raw = None
+            else:
+                raw = self._raw_value(signal, value)
+
+            if raw is None:
+                decoded_signals[name] = value
+            else:
+                raw_values[signal] = raw
+
+        if not raw_values:
+            return 0, 0, signals, signals
+
+        values = {signal.name: 0 for signal in self.database.signals}
+        masks = dict(values)
+
+        for signal, raw in raw_values.items():
+            values[signal.name] = raw
+            masks[signal.name] = -1 if signal.is_signed else (1 << signal.length) - 1
+
+        value = self.database.encode(values, scaling=False, strict=False)
+        mask = self.database.encode(masks, scaling=False, strict=False)
+
+        return (int(binascii.hexlify(mask), 16),
+                int(binascii.hexlify(value), 16),
+                decoded_signals,
+                signals)
+
+    def _filter_expected_message(self, data, compiled_filter):
+        """Returns the decoded data if it matches given compiled filter
+        `compiled_filter`, otherwise ``None``.
+
+        """
+
+        mask, value, decoded_signals, signals = compiled_filter
+
+        if mask:
+            data_length = self.database.length
+
+            if len(data) < data_length:
+                decoded_signals = signals
+            elif int(binascii.hexlify(data[:data_length]), 16) & mask != value:
+                return None
+
+        decoded = self.decode(data)
+
+        if all([decoded[name] == decoded_signals[name]
+                for name in decoded_signals]):
+            return decoded
 
     def send_periodic_start(self):
         if not self.enabled:
@@ -194,19 +423,331 @@ class Message(UserDict, object):
             self._periodic_task = None
 
     def _update_can_message(self):
-        arbitration_id = self.database.frame_id
-        extended_id = self.database.is_extended_frame
+        """Encode all signals. The same CAN message object is reused, as
+        it may be sent periodically.
+
+        """
+
         data = self.database.encode(self.data,
                                     self.scaling,
                                     self.padding)
-        self._can_message = can.Message(arbitration_id=arbitration_id,
-                                        extended_id=extended_id,
-                                        data=data)
 
+        if self._can_message is None:
+            self._can_message = self._create_can_message(data)
+        else:
+            self._can_message.data[:] = data
+
+        self._encoded = int(b'0' + binascii.hexlify(data), 16)
+        self._modify_periodic_task()
+
+    def _update_can_message_signals(self, signals):
+        """Encode given signals only, and patch them into current message
+        data. Only possible for messages that are not multiplexed.
+
+        """
+
+        encoded = self._encoded
+
+        for name, value in signals.items():
+            try:
+                codec = self._get_signal_codec(name)
+            except KeyError:
+                continue
+
+            encoded = self._encode_signal(encoded, codec, value)
+
+        self._can_message.data[:] = self._encoded_to_data(encoded)
+        self._encoded = encoded
+        self._modify_periodic_task()
+
+    def _create_can_message(self, data):
+        return can.Message(arbitration_id=self.database.frame_id,
+                           extended_id=self.database.is_extended_frame,
+                           data=data)
+
+    def _encode_signal(self, encoded, codec, value):
+        """Returns given encoded message data `encoded` with given signal
+        value `value` patched into it.
+
+        """
+
+        signal, formats, mask = codec
+        self._check_signal_range(signal, value)
+        encoded &= ~mask
+        encoded |= encode_data({signal.name: value},
+                               [signal],
+                               formats,
+                               self.scaling)
+
+        return encoded
+
+    def _encoded_to_data(self, encoded):
+        length = self.database.length
+
+        return binascii.unhexlify('{:0{}x}'.format(encoded, 2 * length))[:length]
+
+    def encode_frames(self, timestamps, signals):
+        """Encode a CAN message for each row in given time series and
+        return a list of tuples of timestamp and CAN message. `signals`
+        is a dictionary of signal names and sequences of values, with
+        the same length as `timestamps`. Other signals have their
+        current values.
+
+        """
+
+        timestamps = _to_list(timestamps)
+        names = list(signals)
+        columns = []
+
+        for name in names:
+            values = _to_list(signals[name])
+
+            if len(values) != len(timestamps):
+                raise Error(
+                    "expected {} values for signal '{}', but got {}".format(
+                        len(timestamps),
+                        name,
+                        len(values)))
+
+            columns.append(values)
+
+        if columns:
+            rows = list(zip(*columns))
+        else:
+            rows = [()] * len(timestamps)
+
+        frames = []
+
+        if self.database.is_multiplexed():
+            data = dict(self.data)
+
+            for timestamp, values in zip(timestamps, rows):
+                data.update(zip(names, values))
+                encoded = self.database.encode(data,
+                                               self.scaling,
+                                               self.padding)
+                frames.append((timestamp, self._create_can_message(encoded)))
+        else:
+            codecs = []
+
+            for name in names:
+                try:
+                    codecs.append(self._get_signal_codec(name))
+                except KeyError:
+                    raise Error("invalid signal name '{}'".format(name))
+
+            encoded = self._encoded
+
+            for timestamp, values in zip(timestamps, rows):
+                for codec, value in zip(codecs, values):
+                    encoded = self._encode_signal(encoded, codec, value)
+
+                data = self._encoded_to_data(encoded)
+                frames.append((timestamp, self._create_can_message(data)))
+
+        return frames
+
+    def _get_signal_codec(self, name):
+        """Returns given signal, its encoding formats and its mask in the
+        message data.
+
+        """
+
+        try:
+            return self._signal_codecs[name]
+        except KeyError:
+            pass
+
+        signal = self.database.get_signal_by_name(name)
+        length = self.database.length
+        formats = create_encode_decode_formats([signal], length)
+        mask = ~formats.padding_mask & ((1 << (8 * length)) - 1)
+        self._signal_codecs[name] = (signal, formats, mask)
+
+        return self._signal_codecs[name]
+
+    def _check_signal_range(self, signal, value):
+        if not self.scaling or isinstance(value, str):
+            return
+
+        if signal.decimal.minimum is not None:
+            if value < signal.decimal.minimum:
+                raise EncodeError(
+                    "Expected signal '{}' value greater than or equal to "
+                    "{} in message '{}', but got {}.".format(signal.name,
+                                                             signal.decimal.minimum,
+                                                             self.database.name,
+                                                             value))
+
+        if signal.decimal.maximum is not None:
+            if value > signal.decimal.maximum:
+                raise EncodeError(
+                    "Expected signal '{}' value less than or equal to "
+                    "{} in message '{}', but got {}.".format(signal.name,
+                                                             signal.decimal.maximum,
+                                                             self.database.name,
+                                                             value))
+
+    def _modify_periodic_task(self):
         if self._periodic_task is not None:
             self._periodic_task.modify_data(self._can_message)
 
 
+ScheduleStatistics = namedtuple('ScheduleStatistics',
+                                [
+                                    'count',
+                                    'duration',
+                                    'rate',
+                                    'jitter',
+                                    'maximum_lateness'
+                                ])
+
+
+class Schedule(object):
+    """A schedule of time series of signal values to send. All frames
+    are encoded when added to the schedule, and only sent by
+    :meth:`~cantools.tester.Schedule.run()`.
+
+    Create schedules with :meth:`~cantools.tester.Tester.schedule()`.
+
+    """
+
+    def __init__(self, messages, can_bus):
+        self._messages = messages
+        self._can_bus = can_bus
+        self._frames = []
+
+    @property
+    def frames(self):
+        """A list of tuples of timestamp and CAN message to send, sorted
+        by timestamp.
+
+        """
+
+        return self._frames
+
+    def add(self, message_name, timestamps, signals):
+        """Add given time series of signal values `signals` of given
+        message `message_name` to the schedule. `timestamps` is a
+        sequence of timestamps in seconds, and `signals` is a
+        dictionary of signal names and sequences of values. Sequences
+        may be lists, NumPy arrays, or any other iterable. Signals not
+        in `signals` have their current values.
+
+        >>> schedule.add('Message1',
+        ...              numpy.arange(0, 1, 0.001),
+        ...              {'Signal1': numpy.linspace(0, 100, 1000)})
+
+        """
+
+        frames = self._messages[message_name].encode_frames(timestamps,
+                                                            signals)
+        self._frames.extend(frames)
+        self._frames.sort(key=lambda frame: frame[0])
+
+    def add_csv(self,
+                message_name,
+                filename,
+                time_column='time',
+                encoding='utf-8'):
+        """Add time series of signal values of given message
+        `message_name` read from given CSV file `filename`. The first
+        row contains the column names, that is, `time_column` and
+        signal names. Values are converted to integers or floats if
+        possible, otherwise they are used as choice strings. The file
+        is read using given `encoding`.
+
+        """
+
+        with fopen(filename, 'r', encoding=encoding, newline='') as fin:
+            reader = csv.reader(fin)
+            names = next(reader)
+            columns = [[] for _ in names]
+
+            for row in reader:
+                for column, value in zip(columns, row):
+                    column.append(_parse_csv_value(value))
+
+        columns = dict(zip(names, columns))
+
+        try:
+            timestamps = columns.pop(time_column)
+        except KeyError:
+            raise Error(
+                "expected time column '{}' in {}, but got {}".format(
+                    time_column,
+                    filename,
+                    names))
+
+        self.add(message_name, timestamps, columns)
+
+    def run(self):
+        """Send all frames in the schedule, at their timestamps relative to
+        the first frame. Frames are sent at absolute times from the
+        start, so timing errors do not accumulate.
+
+        Returns a :class:`~cantools.tester.ScheduleStatistics`
+        namedtuple with the number of sent frames, the duration in
+        seconds, the achieved rate in frames per second, and the
+        standard deviation and maximum of how late frames were sent,
+        in seconds.
+
+        >>> schedule.run()
+        ScheduleStatistics(count=1000, duration=0.999, rate=1000.0, jitter=4.1e-05, maximum_lateness=0.00021)
+
+        """
+
+        if not self._frames:
+            return ScheduleStatistics(0, 0.0, None, None, None)
+
+        send = self._can_bus.send
+        first_timestamp = self._frames[0][0]
+        lateness_sum = 0.0
+        lateness_square_sum = 0.0
+        maximum_lateness = 0.0
+        start_time = time.perf_counter()
+
+        for timestamp, message in self._frames:
+            deadline = start_time + (timestamp - first_timestamp)
+            delay = deadline - time.perf_counter()
+
+            if delay > 0:
+                time.sleep(delay)
+
+            now = time.perf_counter()
+            send(message)
+            lateness = now - deadline
+            lateness_sum += lateness
+            lateness_square_sum += lateness * lateness
+            maximum_lateness = max(lateness, maximum_lateness)
+
+        count = len(self._frames)
+        duration = now - start_time
+        mean = lateness_sum / count
+        variance = max(lateness_square_sum / count - mean * mean, 0.0)
+
+        if duration > 0:
+            rate = (count - 1) / duration
+        else:
+            rate = None
+
+        return ScheduleStatistics(count,
+                                  duration,
+                                  rate,
+                                  math.sqrt(variance),
+                                  maximum_lateness)
+
+
+def _parse_csv_value(value):
+    for convert in [int, float]:
+        try:
+            return convert(value)
+        except ValueError:
+            pass
+
+    return value
+
+
 class Tester(object):
     """Test given node `dut_name` on given CAN bus `bus_name`.
 
@@ -244,9 +785,8 @@ class Tester(object):
         self._bus_name = bus_name
         self._database = database
         self._can_bus = can_bus
-        self._input_list = []
-        self._input_queue = queue.Queue()
-        self._messages = Messages()
+        self._input_state = InputState()
+        self._messages = self._create_messages()
         self._is_running = False
 
         # DUT name validation.
@@ -272,19 +812,30 @@ class Tester(object):
 
         for message in database.messages:
             if message.bus_name == bus_name:
-                self._messages[message.name] = Message(message,
-                                                       can_bus,
-                                                       self._input_list,
-                                                       self._input_queue,
-                                                       decode_choices,
-                                                       scaling,
-                                                       padding)
+                self._messages[message.name] = self._create_message(
+                    message,
+                    decode_choices,
+                    scaling,
+                    padding)
 
         listener = Listener(self._database,
                             self._messages,
-                            self._input_queue,
                             on_message)
-        self._notifier = can.Notifier(can_bus, [listener])
+        self._notifier = self._create_notifier(listener)
+
+    def _create_messages(self):
+        return Messages()
+
+    def _create_message(self, message, decode_choices, scaling, padding):
+        return Message(message,
+                       self._can_bus,
+                       self._input_state,
+                       decode_choices,
+                       scaling,
+                       padding)
+
+    def _create_notifier(self, listener):
+        return can.Notifier(self._can_bus, [listener])
 
     def start(self):
         """Start the tester. Starts sending enabled periodic messages.
@@ -386,9 +937,9 @@ class Tester(object):
 
         Give `timeout` as ``None`` to wait forever.
 
-        Messages are read from the input queue, and those not matching
-        given `message_name` and `signals` are discarded if
-        `discard_other_messages` is
+        Each message has its own input queue. Messages not matching
+        given `message_name` and `signals`, and received before the
+        expected message, are discarded if `discard_other_messages` is
         ``True``. :meth:`~cantools.tester.Tester.flush_input()` may be
         called to discard all old messages in the input queue before
         calling the expect function.
@@ -404,12 +955,267 @@ class Tester(object):
                                                    timeout,
                                                    discard_other_messages)
 
+    def schedule(self):
+        """Create an empty :class:`~cantools.tester.Schedule` for sending
+        time series of signal values on this tester's bus.
+
+        >>> schedule = tester.schedule()
+        >>> schedule.add('Message1', [0.0, 0.001, 0.002], {'Signal1': [1, 2, 3]})
+        >>> schedule.add_csv('Message2', 'sweep.csv')
+        >>> schedule.run()
+
+        """
+
+        return Schedule(self._messages, self._can_bus)
+
     def flush_input(self):
         """Flush, or discard, all messages in the input queue.
 
         """
 
-        del self._input_list[:]
+        with self._input_state.lock:
+            self._input_state.discarded = self._input_state.sequence
+
+            for message in self._messages.values():
+                message.flush_input()
+
+
+class AsyncMessage(Message):
+
+    def __init__(self,
+                 database,
+                 can_bus,
+                 input_state,
+                 decode_choices,
+                 scaling,
+                 padding,
+                 loop):
+        super(AsyncMessage, self).__init__(database,
+                                           can_bus,
+                                           input_state,
+                                           decode_choices,
+                                           scaling,
+                                           padding)
+        self._loop = loop
+        self._input_waiters = []
+
+    def put_input(self, data):
+        super(AsyncMessage, self).put_input(data)
+
+        for waiter in self._input_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        del self._input_waiters[:]
+
+    async def send(self, signals=None):
+        if signals is not None:
+            self.update(signals)
+
+        # Send a copy in the default executor, as the data may be
+        # updated in the event loop while the bus is sending it.
+        can_message = self._create_can_message(
+            bytearray(self._can_message.data))
+        await self._loop.run_in_executor(None,
+                                         self._can_bus.send,
+                                         can_message)
+
+    async def _wait_for_input(self, timeout=None):
+        waiter = self._loop.create_future()
+        self._input_waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            # Not removed by put_input() if timed out or cancelled.
+            if waiter in self._input_waiters:
+                self._input_waiters.remove(waiter)
+
+    async def expect(self,
+                     signals=None,
+                     timeout=None,
+                     discard_other_messages=True):
+        if signals is None:
+            signals = {}
+
+        if timeout is not None:
+            end_time = self._loop.time() + timeout
+
+        compiled_filter = self._compile_filter(signals)
+        index = 0
+
+        while True:
+            # A message is removed from the input queue and returned
+            # without awaiting in between, so a cancelled expect never
+            # loses a message.
+            with self._input_condition:
+                decoded, index = self._expect_input(compiled_filter,
+                                                    discard_other_messages,
+                                                    index)
+
+            if decoded is not None:
+                return decoded
+
+            if timeout is not None:
+                remaining_time = end_time - self._loop.time()
+
+                if remaining_time <= 0:
+                    break
+            else:
+                remaining_time = None
+
+            await self._wait_for_input(remaining_time)
+
+        # All messages received until now were read, and none of them
+        # matched.
+        if discard_other_messages:
+            with self._input_condition:
+                self._input_state.discarded = self._input_state.sequence
+
+    async def iterate(self, signals=None):
+        """Yield received messages matching given signal values `signals`
+        forever. Non-matching messages with this name are discarded,
+        while messages with other names are left untouched.
+
+        """
+
+        if signals is None:
+            signals = {}
+
+        compiled_filter = self._compile_filter(signals)
+
+        while True:
+            with self._input_condition:
+                self._discard_old_inputs()
+                decoded = None
+
+                while self._inputs and decoded is None:
+                    decoded = self._filter_expected_message(
+                        self._inputs.popleft()[1],
+                        compiled_filter)
+
+            if decoded is None:
+                await self._wait_for_input()
+            else:
+                yield decoded
+
+
+class AsyncMessages(Messages):
+
+    def __call__(self, message_name, signals=None):
+        return self[message_name].iterate(signals)
+
+
+class AsyncTester(Tester):
+    """An :mod:`asyncio` version of :class:`~cantools.tester.Tester`,
+    with awaitable :meth:`~cantools.tester.AsyncTester.send()` and
+    :meth:`~cantools.tester.AsyncTester.expect()`. Received messages
+    are handled in the event loop `loop`, which is the running event
+    loop if ``None``. In that case the tester must be created in a
+    coroutine or callback of the event loop. Many testers may run in
+    the same event loop.
+
+    The on_message callback is called in the event loop.
+
+    Here is an example of how to create a tester and expect a
+    message:
+
+    >>> tester = cantools.tester.AsyncTester('PeriodicConsumer', database, can_bus, 'PeriodicBus')
+    >>> tester.start()
+    >>> await tester.expect('Message2', {'Signal1': 13}, timeout=1.0)
+    {'Signal1': 13, 'Signal2': 9}
+
+    """
+
+    def __init__(self,
+                 dut_name,
+                 database,
+                 can_bus,
+                 bus_name=None,
+                 on_message=None,
+                 decode_choices=True,
+                 scaling=True,
+                 padding=False,
+                 loop=None):
+        if loop is None:
+            loop = _get_running_loop()
+
+        self._loop = loop
+        super(AsyncTester, self).__init__(dut_name,
+                                          database,
+                                          can_bus,
+                                          bus_name,
+                                          on_message,
+                                          decode_choices,
+                                          scaling,
+                                          padding)
+
+    def _create_messages(self):
+        return AsyncMessages()
+
+    def _create_message(self, message, decode_choices, scaling, padding):
+        return AsyncMessage(message,
+                            self._can_bus,
+                            self._input_state,
+                            decode_choices,
+                            scaling,
+                            padding,
+                            self._loop)
+
+    def _create_notifier(self, listener):
+        return can.Notifier(self._can_bus, [listener], loop=self._loop)
+
+    @property
+    def messages(self):
+        """Set and get signals in messages, as
+        :attr:`cantools.tester.Tester.messages`.
+
+        Call it with a message name and optional signal values to
+        asynchronously iterate over received messages.
+
+        >>> tester.messages['PeriodicMessage1']['Signal1'] = 1
+        >>> async for signals in tester.messages('Message2', {'Signal1': 13}):
+        ...     print(signals)
+        {'Signal1': 13, 'Signal2': 9}
+
+        """
+
+        return self._messages
+
+    async def send(self, message_name, signals=None):
+        """Send given message `message_name` and optional signals `signals`.
+
+        The message is sent by the CAN bus in the default executor of
+        the event loop, so a slow bus does not block other testers
+        running in the same event loop.
+
+        >>> await tester.send('Message1', {'Signal2': 10})
+
+        """
+
+        await self._messages[message_name].send(signals)
+
+    async def expect(self,
+                     message_name,
+                     signals=None,
+                     timeout=None,
+                     discard_other_messages=True):
+        """Expect given message `message_name` and signal values `signals`
+        within `timeout` seconds, as
+        :meth:`cantools.tester.Tester.expect()`. The event loop is not
+        blocked while waiting.
+
+        It is safe to cancel the returned coroutine, for example using
+        :func:`asyncio.wait_for()`. No message is lost if cancelled.
+
+        >>> await tester.expect('Message2', {'Signal1': 13})
+        {'Signal1': 13, 'Signal2': 9}
+
+        """
 
-        while not self._input_queue.empty():
-            self._input_queue.get()
+        return await self._messages[message_name].expect(
+            signals,
+            timeout,
+            discard_other_messages)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+#
+# Compare J1939 frame id unpacking using bitstruct, which was used by
+# cantools before, with the integer and NumPy implementations.
+#
+# > python3 j1939.py
+# Unpacking 100000 frame ids.
+# frame_id_unpack (bitstruct):         1.949 s
+# frame_id_unpack:                     0.063 s
+# frame_id_unpack_array:               0.000 s
+# pgn_from_frame_id (bitstruct):       4.367 s
+# pgn_from_frame_id:                   0.025 s
+# pgn_from_frame_id_array:             0.001 s
+#
+
+import timeit
+import random
+
+import bitstruct
+import numpy
+
+import cantools
+
+
+NUMBER_OF_FRAME_IDS = 100000
+
+
+def bitstruct_frame_id_unpack(frame_id):
+    packed = bitstruct.pack('u29', frame_id)
+
+    return cantools.j1939.FrameId(*bitstruct.unpack('u3u1u1u8u8u8', packed))
+
+
+def bitstruct_pgn_from_frame_id(frame_id):
+    unpacked = bitstruct_frame_id_unpack(frame_id)
+
+    if unpacked.pdu_format < 240:
+        pdu_specific = 0
+    else:
+        pdu_specific = unpacked.pdu_specific
+
+    packed = bitstruct.pack('u1u1u8u8',
+                            unpacked.reserved,
+                            unpacked.data_page,
+                            unpacked.pdu_format,
+                            pdu_specific)
+
+    return bitstruct.unpack('u18', packed)[0]
+
+
+def measure(name, function):
+    elapsed = min(timeit.repeat(function, number=1, repeat=3))
+    print('{:36} {:.3f} s'.format(name + ':', elapsed))
+
+
+frame_ids = [random.randrange(0x20000000) for _ in range(NUMBER_OF_FRAME_IDS)]
+frame_ids_array = numpy.array(frame_ids, dtype=numpy.uint32)
+
+print('Unpacking {} frame ids.'.format(NUMBER_OF_FRAME_IDS))
+
+measure('frame_id_unpack (bitstruct)',
+        lambda: [bitstruct_frame_id_unpack(frame_id) for frame_id in frame_ids])
+measure('frame_id_unpack',
+        lambda: [cantools.j1939.frame_id_unpack(frame_id)
+                 for frame_id in frame_ids])
+measure('frame_id_unpack_array',
+        lambda: cantools.j1939.frame_id_unpack_array(frame_ids_array))
+measure('pgn_from_frame_id (bitstruct)',
+        lambda: [bitstruct_pgn_from_frame_id(frame_id)
+                 for frame_id in frame_ids])
+measure('pgn_from_frame_id',
+        lambda: [cantools.j1939.pgn_from_frame_id(frame_id)
+                 for frame_id in frame_ids])
+measure('pgn_from_frame_id_array',
+        lambda: cantools.j1939.pgn_from_frame_id_array(frame_ids_array))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+#
+# Measure the time to load a database with large multiplexed CAN FD
+# messages, with and without strict signal checks.
+#
+# > python3 load.py
+# Loading 10 messages with 256 multiplexer ids each.
+# Strict:                              15.139 s
+# Not strict:                          16.403 s
+#
+# Strict loading took 135 seconds before the signal overlap check used
+# integer bitmasks.
+#
+
+import timeit
+
+import cantools
+from cantools.database.can import Database
+from cantools.database.can import Message
+from cantools.database.can import Signal
+
+
+NUMBER_OF_MESSAGES = 10
+NUMBER_OF_MULTIPLEXER_IDS = 256
+MESSAGE_LENGTH = 64
+
+
+def create_message(frame_id):
+    signals = [
+        Signal('Mux', 0, 8, 'little_endian', is_multiplexer=True)
+    ]
+
+    # Each multiplexer id has its own set of 16 bits signals, spread
+    # over the whole frame.
+    for multiplexer_id in range(NUMBER_OF_MULTIPLEXER_IDS):
+        for start in range(8, 8 * MESSAGE_LENGTH - 8, 16):
+            signals.append(
+                Signal('S_{}_{}'.format(multiplexer_id, start),
+                       start,
+                       16,
+                       'little_endian',
+                       multiplexer_ids=[multiplexer_id],
+                       multiplexer_signal='Mux'))
+
+    return Message(frame_id,
+                   'M{}'.format(frame_id),
+                   MESSAGE_LENGTH,
+                   signals,
+                   strict=False)
+
+
+def main():
+    database = Database([
+        create_message(frame_id)
+        for frame_id in range(NUMBER_OF_MESSAGES)
+    ])
+    string = database.as_dbc_string()
+
+    print('Loading {} messages with {} multiplexer ids each.'.format(
+        NUMBER_OF_MESSAGES,
+        NUMBER_OF_MULTIPLEXER_IDS))
+
+    for name, strict in [('Strict', True), ('Not strict', False)]:
+        elapsed = timeit.timeit(
+            lambda: cantools.database.load_string(string,
+                                                  database_format='dbc',
+                                                  strict=strict),
+            number=1)
+        print('{:36s} {:.3f} s'.format(name + ':', elapsed))
+
+
+if __name__ == '__main__':
+    main()
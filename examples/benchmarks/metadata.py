@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+#
+# Measure the time and memory to load a DBC file with a comment and
+# an attribute for each message and signal, with metadata loaded
+# fully, lazily and not at all.
+#
+# > python3 metadata.py
+# Loading 500 messages with 40 signals each (20000 signals).
+#                                      Time      Size      Peak
+# Metadata 'full':                     2.65 s    30.9 MiB  99.6 MiB
+# Metadata 'lazy':                     1.75 s    26.2 MiB  60.2 MiB
+# Metadata 'none':                     1.50 s    19.9 MiB  55.2 MiB
+#
+
+import time
+import tracemalloc
+
+import cantools
+
+
+NUMBER_OF_MESSAGES = 500
+NUMBER_OF_SIGNALS = 40
+
+
+def create_dbc_string():
+    lines = [
+        'VERSION ""',
+        '',
+        'BS_:',
+        '',
+        'BU_: Sender Receiver',
+        ''
+    ]
+    comments = []
+    attributes = []
+
+    for message in range(NUMBER_OF_MESSAGES):
+        frame_id = (0x80000000 | message)
+        lines.append('BO_ {} Message{}: 64 Sender'.format(frame_id, message))
+        comments.append('CM_ BO_ {} "Message {} comment.";'.format(frame_id,
+                                                                   message))
+        attributes.append('BA_ "GenMsgCycleTime" BO_ {} 100;'.format(frame_id))
+
+        for signal in range(NUMBER_OF_SIGNALS):
+            name = 'Signal{}_{}'.format(message, signal)
+            lines.append(
+                ' SG_ {} : {}|8@1+ (0.5,-10) [-10|117.5] "km/h" '
+                'Receiver'.format(name, 8 * signal))
+            comments.append(
+                'CM_ SG_ {} {} "Signal {} of message {}, which has a rather '
+                'long comment.";'.format(frame_id, name, signal, message))
+            attributes.append(
+                'BA_ "GenSigSendType" SG_ {} {} 1;'.format(frame_id, name))
+
+        lines.append('')
+
+    definitions = [
+        'BA_DEF_ BO_  "GenMsgCycleTime" INT 0 65535;',
+        'BA_DEF_ SG_  "GenSigSendType" ENUM  "Cyclic","OnWrite";',
+        'BA_DEF_DEF_  "GenMsgCycleTime" 0;',
+        'BA_DEF_DEF_  "GenSigSendType" "Cyclic";'
+    ]
+
+    return '\n'.join(lines + comments + definitions + attributes) + '\n'
+
+
+def main():
+    string = create_dbc_string()
+
+    print('Loading {} messages with {} signals each ({} signals).'.format(
+        NUMBER_OF_MESSAGES,
+        NUMBER_OF_SIGNALS,
+        NUMBER_OF_MESSAGES * NUMBER_OF_SIGNALS))
+    print('{:36s} {:9s} {:9s} {}'.format('', 'Time', 'Size', 'Peak'))
+
+    for metadata in ['full', 'lazy', 'none']:
+        start_time = time.time()
+        database = cantools.database.load_string(string,
+                                                 database_format='dbc',
+                                                 metadata=metadata)
+        elapsed = time.time() - start_time
+        del database
+
+        tracemalloc.start()
+        database = cantools.database.load_string(string,
+                                                 database_format='dbc',
+                                                 metadata=metadata)
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del database
+
+        print('{:36s} {:<9s} {:<9s} {:.1f} MiB'.format(
+            "Metadata '{}':".format(metadata),
+            '{:.2f} s'.format(elapsed),
+            '{:.1f} MiB'.format(size / 1024 ** 2),
+            peak / 1024 ** 2))
+
+
+if __name__ == '__main__':
+    main()
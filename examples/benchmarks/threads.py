@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+#
+# Measure the number of messages decoded per second by one or more
+# threads sharing a database, while another thread refreshes it.
+#
+# > python3 threads.py
+# Decoding for 2 seconds per thread count.
+# Threads  Refreshes  Decodes/s  Errors
+#       1       1332     100503       0
+#       2        901     141131       0
+#       4        455     145711       0
+#       8        255     244237       0
+#
+# Decoding takes no locks, and never fails while the database is
+# refreshed. Because of the global interpreter lock, more decoding
+# threads get a larger share of the time than the refreshing thread
+# but do not run in parallel.
+#
+
+import threading
+import time
+
+import cantools
+
+
+DURATION = 2
+
+
+def decode(database, stop, results):
+    decodes = 0
+    errors = 0
+
+    while not stop.is_set():
+        try:
+            database.decode_message(496, b'\xc0\x06\xe0\x00\x00\x00\x00\x00')
+            database.decode_message('BREMSE_33',
+                                    b'\x01\x02\x03\x04\x05\x06\x07\x08')
+            decodes += 2
+        except Exception:
+            errors += 1
+
+    results.append((decodes, errors))
+
+
+def main():
+    database = cantools.database.load_file(
+        '../../tests/files/dbc/motohawk.dbc')
+    database.add_dbc_file('../../tests/files/dbc/abs.dbc')
+
+    print('Decoding for {} seconds per thread count.'.format(DURATION))
+    print('Threads  Refreshes  Decodes/s  Errors')
+
+    for number_of_threads in [1, 2, 4, 8]:
+        stop = threading.Event()
+        results = []
+        threads = [
+            threading.Thread(target=decode, args=(database, stop, results))
+            for _ in range(number_of_threads)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        refreshes = 0
+        end_time = time.time() + DURATION
+
+        while time.time() < end_time:
+            database.refresh()
+            refreshes += 1
+
+        stop.set()
+
+        for thread in threads:
+            thread.join()
+
+        print('{:7d} {:10d} {:10.0f} {:7d}'.format(
+            number_of_threads,
+            refreshes,
+            sum(decodes for decodes, _ in results) / DURATION,
+            sum(errors for _, errors in results)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+/**
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2018-2019 Erik Moqvist
+ *
+ * Permission is hereby granted, free of charge, to any person
+ * obtaining a copy of this software and associated documentation
+ * files (the "Software"), to deal in the Software without
+ * restriction, including without limitation the rights to use, copy,
+ * modify, merge, publish, distribute, sublicense, and/or sell copies
+ * of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+/**
+
+ */
+
+#include <string.h>
+
+#include "motohawk_word_wise.h"
+
+static inline void pack_big_endian_u64(
+    uint8_t *dst_p,
+    uint64_t value,
+    size_t size)
+{
+    uint8_t buf[8];
+
+    buf[0] = (uint8_t)(value >> 56u);
+    buf[1] = (uint8_t)(value >> 48u);
+    buf[2] = (uint8_t)(value >> 40u);
+    buf[3] = (uint8_t)(value >> 32u);
+    buf[4] = (uint8_t)(value >> 24u);
+    buf[5] = (uint8_t)(value >> 16u);
+    buf[6] = (uint8_t)(value >> 8u);
+    buf[7] = (uint8_t)value;
+
+    memcpy(dst_p, &buf[0], size);
+}
+
+static inline uint64_t unpack_big_endian_u64(
+    const uint8_t *src_p,
+    size_t size)
+{
+    uint8_t buf[8];
+
+    memset(&buf[0], 0, sizeof(buf));
+    memcpy(&buf[0], src_p, size);
+
+    return (((uint64_t)buf[0] << 56u)
+            | ((uint64_t)buf[1] << 48u)
+            | ((uint64_t)buf[2] << 40u)
+            | ((uint64_t)buf[3] << 32u)
+            | ((uint64_t)buf[4] << 24u)
+            | ((uint64_t)buf[5] << 16u)
+            | ((uint64_t)buf[6] << 8u)
+            | (uint64_t)buf[7]);
+}
+
+int motohawk_word_wise_example_message_pack(
+    uint8_t *dst_p,
+    const struct motohawk_word_wise_example_message_t *src_p,
+    size_t size)
+{
+    uint16_t temperature;
+    uint64_t word_be_0;
+
+    if (size < 8u) {
+        return (-EINVAL);
+    }
+
+    memset(&dst_p[0], 0, 8);
+
+    word_be_0 = 0;
+
+    word_be_0 |= (((uint64_t)src_p->enable & 0x1u) << 63u);
+    word_be_0 |= (((uint64_t)src_p->average_radius & 0x3fu) << 57u);
+    temperature = (uint16_t)src_p->temperature;
+    word_be_0 |= (((uint64_t)temperature & 0xfffu) << 45u);
+
+    pack_big_endian_u64(&dst_p[0], word_be_0, 8u);
+
+    return (8);
+}
+
+int motohawk_word_wise_example_message_unpack(
+    struct motohawk_word_wise_example_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    uint16_t temperature;
+    uint64_t word_be_0;
+
+    if (size < 8u) {
+        return (-EINVAL);
+    }
+
+    word_be_0 = unpack_big_endian_u64(&src_p[0], 8u);
+
+    dst_p->enable = (uint8_t)((word_be_0 >> 63u) & 0x1u);
+    dst_p->average_radius = (uint8_t)((word_be_0 >> 57u) & 0x3fu);
+    temperature = (uint16_t)((word_be_0 >> 45u) & 0xfffu);
+
+    if ((temperature & (1u << 11)) != 0u) {
+        temperature |= 0xf000u;
+    }
+
+    dst_p->temperature = (int16_t)temperature;
+
+    return (0);
+}
+
+uint8_t motohawk_word_wise_example_message_enable_encode(double value)
+{
+    return (uint8_t)(value);
+}
+
+double motohawk_word_wise_example_message_enable_decode(uint8_t value)
+{
+    return ((double)value);
+}
+
+bool motohawk_word_wise_example_message_enable_is_in_range(uint8_t value)
+{
+    return (value <= 1u);
+}
+
+uint8_t motohawk_word_wise_example_message_average_radius_encode(double value)
+{
+    return (uint8_t)(value / 0.1);
+}
+
+double motohawk_word_wise_example_message_average_radius_decode(uint8_t value)
+{
+    return ((double)value * 0.1);
+}
+
+bool motohawk_word_wise_example_message_average_radius_is_in_range(uint8_t value)
+{
+    return (value <= 50u);
+}
+
+int16_t motohawk_word_wise_example_message_temperature_encode(double value)
+{
+    return (int16_t)((value - 250.0) / 0.01);
+}
+
+double motohawk_word_wise_example_message_temperature_decode(int16_t value)
+{
+    return (((double)value * 0.01) + 250.0);
+}
+
+bool motohawk_word_wise_example_message_temperature_is_in_range(int16_t value)
+{
+    return ((value >= -2048) && (value <= 2047));
+}
@@ -0,0 +1,127 @@
+/**
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2018-2019 Erik Moqvist
+ *
+ * Permission is hereby granted, free of charge, to any person
+ * obtaining a copy of this software and associated documentation
+ * files (the "Software"), to deal in the Software without
+ * restriction, including without limitation the rights to use, copy,
+ * modify, merge, publish, distribute, sublicense, and/or sell copies
+ * of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+ * BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+ * ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+/**
+
+ */
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <time.h>
+
+#include "multiplex_2_dispatch.h"
+
+/* A standard frame id not in the database. */
+#define UNKNOWN_FRAME_ID (0x00u)
+
+struct frame_t {
+    uint32_t frame_id;
+    bool is_extended_frame;
+};
+
+static const struct frame_t frames[] = {
+    { MULTIPLEX_2_DISPATCH_EXTENDED_FRAME_ID, MULTIPLEX_2_DISPATCH_EXTENDED_IS_EXTENDED },
+    { MULTIPLEX_2_DISPATCH_NORMAL_FRAME_ID, MULTIPLEX_2_DISPATCH_NORMAL_IS_EXTENDED },
+    { MULTIPLEX_2_DISPATCH_SHARED_FRAME_ID, MULTIPLEX_2_DISPATCH_SHARED_IS_EXTENDED },
+    { MULTIPLEX_2_DISPATCH_EXTENDED_TYPES_FRAME_ID, MULTIPLEX_2_DISPATCH_EXTENDED_TYPES_IS_EXTENDED }
+};
+
+#define NUMBER_OF_FRAMES (sizeof(frames) / sizeof(frames[0]))
+
+static void print_result(const char *name_p,
+                         long iterations,
+                         clock_t start,
+                         long errors)
+{
+    double elapsed;
+
+    elapsed = ((double)(clock() - start) / CLOCKS_PER_SEC);
+
+    printf("%s: %ld frames in %.3f s (%.1f ns per frame, %ld not unpacked).\n",
+           name_p,
+           iterations,
+           elapsed,
+           1e9 * elapsed / (double)iterations,
+           errors);
+}
+
+int main(int argc, const char *argv[])
+{
+    struct multiplex_2_dispatch_message_t message;
+    const struct frame_t *frame_p;
+    uint8_t data[64];
+    long iterations;
+    long errors;
+    long i;
+    clock_t start;
+
+    iterations = 10000000;
+
+    if (argc == 2) {
+        iterations = atol(argv[1]);
+    }
+
+    memset(&data[0], 0, sizeof(data));
+
+    /* Lookup and unpack of frames in the database. */
+    errors = 0;
+    start = clock();
+
+    for (i = 0; i < iterations; i++) {
+        frame_p = &frames[(size_t)i % NUMBER_OF_FRAMES];
+
+        if (multiplex_2_dispatch_unpack(&message,
+                                   frame_p->frame_id,
+                                   frame_p->is_extended_frame,
+                                   &data[0],
+                                   sizeof(data)) != 0) {
+            errors++;
+        }
+    }
+
+    print_result("Dispatch and unpack", iterations, start, errors);
+
+    /* Lookup only, as the frame id is not in the database. */
+    errors = 0;
+    start = clock();
+
+    for (i = 0; i < iterations; i++) {
+        if (multiplex_2_dispatch_unpack(&message,
+                                   UNKNOWN_FRAME_ID,
+                                   false,
+                                   &data[0],
+                                   sizeof(data)) != 0) {
+            errors++;
+        }
+    }
+
+    print_result("Dispatch of unknown frame id", iterations, start, errors);
+
+    return (0);
+}
@@ -1,6 +1,7 @@
 /* Include the generated files first to test that all required header
    files are included. */
 #include "files/c_source/motohawk.h"
+#include "files/c_source/motohawk_word_wise.h"
 #include "files/c_source/padding_bit_order.h"
 #include "files/c_source/vehicle.h"
 #include "files/c_source/multiplex.h"
@@ -81,6 +82,30 @@ TEST(motohawk_example_message)
     }
 }
 
+TEST(motohawk_word_wise_example_message)
+{
+    struct motohawk_word_wise_example_message_t unpacked;
+    uint8_t buf[8];
+
+    unpacked.temperature = -2047;
+    unpacked.average_radius = 32;
+    unpacked.enable = 1;
+
+    memset(&buf[0], 0xff, sizeof(buf));
+    ASSERT_EQ(motohawk_word_wise_example_message_pack(&buf[0],
+                                                      &unpacked,
+                                                      sizeof(buf)), 8);
+    ASSERT_MEMORY_EQ(&buf[0], "\xc1\x00\x20\x00\x00\x00\x00\x00", sizeof(buf));
+
+    memset(&unpacked, 0, sizeof(unpacked));
+    ASSERT_EQ(motohawk_word_wise_example_message_unpack(&unpacked,
+                                                        &buf[0],
+                                                        sizeof(buf)), 0);
+    ASSERT_EQ(unpacked.temperature, -2047);
+    ASSERT_EQ(unpacked.average_radius, 32);
+    ASSERT_EQ(unpacked.enable, 1);
+}
+
 TEST(padding_bit_order_msg0)
 {
     struct padding_bit_order_msg0_t unpacked;
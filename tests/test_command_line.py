@@ -231,6 +231,60 @@ IO_DEBUG(
                     actual_output = stdout.getvalue()
                     self.assertEqual(actual_output, expected_output)
 
+    def test_decode_input_format_asc(self):
+        argv = [
+            'cantools',
+            'decode',
+            '--single-line',
+            '--input-format', 'asc',
+            'tests/files/dbc/socialledge.dbc'
+        ]
+
+        expected_output = """\
+(0.000000) 0 0C8#F000000000000000 :: SENSOR_SONARS(SENSOR_SONARS_mux: 0, SENSOR_SONARS_err_count: 15, SENSOR_SONARS_left: 0.0, SENSOR_SONARS_middle: 0.0, SENSOR_SONARS_right: 0.0, SENSOR_SONARS_rear: 0.0)
+(0.158536) 0 064#F001FFFFFFFFFFFF :: DRIVER_HEARTBEAT(DRIVER_HEARTBEAT_cmd: 240)
+(0.159678) 0 ERROR
+(0.388868) 0 1F4#01020304 :: IO_DEBUG(IO_DEBUG_test_unsigned: 1, IO_DEBUG_test_enum: 'IO_DEBUG_test2_enum_two', IO_DEBUG_test_signed: 3, IO_DEBUG_test_float: 2.0)
+(0.720426) 0 1F3#010203 :: Unknown frame id 499 (0x1f3)
+"""
+
+        stdout = StringIO()
+
+        with open('tests/files/logs/socialledge.asc', 'r') as fin:
+            with patch('sys.stdin', fin):
+                with patch('sys.stdout', stdout):
+                    with patch('sys.argv', argv):
+                        cantools._main()
+                        actual_output = stdout.getvalue()
+                        self.assertEqual(actual_output, expected_output)
+
+    def test_decode_input_format_blf(self):
+        argv = [
+            'cantools',
+            'decode',
+            '--single-line',
+            '--input-format', 'blf',
+            'tests/files/dbc/socialledge.dbc'
+        ]
+
+        expected_output = """\
+(1594172461.968000) 0 0C8#F000000000000000 :: SENSOR_SONARS(SENSOR_SONARS_mux: 0, SENSOR_SONARS_err_count: 15, SENSOR_SONARS_left: 0.0, SENSOR_SONARS_middle: 0.0, SENSOR_SONARS_right: 0.0, SENSOR_SONARS_rear: 0.0)
+(1594172462.126536) 0 064#F001FFFFFFFFFFFF :: DRIVER_HEARTBEAT(DRIVER_HEARTBEAT_cmd: 240)
+(1594172462.127678) 0 ERROR
+(1594172462.356868) 0 1F4#01020304 :: IO_DEBUG(IO_DEBUG_test_unsigned: 1, IO_DEBUG_test_enum: 'IO_DEBUG_test2_enum_two', IO_DEBUG_test_signed: 3, IO_DEBUG_test_float: 2.0)
+(1594172462.688426) 0 1F3#010203 :: Unknown frame id 499 (0x1f3)
+"""
+
+        stdout = StringIO()
+
+        with open('tests/files/logs/socialledge.blf', 'rb') as fin:
+            with patch('sys.stdin', fin):
+                with patch('sys.stdout', stdout):
+                    with patch('sys.argv', argv):
+                        cantools._main()
+                        actual_output = stdout.getvalue()
+                        self.assertEqual(actual_output, expected_output)
+
     def test_decode_muxed_data(self):
         argv = [
             'cantools',
@@ -1144,6 +1198,101 @@ BATTERY_VT(
             self.assert_files_equal(fuzzer_mk,
                                     'tests/files/c_source/' + fuzzer_mk)
 
+    def test_generate_c_source_dispatch(self):
+        argv = [
+            'cantools',
+            'generate_c_source',
+            '--database-name', 'multiplex_2_dispatch',
+            '--generate-dispatch-benchmark',
+            'tests/files/dbc/multiplex_2.dbc'
+        ]
+
+        database_h = 'multiplex_2_dispatch.h'
+        database_c = 'multiplex_2_dispatch.c'
+        benchmark_c = 'multiplex_2_dispatch_dispatch_benchmark.c'
+
+        for filename in [database_h, database_c, benchmark_c]:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+        with patch('sys.argv', argv):
+            cantools._main()
+
+        if sys.version_info[0] > 2:
+            self.assert_files_equal(database_h,
+                                    'tests/files/c_source/' + database_h)
+            self.assert_files_equal(database_c,
+                                    'tests/files/c_source/' + database_c)
+            self.assert_files_equal(benchmark_c,
+                                    'tests/files/c_source/' + benchmark_c)
+
+    def test_generate_c_source_dispatch_same_frame_id(self):
+        def create_database(is_extended_frame):
+            return cantools.database.can.Database([
+                cantools.database.can.Message(0x10, 'Standard', 8, []),
+                cantools.database.can.Message(
+                    0x10,
+                    'Extended',
+                    8,
+                    [],
+                    is_extended_frame=is_extended_frame)
+            ])
+
+        # A standard and an extended message with the same frame id
+        # are both dispatched.
+        _, source, _, _ = cantools.database.can.c_source.generate(
+            create_database(True),
+            'same',
+            'same.h',
+            'same.c',
+            'same_fuzzer.c',
+            dispatch=True)
+
+        self.assertIn('    0x10u,\n    0x80000010u\n', source)
+        self.assertIn('res = same_standard_unpack(', source)
+        self.assertIn('res = same_extended_unpack(', source)
+
+        # Two messages with the same frame id and IDE flag are not.
+        with self.assertRaises(cantools.database.errors.Error) as cm:
+            cantools.database.can.c_source.generate(create_database(False),
+                                                    'same',
+                                                    'same.h',
+                                                    'same.c',
+                                                    'same_fuzzer.c',
+                                                    dispatch=True)
+
+        self.assertEqual(
+            str(cm.exception),
+            'Messages with the same frame id and IDE flag can not be '
+            'dispatched: Standard and Extended (0x10).')
+
+    def test_generate_c_source_word_wise(self):
+        argv = [
+            'cantools',
+            'generate_c_source',
+            '--database-name', 'motohawk_word_wise',
+            '--word-wise',
+            'tests/files/dbc/motohawk.dbc'
+        ]
+
+        database_h = 'motohawk_word_wise.h'
+        database_c = 'motohawk_word_wise.c'
+
+        if os.path.exists(database_h):
+            os.remove(database_h)
+
+        if os.path.exists(database_c):
+            os.remove(database_c)
+
+        with patch('sys.argv', argv):
+            cantools._main()
+
+        if sys.version_info[0] > 2:
+            self.assert_files_equal(database_h,
+                                    'tests/files/c_source/' + database_h)
+            self.assert_files_equal(database_c,
+                                    'tests/files/c_source/' + database_c)
+
     def test_generate_c_source_sym(self):
         databases = [
             ('min-max-only-6.0', 'min_max_only_6_0'),
@@ -5,6 +5,7 @@ import math
 import unittest
 from decimal import Decimal
 from collections import namedtuple
+from collections import OrderedDict
 import textparser
 import os
 import re
@@ -17,12 +18,18 @@ except ImportError:
 import logging
 from xml.etree import ElementTree
 import timeit
+import threading
 
 try:
     from StringIO import StringIO
 except ImportError:
     from io import StringIO
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 import cantools
 from cantools.database.can.formats import dbc
 from cantools.database import UnsupportedDatabaseFormatError
@@ -72,6 +79,289 @@ class CanToolsDatabaseTest(unittest.TestCase):
         self.assertEqual(i, 15)
         self.assert_dbc_dump(db, filename)
 
+    def test_lazily_allocated_fields(self):
+        """Signals have no instance dictionaries, and the receivers list,
+        the decimal object and DBC specifics dictionaries are
+        allocated on first access.
+
+        """
+
+        signal = cantools.database.can.Signal('S', 0, 8)
+
+        self.assertFalse(hasattr(signal, '__dict__'))
+
+        with self.assertRaises(AttributeError):
+            signal.foo = 1
+
+        signal.receivers.append('Node')
+        self.assertEqual(signal.receivers, ['Node'])
+        signal.decimal.scale = Decimal('0.1')
+        self.assertEqual(signal.decimal.scale, Decimal('0.1'))
+
+        dbc = cantools.database.can.formats.dbc.DbcSpecifics()
+        self.assertEqual(dbc.attributes, {})
+        dbc.value_tables['Table'] = {0: 'Off'}
+        self.assertEqual(dbc.value_tables, {'Table': {0: 'Off'}})
+
+    def test_shared_choices(self):
+        """Signals with equal choices share the same dictionary until
+        accessed, and modifying the choices of one signal does not
+        modify the choices of other signals.
+
+        """
+
+        db = cantools.database.load_file('tests/files/dbc/vehicle.dbc')
+        message = db.get_message_by_name('RT_SB_INS_Attitude')
+        yaw = message.get_signal_by_name('Validity_Yaw')
+        pitch = message.get_signal_by_name('Validity_Pitch')
+        roll = message.get_signal_by_name('Validity_Roll')
+
+        self.assertIs(yaw._choices, pitch._choices)
+        self.assertIs(yaw._choices, roll._choices)
+        decoded = message.decode(b'\x01\x00\x00\x00\x00\x00\x00\x00')
+        self.assertEqual(decoded['Validity_Yaw'], 'Valid')
+        self.assertIs(yaw._choices, pitch._choices)
+
+        # Edit the choices of one signal.
+        choices = yaw.choices
+        self.assertIs(type(choices), OrderedDict)
+        self.assertEqual(choices, {0: 'Invalid', 1: 'Valid'})
+        choices[1] = 'Okay'
+        choices[99] = 'X'
+        self.assertIs(yaw.choices, choices)
+        self.assertEqual(yaw.choices, {0: 'Invalid', 1: 'Okay', 99: 'X'})
+        self.assertEqual(pitch.choices, {0: 'Invalid', 1: 'Valid'})
+        self.assertEqual(roll.choices, {0: 'Invalid', 1: 'Valid'})
+        self.assertIsNot(pitch.choices, roll.choices)
+
+        # Encode and decode with the edited choices.
+        decoded = message.decode(b'\x07\x00\x00\x00\x00\x00\x00\x00')
+        self.assertEqual(decoded['Validity_Yaw'], 'Okay')
+        self.assertEqual(decoded['Validity_Pitch'], 'Valid')
+        decoded['Validity_Yaw'] = 'Okay'
+        self.assertEqual(message.encode(decoded),
+                         b'\x07\x00\x00\x00\x00\x00\x00\x00')
+
+    def test_dbc_load_lazy_metadata(self):
+        """Comments, attributes and environment variables loaded lazily are
+        equal to loaded ones, and are not loaded at all if metadata is
+        'none'.
+
+        """
+
+        for filename in ['tests/files/dbc/foobar.dbc',
+                         'tests/files/dbc/emc32.dbc',
+                         'tests/files/dbc/long_names.dbc']:
+            db = cantools.database.load_file(filename)
+            db_lazy = cantools.database.load_file(filename, metadata='lazy')
+
+            self.assertEqual(db_lazy.as_dbc_string(), db.as_dbc_string())
+            self.assertEqual(db_lazy.dbc.environment_variables.keys(),
+                             db.dbc.environment_variables.keys())
+
+        db = cantools.database.load_file('tests/files/dbc/foobar.dbc',
+                                         metadata='lazy')
+        message = db.get_message_by_frame_id(0x12330)
+        signal = message.get_signal_by_name('Bar')
+        self.assertEqual(db.nodes[1].comment, 'fam "1"')
+        self.assertEqual(message.comment, 'Foo.')
+        self.assertEqual(signal.comment, 'Bar.')
+        self.assertEqual(db.dbc.attributes['AFloat'].value, 33.5)
+        self.assertEqual(db.nodes[2].dbc.attributes['BAR'].value, 'FUM')
+
+        # Attributes needed to load the database are always loaded.
+        db = cantools.database.load_file('tests/files/dbc/foobar.dbc',
+                                         metadata='none')
+        message = db.get_message_by_frame_id(0x12331)
+        self.assertEqual(db.buses[0].name, 'TheBusName')
+        self.assertEqual(message.cycle_time, 1)
+        self.assertIsNone(message.comment)
+        self.assertIsNone(db.nodes[1].comment)
+        self.assertIsNone(message.signals[0].comment)
+        self.assertEqual(len(db.dbc.environment_variables), 0)
+
+        db = cantools.database.load_file('tests/files/dbc/long_names.dbc',
+                                         metadata='none')
+        self.assertEqual(db.messages[0].name,
+                         'SS12345678901234567890123458789012345')
+
+        with self.assertRaises(ValueError) as cm:
+            cantools.database.load_file('tests/files/dbc/foobar.dbc',
+                                        metadata='some')
+
+        self.assertEqual(
+            str(cm.exception),
+            "expected metadata 'full', 'lazy' or 'none', but got 'some'")
+
+    def test_reload(self):
+        """Reloading keeps unchanged messages and their codecs, and only
+        creates codecs for changed and new messages.
+
+        """
+
+        filename = 'tests/files/dbc/foobar.dbc'
+        db = cantools.database.load_file(filename)
+        messages = list(db.messages)
+        codecs = [message._codecs for message in messages]
+        refreshed = []
+        refresh = cantools.database.can.Message.refresh
+
+        def refresh_spy(message, strict=None):
+            refreshed.append(message.name)
+            refresh(message, strict)
+
+        with patch.object(cantools.database.can.Message,
+                          'refresh',
+                          refresh_spy):
+            db.reload_file(filename)
+
+        self.assertEqual(refreshed, [])
+        self.assertEqual(len(db.messages), len(messages))
+
+        for message, old_message, old_codecs in zip(db.messages,
+                                                    messages,
+                                                    codecs):
+            self.assertIs(message, old_message)
+            self.assertIs(message._codecs, old_codecs)
+
+        with open(filename, 'r') as fin:
+            string = fin.read()
+
+        # Change the scale of Fum, add a message and remove FOOBAR.
+        string = string.replace(
+            ' SG_ Fum : 0|12@1- (1,0) [0|10] ""  BAR',
+            ' SG_ Fum : 0|12@1- (2,0) [0|20] ""  BAR')
+        string = string.replace(
+            'BO_ 780 FOOBAR: 8 FIE\n'
+            ' SG_ ACC_02_CRC : 0|12@1- (1,0) [0|1] ""  BAR\n',
+            'BO_ 781 New: 1 FIE\n'
+            ' SG_ NewSignal : 0|8@1+ (1,0) [0|0] ""  BAR\n')
+
+        with patch.object(cantools.database.can.Message,
+                          'refresh',
+                          refresh_spy):
+            db.reload_string(string, 'dbc')
+
+        self.assertEqual(refreshed, ['Fum', 'New'])
+
+        self.assertEqual([message.name for message in db.messages],
+                         ['Foo', 'Fum', 'Bar', 'CanFd', 'New'])
+        self.assertIs(db.get_message_by_name('Foo'), messages[0])
+        self.assertIsNot(db.get_message_by_name('Fum'), messages[1])
+        self.assertIs(db.get_message_by_name('CanFd'), messages[3])
+        self.assertIs(messages[3]._codecs, codecs[3])
+        self.assertEqual(db.decode_message('Fum', b'\x01\x00\x00\x00\x00'),
+                         {'Fum': 2, 'Fam': 'Disabled'})
+        self.assertEqual(db.decode_message(781, b'\x05'), {'NewSignal': 5})
+
+        with self.assertRaises(KeyError):
+            db.get_message_by_name('FOOBAR')
+
+        with self.assertRaises(KeyError):
+            db.get_message_by_frame_id(780)
+
+        with self.assertRaises(ValueError) as cm:
+            db.reload_string(string, 'cdd')
+
+        self.assertEqual(
+            str(cm.exception),
+            "expected database format 'arxml', 'dbc', 'kcd' or 'sym', but got "
+            "'cdd'")
+
+    def test_decode_while_refreshing(self):
+        """Decoding from several threads never fails while the database is
+        refreshed and reloaded in another thread.
+
+        """
+
+        filename = 'tests/files/dbc/foobar.dbc'
+        db = cantools.database.load_file(filename)
+
+        with open(filename, 'r') as fin:
+            string = fin.read()
+
+        strings = [
+            string,
+            string.replace(' SG_ Fum : 0|12@1- (1,0) [0|10] ""  BAR',
+                           ' SG_ Fum : 0|12@1- (2,0) [0|20] ""  BAR')
+        ]
+        stop = threading.Event()
+        errors = []
+        counts = []
+
+        def decode():
+            count = 0
+
+            try:
+                while not stop.is_set():
+                    decoded = db.decode_message(0x12331,
+                                                b'\x01\x00\x00\x00\x00')
+                    self.assertIn(decoded['Fum'], [1, 2])
+                    self.assertEqual(decoded['Fam'], 'Disabled')
+                    decoded = db.decode_message(
+                        'Foo',
+                        b'\x01\x02\x00\x00\x00\x00\x00\x00')
+                    self.assertEqual(decoded, {'Foo': 229.68, 'Bar': 0.0})
+                    decoded = db.decode_message(
+                        780,
+                        b'\x01\x00\x00\x00\x00\x00\x00\x00')
+                    self.assertEqual(decoded, {'ACC_02_CRC': 1})
+                    count += 1
+            except Exception as e:
+                errors.append(e)
+
+            counts.append(count)
+
+        threads = [threading.Thread(target=decode) for _ in range(4)]
+
+        # Switch threads often to make a partially refreshed database
+        # visible if there is one.
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+
+        try:
+            for thread in threads:
+                thread.start()
+
+            for i in range(100):
+                db.refresh()
+                db.get_message_by_name('Foo').refresh()
+                db.reload_string(strings[i % 2], 'dbc')
+        finally:
+            stop.set()
+
+            for thread in threads:
+                thread.join()
+
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(counts), 4)
+
+    def test_freeze(self):
+        db = cantools.database.load_file('tests/files/dbc/foobar.dbc')
+        string = db.as_dbc_string()
+
+        self.assertFalse(db.frozen)
+        db.freeze()
+        self.assertTrue(db.frozen)
+        self.assertIsInstance(db.messages, tuple)
+        self.assertIsInstance(db.nodes, tuple)
+        self.assertEqual(db.as_dbc_string(), string)
+        self.assertEqual(db.decode_message('Fum', b'\x01\x00\x00\x00\x00'),
+                         {'Fum': 1, 'Fam': 'Disabled'})
+
+        for modify in [db.refresh,
+                       lambda: db.add_dbc_string(string),
+                       lambda: db.add_kcd_file('tests/files/kcd/the_homer.kcd'),
+                       lambda: db.reload_string(string, 'dbc'),
+                       lambda: setattr(db, 'version', '1.0')]:
+            with self.assertRaises(cantools.database.Error) as cm:
+                modify()
+
+            self.assertEqual(str(cm.exception),
+                             'The database is frozen and can not be modified.')
+
     def test_dbc_signal_initial_value(self):
         filename = 'tests/files/dbc/vehicle.dbc'
         db = cantools.database.load_file(filename)
@@ -3811,10 +4101,25 @@ class CanToolsDatabaseTest(unittest.TestCase):
             return
 
         filename = 'tests/files/kcd/dump.kcd'
+        filename_dump = 'as_kcd_string_dump.kcd'
         db = cantools.database.load_file(filename)
 
         with open(filename, 'r') as fin:
-            self.assertEqual(db.as_kcd_string(), fin.read())
+            expected = fin.read()
+
+        self.assertEqual(db.as_kcd_string(), expected)
+
+        # Streamed to a file object.
+        fp = StringIO()
+        db.dump_kcd(fp)
+        self.assertEqual(fp.getvalue(), expected)
+
+        cantools.database.dump_file(db, filename_dump)
+
+        with open(filename_dump, 'r') as fin:
+            self.assertEqual(fin.read(), expected)
+
+        os.remove(filename_dump)
 
     def test_issue_62(self):
         """Test issue 62.
@@ -4094,6 +4399,190 @@ class CanToolsDatabaseTest(unittest.TestCase):
 
             self.assertEqual(str(cm.exception), data.message)
 
+    def test_j1939_pgn_from_frame_id(self):
+        Data = namedtuple('Data', ['frame_id', 'pgn'])
+
+        datas = [
+            Data(frame_id=0x18feee00, pgn=0xfeee),
+            Data(frame_id=0x0cef1234, pgn=0xef00),
+            Data(frame_id=0x1fffffff, pgn=0x3ffff),
+            Data(frame_id=0x0, pgn=0x0)
+        ]
+
+        for data in datas:
+            self.assertEqual(cantools.j1939.pgn_from_frame_id(data.frame_id),
+                             data.pgn)
+
+        with self.assertRaises(cantools.Error) as cm:
+            cantools.j1939.pgn_from_frame_id(0x20000000)
+
+        self.assertEqual(str(cm.exception),
+                         'Expected a frame id 0..0x1fffffff, but got 0x20000000.')
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_j1939_frame_id_unpack_array(self):
+        frame_ids = numpy.array([0x18feee00, 0x0cef1234, 0x1fffffff],
+                                dtype=numpy.uint32)
+
+        unpacked = cantools.j1939.frame_id_unpack_array(frame_ids)
+
+        for i, frame_id in enumerate(frame_ids):
+            self.assertEqual(tuple(int(value[i]) for value in unpacked),
+                             cantools.j1939.frame_id_unpack(int(frame_id)))
+
+        self.assertEqual(
+            cantools.j1939.pgn_from_frame_id_array(frame_ids).tolist(),
+            [0xfeee, 0xef00, 0x3ffff])
+
+        with self.assertRaises(cantools.Error) as cm:
+            cantools.j1939.pgn_from_frame_id_array([0x1, 0x20000000])
+
+        self.assertEqual(str(cm.exception),
+                         'Expected a frame id 0..0x1fffffff, but got 0x20000000.')
+
+    def test_j1939_transport_protocol(self):
+        signals = [
+            cantools.database.can.Signal('Signal1', 0, 8),
+            cantools.database.can.Signal('Signal2', 152, 8)
+        ]
+        message = cantools.database.can.Message(frame_id=0x18feca00,
+                                                name='Message1',
+                                                length=20,
+                                                signals=signals,
+                                                is_extended_frame=True)
+        db = cantools.database.can.Database([message])
+        transport_protocol = cantools.j1939.TransportProtocol(db)
+        data = bytes(range(1, 21))
+
+        # BAM, with the last packet first.
+        frames = [
+            (0x1cecff00, b'\x20\x14\x00\x03\xff\xca\xfe\x00'),
+            (0x1cebff00, b'\x03\x0f\x10\x11\x12\x13\x14\xff'),
+            (0x18ffff00, b'\x01\x00\x00\x00\x00\x00\x00\x00'),
+            (0x1cebff00, b'\x01\x01\x02\x03\x04\x05\x06\x07')
+        ]
+
+        for frame_id, frame_data in frames:
+            self.assertIsNone(transport_protocol.feed(frame_id, frame_data, 0.0))
+
+        reassembled = transport_protocol.feed(
+            0x1cebff00,
+            b'\x02\x08\x09\x0a\x0b\x0c\x0d\x0e',
+            0.0)
+        self.assertEqual(reassembled.pgn, 0xfeca)
+        self.assertEqual(reassembled.priority, 7)
+        self.assertEqual(reassembled.source_address, 0x00)
+        self.assertEqual(reassembled.destination_address, 0xff)
+        self.assertEqual(reassembled.data, data)
+        self.assertEqual(reassembled.signals, {'Signal1': 1, 'Signal2': 20})
+        self.assertEqual(transport_protocol.sessions, {})
+
+        # RTS/CTS of an unknown PGN, with a retransmitted packet.
+        frames = [
+            (0x18ec2a01, b'\x10\x0a\x00\x02\x02\x00\xef\x00'),
+            (0x18ec012a, b'\x11\x02\x01\xff\xff\x00\xef\x00'),
+            (0x18eb2a01, b'\x01\x01\x02\x03\x04\x05\x06\x00'),
+            (0x18eb2a01, b'\x01\x01\x02\x03\x04\x05\x06\x07')
+        ]
+
+        for frame_id, frame_data in frames:
+            self.assertIsNone(transport_protocol.feed(frame_id, frame_data, 1.0))
+
+        reassembled = transport_protocol.feed(
+            0x18eb2a01,
+            b'\x02\x08\x09\x0a\xff\xff\xff\xff',
+            1.0)
+        self.assertEqual(reassembled.pgn, 0xef00)
+        self.assertEqual(reassembled.source_address, 0x01)
+        self.assertEqual(reassembled.destination_address, 0x2a)
+        self.assertEqual(reassembled.data, bytes(range(1, 11)))
+        self.assertIsNone(reassembled.signals)
+
+        # ETP with a data packet offset.
+        frames = [
+            (0x18c82a01, b'\x14\x14\x00\x00\x00\xca\xfe\x00'),
+            (0x18c82a01, b'\x16\x02\x01\x00\x00\xca\xfe\x00'),
+            (0x18c72a01, b'\x01\x08\x09\x0a\x0b\x0c\x0d\x0e'),
+            (0x18c72a01, b'\x02\x0f\x10\x11\x12\x13\x14\xff'),
+            (0x18c82a01, b'\x16\x01\x00\x00\x00\xca\xfe\x00')
+        ]
+
+        for frame_id, frame_data in frames:
+            self.assertIsNone(transport_protocol.feed(frame_id, frame_data, 2.0))
+
+        reassembled = transport_protocol.feed(
+            0x18c72a01,
+            b'\x01\x01\x02\x03\x04\x05\x06\x07',
+            2.0)
+        self.assertEqual(reassembled.data, data)
+        self.assertEqual(reassembled.signals, {'Signal1': 1, 'Signal2': 20})
+
+        # Aborted session.
+        transport_protocol.feed(0x18ec2a01,
+                                b'\x10\x0a\x00\x02\x02\x00\xef\x00',
+                                3.0)
+        self.assertEqual(list(transport_protocol.sessions), [(0x01, 0x2a, 0xef00)])
+        transport_protocol.feed(0x18ec012a,
+                                b'\xff\x01\xff\xff\xff\x00\xef\x00',
+                                3.0)
+        self.assertEqual(transport_protocol.sessions, {})
+
+        # Timed out session.
+        transport_protocol.feed(0x1cecff00,
+                                b'\x20\x14\x00\x03\xff\xca\xfe\x00',
+                                4.0)
+        transport_protocol.feed(0x1cebff00,
+                                b'\x01\x01\x02\x03\x04\x05\x06\x07',
+                                5.0)
+        self.assertEqual(list(transport_protocol.sessions), [(0x00, 0xff, 0xfeca)])
+        self.assertIsNone(
+            transport_protocol.feed(0x1cebff00,
+                                    b'\x02\x08\x09\x0a\x0b\x0c\x0d\x0e',
+                                    6.5))
+        self.assertEqual(transport_protocol.sessions, {})
+
+        # A second session between the same nodes, with another PGN,
+        # replaces the first one.
+        frames = [
+            (0x1cecff00, b'\x20\x14\x00\x03\xff\xca\xfe\x00'),
+            (0x1cebff00, b'\x01\x01\x02\x03\x04\x05\x06\x07'),
+            (0x1cecff00, b'\x20\x0a\x00\x02\xff\x00\xef\x00'),
+            (0x1cebff00, b'\x02\x08\x09\x0a\xff\xff\xff\xff')
+        ]
+
+        for frame_id, frame_data in frames:
+            self.assertIsNone(transport_protocol.feed(frame_id, frame_data, 7.0))
+
+        self.assertEqual(list(transport_protocol.sessions),
+                         [(0x00, 0xff, 0xef00)])
+        reassembled = transport_protocol.feed(
+            0x1cebff00,
+            b'\x01\x01\x02\x03\x04\x05\x06\x07',
+            7.0)
+        self.assertEqual(reassembled.pgn, 0xef00)
+        self.assertEqual(reassembled.data, bytes(range(1, 11)))
+        self.assertEqual(transport_protocol.sessions, {})
+
+    def test_j1939_transport_protocol_limits(self):
+        transport_protocol = cantools.j1939.TransportProtocol(
+            maximum_number_of_sessions=2,
+            maximum_size=100)
+
+        for source_address in range(3):
+            transport_protocol.feed(0x1cecff00 | source_address,
+                                    b'\x20\x14\x00\x03\xff\xca\xfe\x00',
+                                    0.0)
+
+        self.assertEqual(list(transport_protocol.sessions),
+                         [(0x01, 0xff, 0xfeca), (0x02, 0xff, 0xfeca)])
+
+        # Too big.
+        transport_protocol.feed(0x1cecff05,
+                                b'\x20\x65\x00\x0f\xff\xca\xfe\x00',
+                                0.0)
+        self.assertEqual(list(transport_protocol.sessions),
+                         [(0x01, 0xff, 0xfeca), (0x02, 0xff, 0xfeca)])
+
     def test_float_dbc(self):
         filename = 'tests/files/dbc/floating_point.dbc'
         db = cantools.database.load_file(filename)
@@ -4738,6 +5227,49 @@ class CanToolsDatabaseTest(unittest.TestCase):
         db = cantools.database.load_file(filename)
         self.assert_dbc_dump(db, filename_dumped)
 
+    def test_long_names_dump_does_not_modify_database(self):
+        """Dumping long names must not modify the database, and streaming
+        the DBC file gives the same output as formatting it as a
+        string.
+
+        """
+
+        can = cantools.database.can
+        db = cantools.database.Database(
+            messages=[
+                can.message.Message(
+                    frame_id=1,
+                    name='MSG456789_123456789_123456789_ABC',
+                    length=8,
+                    signals=[
+                        can.signal.Signal(name='SIG456789_123456789_123456789_ABC',
+                                          start=9,
+                                          length=8,
+                                          receivers=['NODE56789_abcdefghi_ABCDEFGHI_XYZ'])
+                    ])
+            ],
+            nodes=[
+                can.node.Node('NODE56789_abcdefghi_ABCDEFGHI_XYZ', None)
+            ])
+        string = db.as_dbc_string()
+
+        self.assertIn('BO_ 1 MSG456789_123456789_123456789_AB: 8 Vector__XXX',
+                      string)
+        self.assertIsNone(db.dbc)
+        self.assertEqual(db.nodes[0].name, 'NODE56789_abcdefghi_ABCDEFGHI_XYZ')
+        self.assertIsNone(db.nodes[0].dbc)
+        message = db.messages[0]
+        self.assertEqual(message.name, 'MSG456789_123456789_123456789_ABC')
+        self.assertIsNone(message.dbc)
+        signal = message.signals[0]
+        self.assertEqual(signal.name, 'SIG456789_123456789_123456789_ABC')
+        self.assertEqual(signal.receivers, ['NODE56789_abcdefghi_ABCDEFGHI_XYZ'])
+        self.assertIsNone(signal.dbc)
+
+        fp = StringIO()
+        db.dump_dbc(fp)
+        self.assertEqual(fp.getvalue(), string)
+
     def test_database_version(self):
         # default value if db created from scratch (map None to ''):
         db = cantools.database.Database()
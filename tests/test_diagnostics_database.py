@@ -246,6 +246,214 @@ class CanToolsDiagnosticsDatabaseTest(unittest.TestCase):
         db.add_cdd_file('tests/files/cdd/example.cdd', encoding='iso-8859-1')
         self.assertEqual(len(db.dids), 15)
 
+    def test_long_did(self):
+        Did = cantools.database.diagnostics.Did
+        Data = cantools.database.diagnostics.Data
+        did = Did(0x1234,
+                  'Long',
+                  1000,
+                  [
+                      Data('First', 0, 8),
+                      Data('Second', 12, 8),
+                      Data('Last', 8 * 998, 16)
+                  ])
+
+        # Only the used bytes are encoded and decoded.
+        self.assertEqual([(segment.begin, segment.end)
+                          for segment in did._codec['segments']],
+                         [(0, 3), (998, 1000)])
+
+        decoded = {'First': 1, 'Second': 0x23, 'Last': 0x4567}
+        encoded = did.encode(decoded)
+        self.assertEqual(encoded[:3], b'\x01\x30\x02')
+        self.assertEqual(encoded[3:998], 995 * b'\x00')
+        self.assertEqual(encoded[998:], b'\x67\x45')
+        self.assertEqual(did.decode(encoded), decoded)
+        self.assertEqual(did.decode(encoded[:998] + b'\x01\x02'),
+                         {'First': 1, 'Second': 0x23, 'Last': 0x0201})
+
+    def test_decode_many(self):
+        db = cantools.db.load_file('tests/files/cdd/example.cdd',
+                                   encoding='iso-8859-1')
+
+        did = db.get_did_by_name('Coding')
+        self.assertEqual(
+            did.decode_many([b'\x21\x03', b'\x22\x05']),
+            [
+                {
+                    'Country_variant': 'Europe',
+                    'Vehicle_type': 'Sedan',
+                    'Special_setting': 3
+                },
+                {
+                    'Country_variant': 'USA',
+                    'Vehicle_type': 'Sedan',
+                    'Special_setting': 5
+                }
+            ])
+        self.assertEqual(did.decode_many([]), [])
+
+        # Same as decoding each data with decode().
+        for did in db.dids:
+            datas = [
+                bytes([(7 * i + j) % 256 for j in range(did.length + 1)])
+                for i in range(10)
+            ]
+
+            for decode_choices in [False, True]:
+                for scaling in [False, True]:
+                    decoded = did.decode_many(datas, decode_choices, scaling)
+                    self.assertEqual(
+                        [list(decoded_data.items())
+                         for decoded_data in decoded],
+                        [list(did.decode(data,
+                                         decode_choices,
+                                         scaling).items())
+                         for data in datas])
+
+    def test_decode_dids(self):
+        db = cantools.db.load_file('tests/files/cdd/example.cdd',
+                                   encoding='iso-8859-1')
+
+        # Responses with one or more DIDs.
+        decoded = db.decode_dids([
+            b'\x62\x00\xa0\x21\x03',
+            b'\x62\x00\x92\x01\x02\x03\x04\x00\xa0\x22\x05'
+        ])
+        self.assertEqual(
+            decoded,
+            [
+                {
+                    'Coding': {
+                        'Country_variant': 'Europe',
+                        'Vehicle_type': 'Sedan',
+                        'Special_setting': 3
+                    }
+                },
+                {
+                    'Serial_Number': {'Serial_Number': 67305985},
+                    'Coding': {
+                        'Country_variant': 'USA',
+                        'Vehicle_type': 'Sedan',
+                        'Special_setting': 5
+                    }
+                }
+            ])
+        self.assertEqual(list(decoded[1]), ['Serial_Number', 'Coding'])
+        self.assertEqual(db.decode_dids([]), [])
+
+        # Bad responses.
+        datas = [
+            (
+                b'\x7f\x22\x31',
+                'expected ReadDataByIdentifier positive response 0x62, '
+                'but got b\'\\x7f\''
+            ),
+            (
+                b'\x62\x00\xa0\x21\x03\x00',
+                "expected a 2 bytes DID identifier, but got b'\\x00'"
+            ),
+            (
+                b'\x62\x12\x34\x00',
+                'invalid DID identifier 0x1234'
+            ),
+            (
+                b'\x62\x00\x92\x01\x02',
+                "expected 4 bytes of DID 'Serial_Number' data, but got 2"
+            )
+        ]
+
+        for response, message in datas:
+            with self.assertRaises(cantools.database.DecodeError) as cm:
+                db.decode_dids([response])
+
+            self.assertEqual(str(cm.exception), message)
+
+    def test_isotp_read_data_by_identifier(self):
+        db = cantools.db.load_file('tests/files/cdd/example.cdd',
+                                   encoding='iso-8859-1')
+        transport_protocol = cantools.isotp.TransportProtocol(
+            db,
+            frame_ids=[0x7e8])
+
+        # ECU_Identification response in a first frame and a
+        # consecutive frame. Other frames are ignored.
+        frames = [
+            (0x7e8, b'\x10\x0d\x62\x00\x90\x01\x02\x03'),
+            (0x7e0, b'\x30\x00\x00\x00\x00\x00\x00\x00'),
+            (0x123, b'\x21\x04\x05\x06\x07\x08\x09\x0a')
+        ]
+
+        for frame_id, data in frames:
+            self.assertIsNone(transport_protocol.feed(frame_id, data, 0.0))
+
+        message = transport_protocol.feed(
+            0x7e8,
+            b'\x21\x04\x05\x06\x07\x08\x09\x0a',
+            0.0)
+        self.assertEqual(message.frame_id, 0x7e8)
+        self.assertEqual(message.data,
+                         b'\x62\x00\x90\x01\x02\x03\x04\x05\x06\x07'
+                         b'\x08\x09\x0a')
+        self.assertEqual(message.did.name, 'ECU_Identification')
+        self.assertEqual(message.decoded,
+                         {
+                             'Ident_Number_7_6': 0x0201,
+                             'Ident_Number_5_4': 0x0403,
+                             'Ident_Number_3_2': 0x0605,
+                             'Ident_Number_1_0': 0x0807,
+                             'Diagnostic_Identification': 0x0a09
+                         })
+        self.assertEqual(transport_protocol.sessions, {})
+
+        # Single frame with a negative response.
+        message = transport_protocol.feed(0x7e8, b'\x03\x7f\x22\x31', 0.0)
+        self.assertEqual(message.data, b'\x7f\x22\x31')
+        self.assertIsNone(message.did)
+        self.assertIsNone(message.decoded)
+
+    def test_isotp_sessions(self):
+        transport_protocol = cantools.isotp.TransportProtocol(
+            maximum_number_of_sessions=2,
+            maximum_size=20)
+
+        # Lost consecutive frame.
+        transport_protocol.feed(0x1, b'\x10\x14\x01\x02\x03\x04\x05\x06', 0.0)
+        self.assertIsNone(
+            transport_protocol.feed(0x1, b'\x22\x01\x02\x03\x04\x05\x06\x07', 0.0))
+        self.assertEqual(transport_protocol.sessions, {})
+
+        # Too long.
+        transport_protocol.feed(0x1, b'\x10\x15\x01\x02\x03\x04\x05\x06', 0.0)
+        self.assertEqual(transport_protocol.sessions, {})
+
+        # Maximum number of sessions.
+        for frame_id in [0x1, 0x2, 0x3]:
+            transport_protocol.feed(frame_id,
+                                    b'\x10\x14\x01\x02\x03\x04\x05\x06',
+                                    0.0)
+
+        self.assertEqual(list(transport_protocol.sessions), [0x2, 0x3])
+
+        # Timeout.
+        transport_protocol.feed(0x2, b'\x21\x01\x02\x03\x04\x05\x06\x07', 0.5)
+        transport_protocol.feed(0x4, b'\x10\x14\x01\x02\x03\x04\x05\x06', 1.25)
+        self.assertEqual(list(transport_protocol.sessions), [0x2, 0x4])
+
+        # Sequence number wrap around.
+        transport_protocol = cantools.isotp.TransportProtocol()
+        transport_protocol.feed(0x1, b'\x10\x76\x00\x01\x02\x03\x04\x05', 0.0)
+        message = None
+
+        for i in range(1, 17):
+            self.assertIsNone(message)
+            message = transport_protocol.feed(
+                0x1,
+                bytes([0x20 | (i & 0xf)]) + bytes(range(7 * i - 1, 7 * i + 6)),
+                0.0)
+
+        self.assertEqual(message.data, bytes(range(118)))
+
 
 # This file is not '__main__' when executed via 'python setup.py3
 # test'.
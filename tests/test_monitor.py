@@ -1,3 +1,6 @@
+import math
+import time
+import queue
 import unittest
 import curses
 
@@ -11,7 +14,11 @@ except ImportError:
     from mock import call
 
 import can
+import cantools
 from cantools.subparsers.monitor import Monitor
+from cantools.subparsers.monitor import Worker
+from cantools.subparsers.monitor import Statistics
+from cantools.subparsers.monitor import RingBuffer
 
 
 class Args(object):
@@ -27,6 +34,9 @@ class Args(object):
         self.bit_rate = None
         self.bus_type = 'socketcan'
         self.channel = 'vcan0'
+        self.max_fps = 0
+        self.queue_size = 10000
+        self.drop_policy = 'oldest'
 
 
 class StdScr(object):
@@ -40,6 +50,7 @@ class StdScr(object):
         self.clear = Mock()
         self.addstr = Mock()
         self.refresh = Mock()
+        self.clrtoeol = Mock()
         self.keypad = Mock()
 
         if user_input is None:
@@ -49,6 +60,22 @@ class StdScr(object):
         self.move = Mock()
 
 
+def process_pending(monitor):
+    """Process all queued frames in the test thread, as the worker thread
+    is not started.
+
+    """
+
+    try:
+        while True:
+            monitor._worker.process(monitor._queue.get_nowait())
+    except queue.Empty:
+        pass
+
+
+# The worker thread is not started. Queued frames are instead processed
+# in the test thread by calling process_pending().
+@patch.object(Worker, 'start', Mock())
 class CanToolsMonitorTest(unittest.TestCase):
 
     maxDiff = None
@@ -97,14 +124,14 @@ class CanToolsMonitorTest(unittest.TestCase):
             [
                 call(0,
                      0,
-                     'Received: 0, Discarded: 0, Errors: 0'),
+                     'Received: 0, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(1,
                      0,
                      '   TIMESTAMP  MESSAGE                                           ',
                      'green'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -134,13 +161,14 @@ class CanToolsMonitorTest(unittest.TestCase):
         monitor.on_message_received(can.Message(
             arbitration_id=496,
             data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00'))
+        process_pending(monitor)
         monitor.run()
 
         # Check mocks.
         self.assert_called(
             stdscr.addstr,
             [
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
+                call(0, 0, 'Received: 1, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(1,
                      0,
                      '   TIMESTAMP  MESSAGE                                           ',
@@ -152,7 +180,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -183,24 +211,22 @@ class CanToolsMonitorTest(unittest.TestCase):
         monitor.on_message_received(can.Message(
             arbitration_id=496,
             data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00'))
+        process_pending(monitor)
         monitor.run()
 
         # Check mocks.
         self.assert_called(
             stdscr.addstr,
             [
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
+                call(0, 0, 'Received: 1, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(1,
                      0,
                      '   TIMESTAMP  MESSAGE                                           ',
                      'green'),
-                call(2,
-                     0,
-                     "       0.000  ExampleMessage(Enable: 'Enabled' -, "
-                     "AverageRadius: 3.2 m, Temperature: 250.55 degK)"),
+                call(2, 0, "       0.000  ExampleMessage(Enable: 'Enabled' -, AverageRadius:"),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -230,20 +256,21 @@ class CanToolsMonitorTest(unittest.TestCase):
         monitor.on_message_received(can.Message(
             arbitration_id=1025,
             data=b'\x24\x00\x98\x98\x0b\x00'))
+        process_pending(monitor)
         monitor.run()
 
         # Check mocks.
         self.assert_called(
             stdscr.addstr,
             [
-                call(0, 0, 'Received: 1, Discarded: 1, Errors: 0'),
+                call(0, 0, 'Received: 1, Discarded: 1, Dropped: 0, Queue: 0, Errors: 0'),
                 call(1,
                      0,
                      '   TIMESTAMP  MESSAGE                                           ',
                      'green'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -273,13 +300,14 @@ class CanToolsMonitorTest(unittest.TestCase):
         monitor.on_message_received(can.Message(
             arbitration_id=1025,
             data=b'\x00\x00\x98\x98\x0b\x00'))
+        process_pending(monitor)
         monitor.run()
 
         # Check mocks.
         self.assert_called(
             stdscr.addstr,
             [
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
+                call(0, 0, 'Received: 1, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(1,
                      0,
                      '   TIMESTAMP  MESSAGE                                           ',
@@ -291,7 +319,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -322,24 +350,22 @@ class CanToolsMonitorTest(unittest.TestCase):
         monitor.on_message_received(can.Message(
             arbitration_id=1025,
             data=b'\x00\x00\x98\x98\x0b\x00'))
+        process_pending(monitor)
         monitor.run()
 
         # Check mocks.
         self.assert_called(
             stdscr.addstr,
             [
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
+                call(0, 0, 'Received: 1, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(1,
                      0,
                      '   TIMESTAMP  MESSAGE                                           ',
                      'green'),
-                call(2,
-                     0,
-                     "       0.000  BATTERY_VT(BATTERY_VT_INDEX: 0, "
-                     "MODULE_VOLTAGE_00: 39064, MODULE_TEMP_00: 11)"),
+                call(2, 0, '       0.000  BATTERY_VT(BATTERY_VT_INDEX: 0, MODULE_VOLTAGE_00:'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -383,13 +409,14 @@ class CanToolsMonitorTest(unittest.TestCase):
             arbitration_id=0xc00fefe,
             data=b'\x20\x00\x00\x00\x01\x00\x00\x00',
             timestamp=3.0))
+        process_pending(monitor)
         monitor.run()
 
         # Check mocks.
         self.assert_called(
             stdscr.addstr,
             [
-                call(0, 0, 'Received: 4, Discarded: 0, Errors: 0'),
+                call(0, 0, 'Received: 4, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(1,
                      0,
                      '   TIMESTAMP  MESSAGE                                           ',
@@ -408,7 +435,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                      "       2.000  Extended(S0: 1, S5: 0, S6: 1, S7: 0)"),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -443,13 +470,14 @@ class CanToolsMonitorTest(unittest.TestCase):
             arbitration_id=496,
             data=b'\xc0\x06\xd0\x00\x00\x00\x00\x00',
             timestamp=2.1))
+        process_pending(monitor)
         monitor.run()
 
         # Check mocks.
         self.assert_called(
             stdscr.addstr,
             [
-                call(0, 0, 'Received: 2, Discarded: 0, Errors: 0'),
+                call(0, 0, 'Received: 2, Discarded: 0, Dropped: 1, Queue: 0, Errors: 0'),
                 call(1,
                      0,
                      '   TIMESTAMP  MESSAGE                                           ',
@@ -461,7 +489,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -493,6 +521,7 @@ class CanToolsMonitorTest(unittest.TestCase):
         monitor.on_message_received(can.Message(
             arbitration_id=496,
             data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00'))
+        process_pending(monitor)
         monitor.run()
 
         # Check mocks.
@@ -500,7 +529,7 @@ class CanToolsMonitorTest(unittest.TestCase):
             stdscr.addstr,
             [
                 # No filter.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
+                call(0, 0, 'Received: 1, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(1,
                      0,
                      '   TIMESTAMP  MESSAGE                                           ',
@@ -512,42 +541,22 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan'),
 
                 # 'f' pressed.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
                 call(29,
                      0,
                      'Filter:                                                         ',
                      'cyan'),
 
                 # No match on 'Y'.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
                 call(29,
                      0,
                      'Filter: Y                                                       ',
                      'cyan'),
 
                 # Invalid filter 'Y['.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
                 call(2, 0, '       0.000  ExampleMessage('),
                 call(3, 0, "                  Enable: 'Enabled' -,"),
                 call(4, 0, '                  AverageRadius: 3.2 m,'),
@@ -559,44 +568,24 @@ class CanToolsMonitorTest(unittest.TestCase):
                      'cyan'),
 
                 # No match on 'Y'.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
                 call(29,
                      0,
                      'Filter: Y                                                       ',
                      'cyan'),
 
                 # Hit enter to hide filter.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan'),
 
                 # 'f' pressed again.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
                 call(29,
                      0,
                      'Filter: Y                                                       ',
                      'cyan'),
 
                 # Backspace.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
                 call(2, 0, '       0.000  ExampleMessage('),
                 call(3, 0, "                  Enable: 'Enabled' -,"),
                 call(4, 0, '                  AverageRadius: 3.2 m,'),
@@ -608,38 +597,55 @@ class CanToolsMonitorTest(unittest.TestCase):
                      'cyan'),
 
                 # Match on 'E'.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
                 call(29,
                      0,
                      'Filter: E                                                       ',
                      'cyan'),
 
                 # Hit enter to hide filter.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
+        # Rows no longer displayed are cleared, and the cursor is
+        # placed after the filter.
+        self.assert_called(
+            stdscr.move,
+            [
+                # 'f' pressed.
+                call(29, 8),
+
+                # No match on 'Y'.
+                call(2, 0),
+                call(3, 0),
+                call(4, 0),
+                call(5, 0),
+                call(6, 0),
+                call(29, 9),
+
+                # Invalid filter 'Y['.
+                call(29, 10),
+
+                # No match on 'Y'.
+                call(2, 0),
+                call(3, 0),
+                call(4, 0),
+                call(5, 0),
+                call(6, 0),
+                call(29, 9),
+
+                # 'f' pressed again.
+                call(29, 9),
+
+                # Backspace.
+                call(29, 8),
+
+                # Match on 'E'.
+                call(29, 9)
+            ])
+
     @patch('can.Notifier')
     @patch('can.Bus')
     @patch('curses.color_pair')
@@ -676,6 +682,7 @@ class CanToolsMonitorTest(unittest.TestCase):
             data=b'\xc0\x06\xb0\x00\x00\x00\x00\x00',
             timestamp=6))
 
+        process_pending(monitor)
         monitor.tick()
         monitor.tick()
         monitor.tick()
@@ -686,6 +693,7 @@ class CanToolsMonitorTest(unittest.TestCase):
             data=b'\xc0\x06\xc0\x00\x00\x00\x00\x00',
             timestamp=7))
 
+        process_pending(monitor)
         monitor.tick()
 
         # Input when paused. Will not be displayed.
@@ -694,6 +702,7 @@ class CanToolsMonitorTest(unittest.TestCase):
             data=b'\xc0\x06\xd0\x00\x00\x00\x00\x00',
             timestamp=10))
 
+        process_pending(monitor)
         monitor.tick()
         monitor.tick()
         monitor.tick()
@@ -704,6 +713,7 @@ class CanToolsMonitorTest(unittest.TestCase):
             data=b'\xc0\x06\x00\x00\x00\x00\x00\x00',
             timestamp=11))
 
+        process_pending(monitor)
         monitor.run()
 
         # Check mocks.
@@ -711,7 +721,7 @@ class CanToolsMonitorTest(unittest.TestCase):
             stdscr.addstr,
             [
                 # One ok and one with bad frame id.
-                call(0, 0, 'Received: 2, Discarded: 1, Errors: 0'),
+                call(0, 0, 'Received: 2, Discarded: 1, Dropped: 0, Queue: 0, Errors: 0'),
                 call(1,
                      0,
                      '   TIMESTAMP  MESSAGE                                           ',
@@ -723,76 +733,37 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29
                      ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan'),
 
                 # 'f' pressed.
-                call(0, 0, 'Received: 2, Discarded: 1, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
                 call(29
                      ,
                      0, 'Filter:                                                         ',
                      'cyan'),
 
                 # 'E' pressed.
-                call(0, 0, 'Received: 2, Discarded: 1, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
                 call(29
                      ,
                      0, 'Filter: E                                                       ',
                      'cyan'),
 
                 # '\n' pressed.
-                call(0, 0, 'Received: 3, Discarded: 1, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
+                call(0, 0, 'Received: 3, Discarded: 1, Dropped: 0, Queue: 0, Errors: 0'),
                 call(2, 0, '       4.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
                 call(5, 0, '                  Temperature: 250.54 degK'),
-                call(6, 0, '              )'),
                 call(29
                      ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan'),
 
                 # 'p' pressed. Input frame not displayed.
 
                 # 'r' pressed.
-                call(0, 0, 'Received: 0, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
-                call(29
-                     ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
-                     'cyan'),
+                call(0, 0, 'Received: 0, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
 
                 # Input after reset. 'f' pressed.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
+                call(0, 0, 'Received: 1, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(2, 0, '       0.000  ExampleMessage('),
                 call(3, 0, "                  Enable: 'Enabled' -,"),
                 call(4, 0, '                  AverageRadius: 3.2 m,'),
@@ -804,19 +775,9 @@ class CanToolsMonitorTest(unittest.TestCase):
                      'cyan'),
 
                 # '\n' pressed.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.48 degK'),
-                call(6, 0, '              )'),
                 call(29
                      ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
 
                 # 'q' pressed, no redraw.
@@ -854,6 +815,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
                 timestamp=timestamp))
 
+            process_pending(monitor)
             monitor.tick()
 
         # Display most recently received at unpause.
@@ -867,6 +829,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
                 timestamp=timestamp))
 
+            process_pending(monitor)
             monitor.tick()
 
         monitor.run()
@@ -876,7 +839,7 @@ class CanToolsMonitorTest(unittest.TestCase):
             stdscr.addstr,
             [
                 # Received when playing.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
+                call(0, 0, 'Received: 1, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(1,
                      0,
                      '   TIMESTAMP  MESSAGE                                           ',
@@ -888,85 +851,25 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29
                      ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan'),
 
-                call(0, 0, 'Received: 2, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
+                call(0, 0, 'Received: 2, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(2, 0, '       1.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
-                call(29
-                     ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
-                     'cyan'),
 
-                call(0, 0, 'Received: 3, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
+                call(0, 0, 'Received: 3, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(2, 0, '       2.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
-                call(29
-                     ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
-                     'cyan'),
 
                 # Received when paused, displayed at unpause.
-                call(0, 0, 'Received: 4, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
+                call(0, 0, 'Received: 4, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(2, 0, '       3.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
-                call(29
-                     ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
-                     'cyan'),
 
                 # Received when playing.
-                call(0, 0, 'Received: 5, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
+                call(0, 0, 'Received: 5, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(2, 0, '       5.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
-                call(29
-                     ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
-                     'cyan'),
 
-                call(0, 0, 'Received: 6, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
+                call(0, 0, 'Received: 6, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(2, 0, '       6.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
-                call(29,
-                     0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
-                     'cyan')
             ])
 
     @patch('can.Notifier')
@@ -999,6 +902,7 @@ class CanToolsMonitorTest(unittest.TestCase):
             data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
             timestamp=1))
 
+        process_pending(monitor)
         monitor.tick()
         monitor.run()
 
@@ -1007,34 +911,34 @@ class CanToolsMonitorTest(unittest.TestCase):
             stdscr.addstr,
             [
                 # 25 x 35.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
+                call(0, 0, 'Received: 1, Discarded: 0, Dropped:'),
                 call(1, 0, '   TIMESTAMP  MESSAGE              ', 'green'),
                 call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
+                call(3, 0, "                  Enable: 'Enabled'"),
+                call(4, 0, '                  AverageRadius: 3.'),
+                call(5, 0, '                  Temperature: 250.'),
                 call(6, 0, '              )'),
-                call(24, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset', 'cyan'),
+                call(24, 0, 'q: Quit, f: Filter, p: Play/Pause, ', 'cyan'),
 
                 # 25 x 35.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
+                call(0, 0, 'Received: 1, Discarded: 0, Dropped:'),
                 call(1, 0, '   TIMESTAMP  MESSAGE              ', 'green'),
                 call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
+                call(3, 0, "                  Enable: 'Enabled'"),
+                call(4, 0, '                  AverageRadius: 3.'),
+                call(5, 0, '                  Temperature: 250.'),
                 call(6, 0, '              )'),
-                call(24, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset', 'cyan'),
+                call(24, 0, 'q: Quit, f: Filter, p: Play/Pause, ', 'cyan'),
 
                 # 20 x 30.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
+                call(0, 0, 'Received: 1, Discarded: 0, Dro'),
                 call(1, 0, '   TIMESTAMP  MESSAGE         ', 'green'),
                 call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
+                call(3, 0, "                  Enable: 'Ena"),
+                call(4, 0, '                  AverageRadiu'),
+                call(5, 0, '                  Temperature:'),
                 call(6, 0, '              )'),
-                call(19, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset', 'cyan')
+                call(19, 0, 'q: Quit, f: Filter, p: Play/Pa', 'cyan')
             ])
 
     @patch('can.Notifier')
@@ -1138,6 +1042,7 @@ class CanToolsMonitorTest(unittest.TestCase):
             arbitration_id=1025,
             data=b'\x12\x00\x98\x98\x0b\x00',
             timestamp=18))
+        process_pending(monitor)
         monitor.tick()
         monitor.run()
 
@@ -1149,7 +1054,7 @@ class CanToolsMonitorTest(unittest.TestCase):
             stdscr.addstr,
             [
                 # Start on page 1
-                call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
+                call(0, 0, 'Received: 19, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
                 call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(2, 0, '       0.000  BATTERY_VT('),
                 call(3, 0, '                  BATTERY_VT_INDEX: 0,'),
@@ -1178,11 +1083,9 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(26, 0, '              )'),
                 call(27, 0, '      13.000  BATTERY_VT('),
                 call(28, 0, '                  BATTERY_VT_INDEX: 13,'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # Move to page 2
-                call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(2, 0, '                  MODULE_VOLTAGE_13: 39064,'),
                 call(3, 0, '                  MODULE_TEMP_13: 11'),
                 call(4, 0, '              )'),
@@ -1210,11 +1113,8 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(26, 0, '                  BATTERY_VT_INDEX: 18,'),
                 call(27, 0, '                  MODULE_VOLTAGE_18: 39064,'),
                 call(28, 0, '                  MODULE_TEMP_18: 11'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
 
                 # Move to page 3
-                call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(2, 0, '              )'),
                 call(3, 0, '       2.000  BATTERY_VT('),
                 call(4, 0, '                  BATTERY_VT_INDEX: 2,'),
@@ -1242,11 +1142,8 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(26, 0, '                  MODULE_TEMP_06: 11'),
                 call(27, 0, '              )'),
                 call(28, 0, '       7.000  BATTERY_VT('),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
 
                 # Move to page 4
-                call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(2, 0, '                  BATTERY_VT_INDEX: 7,'),
                 call(3, 0, '                  MODULE_VOLTAGE_07: 39064,'),
                 call(4, 0, '                  MODULE_TEMP_07: 11'),
@@ -1261,11 +1158,8 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(13, 0, '                  MODULE_VOLTAGE_09: 39064,'),
                 call(14, 0, '                  MODULE_TEMP_09: 11'),
                 call(15, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
 
                 # Move back to page 3
-                call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(2, 0, '              )'),
                 call(3, 0, '       2.000  BATTERY_VT('),
                 call(4, 0, '                  BATTERY_VT_INDEX: 2,'),
@@ -1293,9 +1187,320 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(26, 0, '                  MODULE_TEMP_06: 11'),
                 call(27, 0, '              )'),
                 call(28, 0, '       7.000  BATTERY_VT('),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
             ])
 
+    @patch('time.monotonic')
+    @patch('can.Notifier')
+    @patch('can.Bus')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_max_fps(self,
+                     _use_default_colors,
+                     _curs_set,
+                     _init_pair,
+                     is_term_resized,
+                     color_pair,
+                     _bus,
+                     _notifier,
+                     monotonic):
+        # Prepare mocks.
+        stdscr = StdScr(user_input=[' ', ' ', ' ', 'q'])
+        args = Args('tests/files/dbc/motohawk.dbc')
+        args.max_fps = 10
+        color_pair.side_effect = 2 * ['green', 'cyan']
+        is_term_resized.return_value = False
+        monotonic.side_effect = [0.0, 0.05, 0.1]
+
+        # Run monitor.
+        monitor = Monitor(stdscr, args)
+
+        for timestamp in range(3):
+            monitor.on_message_received(can.Message(
+                arbitration_id=496,
+                data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
+                timestamp=timestamp))
+            process_pending(monitor)
+            monitor.tick()
+
+        monitor.run()
+
+        # Check mocks.
+        self.assert_called(
+            stdscr.addstr,
+            [
+                call(0, 0, 'Received: 1, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
+                call(1,
+                     0,
+                     '   TIMESTAMP  MESSAGE                                           ',
+                     'green'),
+                call(2, 0, '       0.000  ExampleMessage('),
+                call(3, 0, "                  Enable: 'Enabled' -,"),
+                call(4, 0, '                  AverageRadius: 3.2 m,'),
+                call(5, 0, '                  Temperature: 250.55 degK'),
+                call(6, 0, '              )'),
+                call(29,
+                     0,
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
+                     'cyan'),
+
+                # Second frame not drawn as it is too soon after the
+                # first redraw.
+                call(0, 0, 'Received: 3, Discarded: 0, Dropped: 0, Queue: 0, Errors: 0'),
+                call(2, 0, '       2.000  ExampleMessage(')
+            ])
+
+    @patch('can.Notifier')
+    @patch('can.Bus')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_statistics(self,
+                        _use_default_colors,
+                        _curs_set,
+                        _init_pair,
+                        is_term_resized,
+                        color_pair,
+                        _bus,
+                        _notifier):
+        # Prepare mocks.
+        stdscr = StdScr(user_input=['s', 's', 'q'], resolution=[(30, 80)])
+        args = Args('tests/files/dbc/motohawk.dbc')
+        args.bit_rate = '250000'
+        color_pair.side_effect = 3 * ['green', 'cyan']
+        is_term_resized.return_value = False
+
+        # Run monitor.
+        monitor = Monitor(stdscr, args)
+
+        for timestamp in [0.0, 0.1, 0.25]:
+            monitor.on_message_received(can.Message(
+                arbitration_id=496,
+                data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
+                timestamp=timestamp))
+
+        process_pending(monitor)
+        monitor.run()
+
+        # Check mocks.
+        self.assert_called(
+            stdscr.addstr,
+            [
+                call(0, 0, 'Received: 3, Discarded: 0, Dropped: 2, Queue: 0, Errors: 0'),
+                call(1,
+                     0,
+                     '   TIMESTAMP  MESSAGE                                                           ',
+                     'green'),
+                call(2, 0, '       0.250  ExampleMessage('),
+                call(3, 0, "                  Enable: 'Enabled' -,"),
+                call(4, 0, '                  AverageRadius: 3.2 m,'),
+                call(5, 0, '                  Temperature: 250.55 degK'),
+                call(6, 0, '              )'),
+                call(29,
+                     0,
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics                      ',
+                     'cyan'),
+
+                # 's' pressed. Periods are 100 and 150 ms.
+                call(0, 0, 'Received: 3, Discarded: 0, Dropped: 2, Queue: 0, Errors: 0, Bus load: 0.4 %'),
+                call(1,
+                     0,
+                     '   COUNT   PERIOD   JITTER      MIN      MAX    CYCLE   LOAD  MESSAGE           ',
+                     'green'),
+                call(2, 0, '       3    125.0     25.0    100.0    150.0        -    0.4  ExampleMessage'),
+
+                # 's' pressed again.
+                call(0, 0, 'Received: 3, Discarded: 0, Dropped: 2, Queue: 0, Errors: 0'),
+                call(1,
+                     0,
+                     '   TIMESTAMP  MESSAGE                                                           ',
+                     'green'),
+                call(2, 0, '       0.250  ExampleMessage('),
+                call(3, 0, "                  Enable: 'Enabled' -,"),
+                call(4, 0, '                  AverageRadius: 3.2 m,'),
+                call(5, 0, '                  Temperature: 250.55 degK'),
+                call(6, 0, '              )')
+            ])
+
+    @patch('can.Notifier')
+    @patch('can.Bus')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_queue_full(self,
+                        _use_default_colors,
+                        _curs_set,
+                        _init_pair,
+                        is_term_resized,
+                        color_pair,
+                        _bus,
+                        _notifier):
+        # Prepare mocks.
+        stdscr = StdScr()
+        args = Args('tests/files/dbc/motohawk.dbc')
+        args.queue_size = 1
+        color_pair.side_effect = ['green', 'cyan']
+        is_term_resized.return_value = False
+
+        # Run monitor. Only the last frame fits in the queue.
+        monitor = Monitor(stdscr, args)
+
+        for timestamp in range(3):
+            monitor.on_message_received(can.Message(
+                arbitration_id=496,
+                data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
+                timestamp=timestamp))
+
+        process_pending(monitor)
+        monitor.run()
+
+        # Check mocks.
+        self.assert_called(
+            stdscr.addstr,
+            [
+                call(0, 0, 'Received: 3, Discarded: 2, Dropped: 0, Queue: 0, Errors: 0'),
+                call(1,
+                     0,
+                     '   TIMESTAMP  MESSAGE                                           ',
+                     'green'),
+                call(2, 0, '       0.000  ExampleMessage('),
+                call(3, 0, "                  Enable: 'Enabled' -,"),
+                call(4, 0, '                  AverageRadius: 3.2 m,'),
+                call(5, 0, '                  Temperature: 250.55 degK'),
+                call(6, 0, '              )'),
+                call(29,
+                     0,
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
+                     'cyan')
+            ])
+
+
+class CanToolsMonitorWorkerTest(unittest.TestCase):
+
+    def test_statistics(self):
+        statistics = Statistics(cycle_time=100)
+        self.assertIsNone(statistics.period)
+        self.assertIsNone(statistics.jitter)
+        self.assertIsNone(statistics.load(500000))
+
+        for timestamp in [1.0, 1.1, 1.2, 1.4]:
+            statistics.update(timestamp, 100)
+
+        self.assertEqual(statistics.count, 4)
+        self.assertAlmostEqual(statistics.period, 0.4 / 3)
+        self.assertAlmostEqual(statistics.jitter, math.sqrt(2 / 900))
+        self.assertAlmostEqual(statistics.minimum_period, 0.1)
+        self.assertAlmostEqual(statistics.maximum_period, 0.2)
+        self.assertEqual(statistics.cycle_time, 100)
+
+        # 300 bits in 0.4 seconds.
+        self.assertAlmostEqual(statistics.load(500000), 0.15)
+        self.assertIsNone(statistics.load(None))
+
+    def test_worker_thread(self):
+        dbase = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        ingest_queue = RingBuffer(100)
+        worker = Worker(dbase, ingest_queue)
+        worker.start()
+
+        for timestamp in range(3):
+            ingest_queue.put(can.Message(
+                arbitration_id=496,
+                data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
+                timestamp=timestamp))
+
+        ingest_queue.put(can.Message(
+            arbitration_id=497,
+            data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
+            timestamp=3))
+
+        for _ in range(100):
+            if worker.received == 4:
+                break
+
+            time.sleep(0.01)
+
+        # Only the most recently received frame is kept.
+        latest = worker.take()
+        self.assertEqual(list(latest), ['ExampleMessage'])
+        self.assertEqual(latest['ExampleMessage'][1:],
+                         (2, b'\xc0\x06\xe0\x00\x00\x00\x00\x00'))
+        self.assertEqual(worker.received, 4)
+        self.assertEqual(worker.discarded, 1)
+        self.assertEqual(worker.dropped, 2)
+        self.assertEqual(worker.take(), {})
+
+    def assert_ring_buffer(self, ring_buffer, expected):
+        actual = []
+
+        try:
+            while True:
+                message = ring_buffer.get_nowait()
+                actual.append((message.arbitration_id, message.timestamp))
+        except queue.Empty:
+            pass
+
+        self.assertEqual(actual, expected)
+
+    def put_frames(self, ring_buffer):
+        for timestamp, frame_id in enumerate([1, 2, 1, 3, 1]):
+            ring_buffer.put(can.Message(arbitration_id=frame_id,
+                                        timestamp=timestamp))
+
+    def test_ring_buffer_drop_oldest(self):
+        ring_buffer = RingBuffer(3, 'oldest')
+        self.put_frames(ring_buffer)
+        self.assertEqual(ring_buffer.qsize(), 3)
+        self.assertEqual(ring_buffer.dropped, 2)
+        self.assert_ring_buffer(ring_buffer, [(1, 2), (3, 3), (1, 4)])
+
+    def test_ring_buffer_drop_newest(self):
+        ring_buffer = RingBuffer(3, 'newest')
+        self.put_frames(ring_buffer)
+        self.assertEqual(ring_buffer.dropped, 2)
+        self.assert_ring_buffer(ring_buffer, [(1, 0), (2, 1), (1, 2)])
+
+    def test_ring_buffer_keep_latest(self):
+        ring_buffer = RingBuffer(2, 'latest')
+        self.put_frames(ring_buffer)
+
+        # Frame id 1 replaced twice and frame id 3 dropped.
+        self.assertEqual(ring_buffer.dropped, 3)
+        self.assert_ring_buffer(ring_buffer, [(1, 4), (2, 1)])
+
+        # Frame ids are no longer queued.
+        self.put_frames(ring_buffer)
+        self.assert_ring_buffer(ring_buffer, [(1, 4), (2, 1)])
+
+    def test_ring_buffer_clear(self):
+        ring_buffer = RingBuffer(2)
+        self.put_frames(ring_buffer)
+        ring_buffer.clear()
+        self.assertEqual(ring_buffer.qsize(), 0)
+        self.assertEqual(ring_buffer.dropped, 0)
+        self.assert_ring_buffer(ring_buffer, [])
+
+    def test_ring_buffer_bad_arguments(self):
+        with self.assertRaises(ValueError) as cm:
+            RingBuffer(0)
+
+        self.assertEqual(str(cm.exception),
+                         'expected queue size greater than 0, but got 0')
+
+        with self.assertRaises(ValueError) as cm:
+            RingBuffer(1, 'foo')
+
+        self.assertEqual(
+            str(cm.exception),
+            "expected drop policy 'oldest', 'newest' or 'latest', but got "
+            "'foo'")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,14 @@
 import time
 import os
+import asyncio
 import unittest
 import can
 
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
 try:
     from queue import Queue
     from queue import Empty
@@ -21,6 +27,7 @@ class CanBus(object):
         self._periodic_queue = Queue()
         self._input_queue = Queue()
         self._periodic_stop_queue = Queue()
+        self._periodic_modify_queue = Queue()
 
     def stop(self):
         self._periodic_stop_queue.put(None)
@@ -28,6 +35,12 @@ class CanBus(object):
     def wait_for_periodic_stop(self):
         return self._periodic_stop_queue.get()
 
+    def modify_data(self, message):
+        self._periodic_modify_queue.put(message)
+
+    def wait_for_modify_data(self):
+        return self._periodic_modify_queue.get()
+
     def send(self, message):
         self._queue.put(message)
 
@@ -95,6 +108,31 @@ class CanToolsTesterTest(unittest.TestCase):
         tester.stop()
         can_bus.wait_for_periodic_stop()
 
+    def test_periodic_message_modify_signal_after_start(self):
+        """Modified signals are patched into the same periodically sent
+        CAN message.
+
+        """
+
+        tester, can_bus = setup_tester('Node2')
+        tester.start()
+
+        message, _ = can_bus.wait_for_send_periodic()
+        self.assertEqual(message.data, b'\x00\x00')
+
+        tester.messages['PeriodicMessage1']['Signal1'] = 5
+        modified_message = can_bus.wait_for_modify_data()
+        self.assertIs(modified_message, message)
+        self.assertEqual(message.data, b'\x05\x00')
+
+        tester.messages['PeriodicMessage1'].update({'Signal2': 7})
+        modified_message = can_bus.wait_for_modify_data()
+        self.assertIs(modified_message, message)
+        self.assertEqual(message.data, b'\x05\x07')
+
+        tester.stop()
+        can_bus.wait_for_periodic_stop()
+
     def test_set_and_get_signals(self):
         """Set and get signals.
 
@@ -203,6 +241,67 @@ class CanToolsTesterTest(unittest.TestCase):
 
         tester.stop()
 
+    def test_expect_discard_older_messages_only(self):
+        """Only messages received before the expected message are
+        discarded.
+
+        """
+
+        tester, can_bus = setup_tester('Node1')
+        tester.start()
+
+        can_bus.input_message(can.Message(arbitration_id=0x102, data=b'\x01\x00\x00'))
+        can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x02\x00'))
+        can_bus.input_message(can.Message(arbitration_id=0x102, data=b'\x03\x00\x00'))
+        can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x04\x00'))
+        can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x05\x00'))
+        time.sleep(0.1)
+
+        message = tester.expect('Message1', {'Signal1': 4})
+        self.assertEqual(message, {'Signal1': 4, 'Signal2': 0})
+        message = tester.expect('Message1', timeout=0.0)
+        self.assertEqual(message, {'Signal1': 5, 'Signal2': 0})
+        message = tester.expect('Message2', timeout=0.0)
+        self.assertIsNone(message)
+
+        can_bus.input_message(can.Message(arbitration_id=0x102, data=b'\x06\x00\x00'))
+        can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x07\x00'))
+        time.sleep(0.1)
+
+        message = tester.expect('Message1', timeout=0.0)
+        self.assertEqual(message, {'Signal1': 7, 'Signal2': 0})
+        message = tester.expect('Message2', timeout=0.0)
+        self.assertIsNone(message)
+
+        tester.stop()
+
+    def test_expect_with_scaling(self):
+        """Test the expect method with scaling. Frames not matching the
+        filter should not be decoded.
+
+        """
+
+        tester, can_bus = setup_tester('Node1', scaling=True)
+        message = tester.messages['Message1']
+        message.decode = Mock(wraps=message.decode)
+        tester.start()
+
+        can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x0a\x00'))
+        can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x0b\x01'))
+        can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x0c\x02'))
+        can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x0c\x03'))
+        time.sleep(0.1)
+
+        decoded = tester.expect('Message1', {'Signal1': 2})
+        self.assertEqual(decoded, {'Signal1': 2, 'Signal2': 2})
+        self.assertEqual(message.decode.call_count, 1)
+
+        decoded = tester.expect('Message1', {'Signal1': 2.5}, timeout=0.0)
+        self.assertIsNone(decoded)
+        self.assertEqual(message.decode.call_count, 2)
+
+        tester.stop()
+
     def test_flush_input(self):
         """Test the flush_input method.
 
@@ -352,6 +451,250 @@ class CanToolsTesterTest(unittest.TestCase):
 
         tester.stop()
 
+    def test_schedule(self):
+        """Send time series of signal values of two messages.
+
+        """
+
+        tester, can_bus = setup_tester('Node1')
+        tester.messages['Message2']['Signal2'] = 1
+        schedule = tester.schedule()
+        schedule.add('Message1', [0.0, 0.01, 0.02], {'Signal1': [1, 2, 3]})
+        schedule.add('Message2', (0.005, 0.015), {'Signal3': range(4, 6)})
+        statistics = schedule.run()
+
+        self.assertEqual(statistics.count, 5)
+        self.assertGreaterEqual(statistics.duration, 0.02)
+        self.assertGreater(statistics.rate, 0)
+        self.assertGreaterEqual(statistics.jitter, 0)
+        self.assertGreaterEqual(statistics.maximum_lateness, 0)
+
+        expected = [
+            (0x101, b'\x01\x00'),
+            (0x102, b'\x00\x01\x04'),
+            (0x101, b'\x02\x00'),
+            (0x102, b'\x00\x01\x05'),
+            (0x101, b'\x03\x00')
+        ]
+
+        for arbitration_id, data in expected:
+            message = can_bus.wait_for_send()
+            self.assertEqual(message.arbitration_id, arbitration_id)
+            self.assertEqual(message.data, data)
+
+        # The current signal values are not modified.
+        self.assertEqual(tester.messages['Message1'],
+                         {'Signal1': 0, 'Signal2': 0})
+
+        # An empty schedule.
+        statistics = tester.schedule().run()
+        self.assertEqual(statistics.count, 0)
+
+    def test_schedule_csv(self):
+        """Send time series of signal values read from a CSV file.
+
+        """
+
+        tester, can_bus = setup_tester('Node1')
+        schedule = tester.schedule()
+        schedule.add_csv('Message2', 'tests/files/csv/sweep.csv')
+
+        self.assertEqual([(timestamp, bytes(message.data))
+                          for timestamp, message in schedule.frames],
+                         [
+                             (0.0, b'\x01\x00\x0a'),
+                             (0.01, b'\x02\x00\x0b'),
+                             (0.02, b'\x03\x00\x0c')
+                         ])
+
+        with self.assertRaises(cantools.tester.Error) as cm:
+            schedule.add_csv('Message2',
+                             'tests/files/csv/sweep.csv',
+                             time_column='Time')
+
+        self.assertEqual(
+            str(cm.exception),
+            "expected time column 'Time' in tests/files/csv/sweep.csv, but got "
+            "['time', 'Signal1', 'Signal3']")
+
+    def test_schedule_bad_values(self):
+        """Schedule errors.
+
+        """
+
+        tester, _ = setup_tester('Node1')
+        schedule = tester.schedule()
+
+        with self.assertRaises(cantools.tester.Error) as cm:
+            schedule.add('Message1', [0.0, 0.1], {'Signal1': [1]})
+
+        self.assertEqual(str(cm.exception),
+                         "expected 2 values for signal 'Signal1', but got 1")
+
+        with self.assertRaises(cantools.tester.Error) as cm:
+            schedule.add('Message1', [0.0], {'Signal9': [1]})
+
+        self.assertEqual(str(cm.exception), "invalid signal name 'Signal9'")
+
+        with self.assertRaises(cantools.tester.Error) as cm:
+            schedule.add('MessageMissing', [0.0], {})
+
+        self.assertEqual(str(cm.exception),
+                         "invalid message name 'MessageMissing'")
+
+
+def setup_async_tester(dut_name, loop):
+    database = cantools.db.load_file('tests/files/kcd/tester.kcd')
+    can_bus = CanBus()
+    tester = cantools.tester.AsyncTester(dut_name,
+                                         database,
+                                         can_bus,
+                                         'Bus1',
+                                         decode_choices=False,
+                                         scaling=False,
+                                         loop=loop)
+
+    return tester, can_bus
+
+
+class CanToolsAsyncTesterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_running_loop(self):
+        """The tester uses the running event loop if no loop is given,
+        and can not be created outside of it.
+
+        """
+
+        with self.assertRaises(RuntimeError):
+            setup_async_tester('Node1', None)
+
+        async def main():
+            tester, _ = setup_async_tester('Node1', None)
+            self.assertIs(tester._loop, self.loop)
+
+        self.loop.run_until_complete(main())
+
+    def test_running_loop_python_3_6(self):
+        """Same as test_running_loop, but without
+        asyncio.get_running_loop(), which was added in Python 3.7.
+
+        """
+
+        get_running_loop = getattr(asyncio, 'get_running_loop', None)
+
+        if get_running_loop is not None:
+            del asyncio.get_running_loop
+
+        try:
+            self.test_running_loop()
+        finally:
+            if get_running_loop is not None:
+                asyncio.get_running_loop = get_running_loop
+
+    def test_expect(self):
+        """Test the expect method.
+
+        """
+
+        tester, can_bus = setup_async_tester('Node1', self.loop)
+        tester.start()
+
+        async def main():
+            can_bus.input_message(can.Message(arbitration_id=0x102, data=b'\x01\x00\x00'))
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x00\x00'))
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x02\x03'))
+
+            message = await tester.expect('Message1', {'Signal1': 2})
+            self.assertEqual(message, {'Signal1': 2, 'Signal2': 3})
+            message = await tester.expect('Message2', timeout=0.0)
+            self.assertIsNone(message)
+            message = await tester.expect('Message1', timeout=0.1)
+            self.assertIsNone(message)
+
+            # Timed out waits are forgotten.
+            self.assertEqual(
+                tester.messages['Message1']._input_waiters, [])
+
+        self.loop.run_until_complete(main())
+        tester.stop()
+
+    def test_expect_cancel(self):
+        """No message is lost when an expect is cancelled.
+
+        """
+
+        tester, can_bus = setup_async_tester('Node1', self.loop)
+        tester.start()
+
+        async def main():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(tester.expect('Message1'), 0.1)
+
+            # Cancelled waits are forgotten.
+            self.assertEqual(
+                tester.messages['Message1']._input_waiters, [])
+
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x04\x00'))
+            message = await tester.expect('Message1', timeout=1.0)
+            self.assertEqual(message, {'Signal1': 4, 'Signal2': 0})
+
+        self.loop.run_until_complete(main())
+        tester.stop()
+
+    def test_iterate(self):
+        """Asynchronously iterate over received messages.
+
+        """
+
+        tester, can_bus = setup_async_tester('Node1', self.loop)
+        tester.start()
+
+        async def main():
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x00\x01'))
+            can_bus.input_message(can.Message(arbitration_id=0x102, data=b'\x01\x00\x00'))
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x01\x00'))
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x02\x01'))
+            messages = []
+
+            async for message in tester.messages('Message1', {'Signal2': 1}):
+                messages.append(message)
+
+                if len(messages) == 2:
+                    break
+
+            self.assertEqual(messages,
+                             [
+                                 {'Signal1': 0, 'Signal2': 1},
+                                 {'Signal1': 2, 'Signal2': 1}
+                             ])
+
+            # Other messages are left untouched.
+            message = await tester.expect('Message2', timeout=0.0)
+            self.assertEqual(message, {'Signal1': 1, 'Signal2': 0, 'Signal3': 0})
+
+        self.loop.run_until_complete(main())
+        tester.stop()
+
+    def test_send(self):
+        """Test the send method.
+
+        """
+
+        tester, can_bus = setup_async_tester('Node1', self.loop)
+        tester.start()
+        tester.messages['Message1']['Signal2'] = 3
+        self.loop.run_until_complete(tester.send('Message1', {'Signal1': 1}))
+        message = can_bus.wait_for_send()
+        self.assertEqual(message.arbitration_id, 0x101)
+        self.assertEqual(message.data, b'\x01\x03')
+        tester.stop()
+
 
 if __name__ == '__main__':
     unittest.main()